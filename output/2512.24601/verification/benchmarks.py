@@ -0,0 +1,385 @@
+"""
+Benchmark Suite for RLM Verification
+Micro and macro benchmarks with JSON baselines and a regression gate
+
+Each benchmark reports:
+- wall time: best and median per call over `repeats` timed samples
+  (time.perf_counter); fast benchmarks are looped, as timeit does, until
+  one sample takes at least MIN_SAMPLE_S
+- throughput: operations per second from the best run
+- allocations: bytes allocated and still alive after one run, and the
+  net change in allocated blocks (tracemalloc, sys.getallocatedblocks)
+- peak memory: tracemalloc peak during one run, in KB
+
+Timed runs and the traced run are separate, so tracemalloc overhead never
+shows up in wall times. Everything is stdlib and offline.
+
+compare_to_baseline() flags a benchmark whose best wall time or traced
+peak grows past the baseline by more than `threshold` (0.25 = 25%).
+Baselines are machine-specific; regenerate them with --save-baseline
+after an intended change or on new hardware.
+
+Usage:
+    python benchmarks.py [--only NAME ...] [--threshold 0.25] [--save-baseline]
+"""
+
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+VERIFICATION_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE_PATH = VERIFICATION_DIR / "benchmark_baselines.json"
+DEFAULT_THRESHOLD = 0.25
+
+# Shortest timed sample; faster benchmarks are looped until a sample takes this long
+MIN_SAMPLE_S = 0.02
+
+# Peaks below this are dominated by interpreter noise and are not gated
+MIN_GATED_PEAK_KB = 256
+
+
+class Benchmark(NamedTuple):
+    """setup() builds the state once; fn(state) is the measured work; teardown(state) cleans up."""
+    name: str
+    kind: str  # "micro" or "macro"
+    setup: Callable[[], Any]
+    fn: Callable[[Any], Any]
+    ops: int = 1
+    repeats: int = 5
+    teardown: Optional[Callable[[Any], None]] = None
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def _percentage_calculation_benchmark() -> Benchmark:
+    from main import verify_percentage_calculation
+
+    cases = [(44.0, 56.5, "+28.4%"), (0.04, 58.0, "+1350%"), (36.0, 48.0, "+33.3%"), (24.67, 62.0, "+151%")]
+    calls = 20000
+
+    def run(_):
+        for i in range(calls):
+            baseline, rlm, claimed = cases[i % len(cases)]
+            verify_percentage_calculation(baseline, rlm, claimed)
+
+    return Benchmark("verify_percentage_calculation", "micro", lambda: None, run, ops=calls)
+
+
+def _process_long_input_benchmark(multiplier: int, context_limit: int = 1000) -> Benchmark:
+    from main import ToyRLM
+
+    def setup():
+        return "x" * (context_limit * multiplier)
+
+    def run(long_input):
+        ToyRLM(context_limit=context_limit).process_long_input(long_input)
+
+    return Benchmark(f"process_long_input_{multiplier}x", "macro", setup, run, ops=multiplier)
+
+
+@functools.lru_cache(maxsize=None)
+def _verification_results() -> Dict[str, Any]:
+    """
+    A fully populated results payload: this paper's math, ablation and
+    benchmark sections, run once without the section cache.
+    """
+    from corpus_runner import verify_paper
+    return verify_paper(VERIFICATION_DIR.parent / "deconstruction.json", use_cache=False)
+
+
+def _generate_summary_benchmark() -> Benchmark:
+    from main import generate_summary
+
+    def run(results):
+        for _ in range(1000):
+            generate_summary(results)
+
+    return Benchmark("generate_summary", "micro", _verification_results, run, ops=1000)
+
+
+def _serialization_benchmarks() -> List[Benchmark]:
+    from results_stream import ResultsStreamWriter, rebuild_results, write_json_atomic
+
+    def setup():
+        return _verification_results(), Path(tempfile.mkdtemp(prefix="rlm-bench-"))
+
+    def dump_json(state):
+        results, tmp_dir = state
+        write_json_atomic(results, tmp_dir / "results.json")
+
+    def stream_and_rebuild(state):
+        results, tmp_dir = state
+        writer = ResultsStreamWriter(tmp_dir / "results.ndjson")
+        writer.write_header(results["paper_id"], "benchmarks.py")
+        for name, section in results["verification_sections"].items():
+            writer.write_section(name, section)
+        writer.write_summary(results.get("summary", {}))
+        writer.close()
+        rebuild_results(tmp_dir / "results.ndjson")
+
+    return [
+        Benchmark("results_json_atomic_write", "micro", setup, dump_json, repeats=10),
+        Benchmark("results_ndjson_stream_and_rebuild", "micro", setup, stream_and_rebuild, repeats=10),
+    ]
+
+
+def _execute_code_benchmarks() -> List[Benchmark]:
+    """ToyRLM.execute_code in-process vs on a warm REPL pool, 200 snippets per call."""
+    from main import ToyRLM
+    from repl_pool import BENCHMARK_SNIPPET, ReplWorkerPool
+
+    snippets = [BENCHMARK_SNIPPET] * 200
+
+    def pooled_setup():
+        pool = ReplWorkerPool()
+        pool.broadcast("pass")
+        return ToyRLM(trace_limit=0, trace_runs=1, repl_pool=pool)
+
+    def run(rlm):
+        rlm.execute_code_batch(snippets)
+
+    return [
+        Benchmark("execute_code_in_process", "macro", lambda: ToyRLM(trace_limit=0, trace_runs=1), run,
+                  ops=len(snippets)),
+        Benchmark("execute_code_repl_pool", "macro", pooled_setup, run, ops=len(snippets),
+                  teardown=lambda rlm: rlm.repl_pool.close()),
+    ]
+
+
+def _plot_benchmarks() -> List[Benchmark]:
+    from visualizations import PLOTS
+
+    def make(fn, data):
+        if callable(data):
+            data = data()  # loaded once, outside the timed renders
+        def run(tmp_dir):
+            fn(tmp_dir, data=data)
+        return run
+
+    return [
+        Benchmark(f"create_{name}_plot", "macro",
+                  lambda: Path(tempfile.mkdtemp(prefix="rlm-bench-plots-")), make(fn, data), repeats=3)
+        for name, _, fn, data in PLOTS
+    ]
+
+
+def _document_store_benchmark(tokens: int = 1_000_000, queries: int = 50) -> Benchmark:
+    """BM25 top-10 search over an on-disk store of `tokens` tokens, built once in setup."""
+    import shutil
+    from document_store import DocumentStore, make_corpus, read_corpus
+
+    def setup():
+        tmp_dir = Path(tempfile.mkdtemp(prefix="rlm-bench-store-"))
+        chains = make_corpus(tmp_dir / "corpus.txt", tokens=tokens, documents=100)
+        store = DocumentStore.build(tmp_dir / "store", read_corpus(tmp_dir / "corpus.txt"))
+        common = list(store.lexicon)[:queries]
+        query_texts = [f"{chain['start']} founded" for chain in chains] + [f"{word} founded" for word in common]
+        return store, query_texts[:queries], tmp_dir
+
+    def run(state):
+        store, query_texts, _ = state
+        for query in query_texts:
+            store.search(query, k=10)
+
+    def teardown(state):
+        store, _, tmp_dir = state
+        store.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return Benchmark("document_store_bm25_search", "macro", setup, run, ops=queries, teardown=teardown)
+
+
+def all_benchmarks() -> List[Benchmark]:
+    benchmarks = [_percentage_calculation_benchmark()]
+    benchmarks += [_process_long_input_benchmark(m) for m in (1, 10, 100, 1000, 10000)]
+    benchmarks.append(_generate_summary_benchmark())
+    benchmarks += _serialization_benchmarks()
+    benchmarks += _execute_code_benchmarks()
+    benchmarks += _plot_benchmarks()
+    benchmarks.append(_document_store_benchmark())
+    return benchmarks
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def _time_calls(fn: Callable[[Any], Any], state: Any, number: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(number):
+        fn(state)
+    return time.perf_counter() - start
+
+
+def run_benchmark(benchmark: Benchmark) -> Dict[str, Any]:
+    """
+    Time `repeats` samples, then trace one more call for allocations and peak.
+    Anything the benchmarked code prints is discarded.
+    """
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        state = benchmark.setup()
+        benchmark.fn(state)  # warm-up: imports, caches, first-call costs
+
+        # Like timeit: loop fast benchmarks so each sample is long enough to time
+        number = 1
+        while True:
+            elapsed = _time_calls(benchmark.fn, state, number)
+            if elapsed >= MIN_SAMPLE_S or number >= 1 << 20:
+                break
+            number *= 2 if elapsed > MIN_SAMPLE_S / 10 else 10
+
+        times = [_time_calls(benchmark.fn, state, number) / number for _ in range(benchmark.repeats)]
+
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        benchmark.fn(state)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        gc.collect()
+        blocks_delta = sys.getallocatedblocks() - blocks_before
+
+        if benchmark.teardown is not None:
+            benchmark.teardown(state)
+
+    best = min(times)
+    return {
+        "kind": benchmark.kind,
+        "repeats": benchmark.repeats,
+        "calls_per_sample": number,
+        "wall_best_s": float(f"{best:.4g}"),
+        "wall_median_s": float(f"{statistics.median(times):.4g}"),
+        "ops_per_s": round(benchmark.ops / best, 2) if best > 0 else None,
+        "retained_kb": round(retained / 1024, 1),
+        "allocated_blocks_delta": blocks_delta,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_suite(only: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for benchmark in all_benchmarks():
+        if only and not any(pattern in benchmark.name for pattern in only):
+            continue
+        results[benchmark.name] = run_benchmark(benchmark)
+    return results
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                        threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Benchmarks whose best wall time or traced peak grew by more than threshold."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        checks = [("wall_best_s", result["wall_best_s"], base["wall_best_s"])]
+        if base["peak_kb"] >= MIN_GATED_PEAK_KB:
+            checks.append(("peak_kb", result["peak_kb"], base["peak_kb"]))
+
+        for metric, current, reference in checks:
+            if reference > 0 and current > reference * (1 + threshold):
+                regressions.append({
+                    "benchmark": name,
+                    "metric": metric,
+                    "baseline": reference,
+                    "current": current,
+                    "change_pct": round((current / reference - 1) * 100, 1),
+                })
+    return regressions
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(results: Dict[str, Dict[str, Any]], path: Path) -> None:
+    from results_stream import write_json_atomic
+
+    write_json_atomic({
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "results": results,
+    }, path)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the verification module")
+    parser.add_argument("--only", nargs="+", default=None, help="Run benchmarks whose name contains any of these")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline JSON path")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown or peak growth as a fraction (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write these results as the new baseline instead of comparing")
+    parser.add_argument("--output", default=None, help="Also write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.only)
+
+    print(f"{'benchmark':<38} {'best':>10} {'median':>10} {'ops/s':>12} {'peak':>10} {'blocks':>8}")
+    for name, result in results.items():
+        print(f"{name:<38} {_format_seconds(result['wall_best_s']):>10} {_format_seconds(result['wall_median_s']):>10} "
+              f"{result['ops_per_s'] or 0:>12,.0f} {result['peak_kb']:>8.0f}KB {result['allocated_blocks_delta']:>8}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline = load_baseline(baseline_path)
+        merged = dict(baseline["results"]) if baseline else {}
+        merged.update(results)
+        save_baseline(merged, baseline_path)
+        print(f"\nBaseline saved to: {baseline_path}")
+        return 0
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline["results"], args.threshold)
+    print()
+    if not regressions:
+        print(f"✓ No regressions beyond {args.threshold:.0%} of baseline ({baseline['created']})")
+        return 0
+
+    print(f"✗ {len(regressions)} regression(s) beyond {args.threshold:.0%} of baseline ({baseline['created']}):")
+    for regression in regressions:
+        print(f"  {regression['benchmark']}: {regression['metric']} {regression['baseline']} -> "
+              f"{regression['current']} (+{regression['change_pct']}%)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
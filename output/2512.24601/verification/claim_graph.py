@@ -0,0 +1,145 @@
+"""
+Claim Graph for RLM Verification
+Schedules claim checks over the dependency DAG in deconstruction.json
+
+Claims name the claims they rest on in "dependencies": C2 restates E2,
+C12 compares E15 with E16, T11 builds on E1-E8. ClaimGraph turns those
+lists into a DAG (a cycle is an error) and run_claim_checks() walks it:
+- a claim's check starts as soon as all of its dependencies are settled,
+  on a thread pool, so independent claims are checked side by side
+- every check runs once; its result is memoized and handed to each
+  dependent, so a claim shared by several others is not recomputed
+- a claim with a failed dependency is marked "dependency_failed" and its
+  own check never runs
+- claims without a check are "not_checked" and do not count
+
+The verification score is taken over the claims that have a check, so
+its denominator follows the graph rather than a hand-kept constant.
+"""
+
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from claim_loader import all_claims
+
+VERIFIED = "verified"
+UNVERIFIED = "unverified"
+DEPENDENCY_FAILED = "dependency_failed"
+ERROR = "error"
+NOT_CHECKED = "not_checked"
+
+# Statuses that fail a claim and, through it, every claim resting on it
+FAILED_STATUSES = (UNVERIFIED, DEPENDENCY_FAILED, ERROR)
+
+# check(dependency results by claim id) -> {"verified": bool, **evidence}
+ClaimCheck = Callable[[Dict[str, Dict[str, Any]]], Dict[str, Any]]
+
+
+class ClaimGraph:
+    """Claims keyed by id, with dependency and dependent edges."""
+
+    def __init__(self, claims: List[Dict[str, Any]]):
+        self.claims = {claim["id"]: claim for claim in claims}
+        self.dependencies: Dict[str, List[str]] = {}
+        # Dependencies naming claims that are not in the graph, per claim
+        self.missing: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = {claim_id: [] for claim_id in self.claims}
+
+        for claim_id, claim in self.claims.items():
+            dependencies = list(dict.fromkeys(claim.get("dependencies", [])))
+            self.dependencies[claim_id] = [d for d in dependencies if d in self.claims]
+            missing = [d for d in dependencies if d not in self.claims]
+            if missing:
+                self.missing[claim_id] = missing
+            for dependency in self.dependencies[claim_id]:
+                self.dependents[dependency].append(claim_id)
+
+        self.levels = self._levels()
+
+    @classmethod
+    def from_deconstruction(cls, deconstruction: Dict[str, Any]) -> "ClaimGraph":
+        return cls(all_claims(deconstruction))
+
+    def _levels(self) -> Dict[str, int]:
+        """Longest dependency chain below each claim (0 for leaves); raises on a cycle."""
+        remaining = {claim_id: len(deps) for claim_id, deps in self.dependencies.items()}
+        ready = deque(claim_id for claim_id, count in remaining.items() if count == 0)
+        levels = {claim_id: 0 for claim_id in ready}
+
+        while ready:
+            claim_id = ready.popleft()
+            for dependent in self.dependents[claim_id]:
+                levels[dependent] = max(levels.get(dependent, 0), levels[claim_id] + 1)
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        cyclic = sorted(claim_id for claim_id, count in remaining.items() if count)
+        if cyclic:
+            raise ValueError(f"Claim dependencies form a cycle through {', '.join(cyclic)}")
+        return levels
+
+    @property
+    def depth(self) -> int:
+        """Number of claims on the longest dependency chain."""
+        return max(self.levels.values(), default=-1) + 1
+
+
+def _check_outcome(run: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    try:
+        output = run()
+    except Exception as e:
+        return {"status": ERROR, "error": f"{type(e).__name__}: {e}"}
+    evidence = {key: value for key, value in output.items() if key != "verified"}
+    return {"status": VERIFIED if output.get("verified") else UNVERIFIED, "evidence": evidence}
+
+
+def run_claim_checks(graph: ClaimGraph, checks: Dict[str, ClaimCheck],
+                     max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run each claim's check once its dependencies are settled and return one
+    result per claim, in the graph's claim order. Never raises for a failing
+    check: it is reported with status "error". With max_workers=1 checks run
+    on the calling thread, which is cheaper when every check is a lookup.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    results: Dict[str, Dict[str, Any]] = {}
+    remaining = {claim_id: len(deps) for claim_id, deps in graph.dependencies.items()}
+    ready = deque(claim_id for claim_id, count in remaining.items() if count == 0)
+
+    def settle(claim_id: str, result: Dict[str, Any]) -> None:
+        results[claim_id] = result
+        for dependent in graph.dependents[claim_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="claim-check") if max_workers != 1 else None
+    running = {}
+    try:
+        while ready or running:
+            while ready:
+                claim_id = ready.popleft()
+                dependencies = {d: results[d] for d in graph.dependencies[claim_id]}
+                failed = [d for d, result in dependencies.items() if result["status"] in FAILED_STATUSES]
+                check = checks.get(claim_id)
+                if check is None:
+                    settle(claim_id, {"status": NOT_CHECKED, "failed_dependencies": failed})
+                elif failed:
+                    # Settled from the memoized dependency results, without running the check
+                    settle(claim_id, {"status": DEPENDENCY_FAILED, "failed_dependencies": failed})
+                elif pool is None:
+                    settle(claim_id, _check_outcome(lambda: check(dependencies)))
+                else:
+                    running[pool.submit(check, dependencies)] = claim_id
+
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    settle(running.pop(future), _check_outcome(future.result))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {claim_id: results[claim_id] for claim_id in graph.claims}
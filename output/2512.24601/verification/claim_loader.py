@@ -0,0 +1,231 @@
+"""
+Claim Loader for RLM Verification
+Builds verification cases directly from Agent A's deconstruction.json
+
+Instead of hard-coding numbers from one paper, each verification section
+reads its inputs from the structured claims Agent A already extracted:
+- empirical_claims[].value such as "58.00 vs 0.04" or "131K tokens"
+- empirical_claims[].improvement such as "+1350%"
+- comparative_claims[].dependencies linking C-claims to E-claims
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+NUMBER_PATTERN = re.compile(r'[-+]?\d[\d,]*(?:\.\d+)?')
+TOKEN_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*([KMB]?)', re.IGNORECASE)
+DROP_PATTERN = re.compile(r'-(\d+(?:\.\d+)?)\s*pp')
+
+TOKEN_SCALE = {'': 1, 'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+
+def load_deconstruction(path: Path) -> Dict[str, Any]:
+    """Load a deconstruction.json file written by Agent A."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def all_claims(deconstruction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return every claim in the deconstruction, across all claim types."""
+    claims = []
+    for section in ("theoretical_claims", "empirical_claims", "comparative_claims", "novelty_claims"):
+        claims.extend(deconstruction.get(section, []))
+    return claims
+
+
+def parse_value_pair(value: str) -> Optional[Tuple[float, float]]:
+    """
+    Parse an "A vs B" value such as "58.00 vs 0.04" or "56.50% vs 44.00%".
+    Returns (A, B), or None if the value is not a pair.
+    """
+    parts = re.split(r'\s+vs\.?\s+', value.strip())
+    if len(parts) != 2:
+        return None
+
+    numbers = [NUMBER_PATTERN.search(part) for part in parts]
+    if not all(numbers):
+        return None
+
+    first, second = (float(n.group().replace(',', '')) for n in numbers)
+    return first, second
+
+
+def parse_token_count(value: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a token count such as "131K tokens", "6-11M tokens" or "23K-4.2M tokens".
+    Returns (low, high) in tokens; both are equal for a single count.
+    A range like "6-11M" applies the trailing unit to both ends.
+    """
+    matches = TOKEN_PATTERN.findall(value)
+    if not matches:
+        return None
+
+    trailing_unit = matches[-1][1].upper()
+    counts = []
+    for number, unit in matches[:2]:
+        scale = TOKEN_SCALE[(unit or trailing_unit).upper()]
+        counts.append(int(round(float(number) * scale)))
+
+    return min(counts), max(counts)
+
+
+def _comparative_for(deconstruction: Dict[str, Any], claim_id: str, field: str) -> Optional[Dict[str, Any]]:
+    """Find the comparative claim that depends only on claim_id and has the given field."""
+    for claim in deconstruction.get("comparative_claims", []):
+        if claim.get("dependencies") == [claim_id] and field in claim:
+            return claim
+    return None
+
+
+def sample_size(deconstruction: Dict[str, Any], claim: Dict[str, Any]) -> Optional[int]:
+    """
+    Examples behind a claim's scores: the claim's own "sample_size", else
+    the size of its "benchmark" in the deconstruction's "benchmark_sizes".
+    None when the paper does not say.
+    """
+    n = claim.get("sample_size") or deconstruction.get("benchmark_sizes", {}).get(claim.get("benchmark"))
+    return int(n) if n else None
+
+
+def build_percentage_cases(deconstruction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build percentage improvement cases from empirical claims.
+
+    An empirical claim qualifies when it has an "A vs B" value (RLM vs baseline)
+    and an "improvement" field. The case key joins the E-claim with the
+    comparative claim restating it, e.g. "E2_C2".
+    """
+    cases = []
+    for claim in deconstruction.get("empirical_claims", []):
+        if "improvement" not in claim or claim.get("evidence_type") == "ablation_result":
+            continue
+        pair = parse_value_pair(str(claim.get("value", "")))
+        if pair is None:
+            continue
+
+        rlm, baseline = pair
+        comparative = _comparative_for(deconstruction, claim["id"], "improvement")
+        key = f"{claim['id']}_{comparative['id']}" if comparative else claim["id"]
+
+        cases.append({
+            "key": key,
+            "claim_ids": [claim["id"]] + ([comparative["id"]] if comparative else []),
+            "claim": claim.get("text", key),
+            "baseline": baseline,
+            "rlm": rlm,
+            "claimed_improvement": claim["improvement"],
+            "sample_size": sample_size(deconstruction, claim),
+        })
+
+    return cases
+
+
+def build_ablation_cases(deconstruction: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build ablation cases from empirical claims with evidence_type "ablation_result".
+
+    Ablation values are written "ablated vs full" (e.g. "36.00% vs 56.50%").
+    Comparative claims of type "ablation_comparison" that depend on two or more
+    ablation results become comparison cases.
+    """
+    ablations = []
+    for claim in deconstruction.get("empirical_claims", []):
+        if claim.get("evidence_type") != "ablation_result":
+            continue
+        pair = parse_value_pair(str(claim.get("value", "")))
+        if pair is None:
+            continue
+
+        no_subcalls, full_rlm = pair
+        ablations.append({
+            "key": claim["id"],
+            "claim": claim.get("text", claim["id"]),
+            "full_rlm": full_rlm,
+            "no_subcalls": no_subcalls,
+            "sample_size": sample_size(deconstruction, claim),
+        })
+
+    ablation_ids = {case["key"] for case in ablations}
+    comparisons = []
+    for claim in deconstruction.get("comparative_claims", []):
+        if claim.get("evidence_type") != "ablation_comparison":
+            continue
+        dependencies = [d for d in claim.get("dependencies", []) if d in ablation_ids]
+        if len(dependencies) < 2:
+            continue
+
+        text = claim.get("text", "")
+        comparisons.append({
+            "key": f"{claim['id']}_comparison",
+            "claim_id": claim["id"],
+            "claim": text,
+            "dependencies": dependencies,
+            # Quoted drops in text order, e.g. "-40.66pp ... -20.5pp"
+            "claimed_drops_pp": [float(d) for d in DROP_PATTERN.findall(text)],
+        })
+
+    return {"ablations": ablations, "comparisons": comparisons}
+
+
+def build_token_count_cases(deconstruction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build token count cases from empirical claims with metric "token_count"."""
+    cases = []
+    for claim in deconstruction.get("empirical_claims", []):
+        if claim.get("metric") != "token_count":
+            continue
+        value = str(claim.get("value", ""))
+        parsed = parse_token_count(value)
+
+        cases.append({
+            "key": claim["id"],
+            "claim": claim.get("text", claim["id"]),
+            "value": value,
+            "token_range": parsed,
+        })
+
+    return cases
+
+
+def build_cost_ratio_cases(deconstruction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build cost ratio cases (e.g. "3x cheaper") from empirical claims with metric "cost_ratio"."""
+    cases = []
+    for claim in deconstruction.get("empirical_claims", []):
+        if claim.get("metric") != "cost_ratio":
+            continue
+        cases.append({
+            "key": claim["id"],
+            "claim": claim.get("text", claim["id"]),
+            "claimed_ratio": str(claim.get("value", "")),
+        })
+
+    return cases
+
+
+def build_restatement_cases(deconstruction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build restatement cases from comparative claims that rest on a single claim.
+
+    A comparative claim qualifies when it has exactly one dependency and quotes
+    a figure in "improvement" or "cost_ratio" (e.g. C2 "1350%" restating E2,
+    C9 "20.5 percentage points" restating E15's drop).
+    """
+    cases = []
+    for claim in deconstruction.get("comparative_claims", []):
+        dependencies = claim.get("dependencies", [])
+        if len(dependencies) != 1:
+            continue
+        for field in ("improvement", "cost_ratio"):
+            match = NUMBER_PATTERN.search(str(claim.get(field, "")))
+            if match:
+                cases.append({
+                    "key": claim["id"],
+                    "claim": claim.get("text", claim["id"]),
+                    "dependency": dependencies[0],
+                    "field": field,
+                    "quoted": float(match.group().replace(',', '')),
+                })
+                break
+
+    return cases
@@ -0,0 +1,190 @@
+"""
+Zero-Copy Context Buffers for RLM Verification
+Memory-mapped and bytes-backed long inputs for ToyRLM
+
+A long input can be a file mapped read-only into memory (MappedInput) or
+any bytes-like buffer. Slicing either returns memoryview slices, so chunks
+handed to sub-calls share memory with the input instead of copying it.
+Pages of a mapped file that have already been processed can be released,
+which keeps resident memory flat as the input grows.
+
+SharedContext places a long input once where other processes can map it:
+a file on a RAM-backed filesystem (/dev/shm where available). Workers
+attach_context() by the small ContextHandle alone, so handing out a
+sub-call costs the same whatever the input size. A MappedInput is shared
+by its own path, without a copy.
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+# Write test inputs in blocks so the full input never exists in memory
+WRITE_BLOCK_SIZE = 1 << 20
+
+# RAM-backed directory for shared contexts; falls back to the temp dir
+SHARED_CONTEXT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class MappedInput:
+    """
+    Read-only memory-mapped input file.
+
+    Supports len() and slicing like a string; slices are memoryview objects
+    backed by the mapping. Use as a context manager to unmap on exit.
+    """
+
+    def __init__(self, path: Union[str, Path], release_window: int = 16 * WRITE_BLOCK_SIZE):
+        self.path = Path(path)
+        self.release_window = release_window
+        self._released_upto = 0
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            # mmap cannot map empty files
+            self._mmap = None
+            self._view = memoryview(b'')
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, key):
+        return self._view[key]
+
+    def release(self, start: int, end: int) -> None:
+        """
+        Drop resident pages fully inside [start, end) from memory.
+        The data stays on disk and is paged back in if read again.
+        """
+        if self._mmap is None or not hasattr(self._mmap, 'madvise') or not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+
+        page = mmap.PAGESIZE
+        first = -(-start // page) * page
+        last = (end // page) * page
+        if last > first:
+            self._mmap.madvise(mmap.MADV_DONTNEED, first, last - first)
+
+    def advance(self, offset: int) -> None:
+        """
+        Mark everything before offset as processed.
+        Pages are released once release_window bytes have been processed.
+        """
+        if offset - self._released_upto >= self.release_window:
+            self.release(self._released_upto, offset)
+            self._released_upto = offset
+
+    def close(self) -> None:
+        # Exported memoryviews must be released before the mapping can close
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ContextHandle(NamedTuple):
+    """Picklable name of a shared context: everything a worker needs to attach."""
+    path: str
+    size: int
+
+
+class SharedContext:
+    """
+    A long input placed once in shared memory for worker processes.
+
+    str inputs are stored UTF-8 encoded, so workers see bytes and offsets
+    are byte offsets. The owner removes the shared copy on close().
+    """
+
+    def __init__(self, long_input: Any, directory: Union[str, Path] = SHARED_CONTEXT_DIR):
+        if isinstance(long_input, MappedInput):
+            self.path = long_input.path
+            self._owned = False
+        else:
+            data = long_input.encode('utf-8') if isinstance(long_input, str) else memoryview(long_input)
+            fd, path = tempfile.mkstemp(dir=str(directory), prefix="rlm-context-")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+            except BaseException:
+                os.unlink(path)
+                raise
+            self.path = Path(path)
+            self._owned = True
+        self.handle = ContextHandle(str(self.path), os.path.getsize(self.path))
+
+    def close(self) -> None:
+        if self._owned and self.path.exists():
+            self.path.unlink()
+
+    def __enter__(self) -> "SharedContext":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def attach_context(handle: ContextHandle) -> MappedInput:
+    """Map a shared context read-only in this process; slices are zero-copy views."""
+    return MappedInput(handle.path)
+
+
+def as_zero_copy(long_input: Any) -> Any:
+    """
+    Wrap bytes-like inputs in a memoryview so slicing does not copy.
+    Strings and MappedInput objects are returned unchanged.
+    """
+    if isinstance(long_input, (bytes, bytearray, mmap.mmap)):
+        return memoryview(long_input)
+    return long_input
+
+
+def preview_text(prompt: Any, length: int = 50) -> str:
+    """Return the first characters of a str or bytes-like prompt as text."""
+    head = prompt[:length]
+    if isinstance(head, str):
+        return head
+    return bytes(head).decode('utf-8', errors='replace')
+
+
+def write_repeated_input(path: Union[str, Path], unit: bytes, size: int) -> Path:
+    """
+    Write a file of exactly size bytes made of a repeated unit.
+    Written block by block, so memory use does not depend on size.
+    """
+    path = Path(path)
+    # Whole units only, so consecutive blocks do not split a unit
+    block = unit * max(1, WRITE_BLOCK_SIZE // len(unit))
+
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            n = min(remaining, len(block))
+            f.write(block[:n])
+            remaining -= n
+
+    return path
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KB, or None where unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
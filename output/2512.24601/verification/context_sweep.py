@@ -0,0 +1,200 @@
+"""
+Context Scaling Sweep for RLM Verification
+Measured ToyRLM runs from 1x to 10,000x the context window
+
+demonstrate_100x_capability() shows that one 100x input can be
+decomposed. This sweep runs the same decomposition path (TokenChunker,
+memory-mapped input, one "word " per token) at every multiplier and
+measures, per run:
+- wall time end to end (indexing, decomposition and sub-calls), and the
+  part spent in the sub-call loop
+- sub-call count
+- peak RSS of the run's own process, and its growth over the baseline
+- throughput in input tokens per second
+
+Every run happens in a fresh spawned process, so peak RSS is not
+inherited, and under a time limit: a run that outlives it is killed and
+ends the sweep. The decomposition path stops scaling at the first
+multiplier that times out, fails, or whose throughput falls below
+efficiency_floor of the best decomposition throughput seen (runs
+shorter than MIN_COMPARED_WALL_S are too short to compare).
+
+The results are saved as a dataset (context_scaling.json) that the
+context scaling plot in visualizations.py draws from.
+
+Usage:
+    python context_sweep.py [--multipliers 1 10 100 ...] [--time-limit 120] [--output PATH]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+VERIFICATION_DIR = Path(__file__).resolve().parent
+DEFAULT_DATASET_PATH = VERIFICATION_DIR / "context_scaling.json"
+
+DEFAULT_MULTIPLIERS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+DEFAULT_CONTEXT_WINDOW = 1000
+DEFAULT_TIME_LIMIT_S = 120.0
+
+# Throughput below this fraction of the best run counts as no longer scaling
+DEFAULT_EFFICIENCY_FLOOR = 0.5
+
+# ToyRLM's method for inputs it decomposes; only these runs set the best throughput
+DECOMPOSITION_METHOD = "rlm_recursive_decomposition"
+
+# Runs shorter than this are dominated by fixed per-run overhead and timer
+# noise, so their throughput is not compared against the floor
+MIN_COMPARED_WALL_S = 0.05
+
+
+def _sweep_run(multiplier: int, context_window: int) -> Dict[str, Any]:
+    """Worker: decompose one on-disk input of multiplier x context_window tokens."""
+    import tempfile
+    from context_buffer import MappedInput, write_repeated_input, peak_rss_kb
+    from main import ToyRLM, RLM_PROMPT_OVERHEAD_TOKENS
+    from token_chunker import TokenChunker
+
+    unit = b"word "
+    rlm = ToyRLM(context_limit=context_window,
+                 chunker=TokenChunker(prompt_overhead_tokens=RLM_PROMPT_OVERHEAD_TOKENS))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = write_repeated_input(Path(tmp_dir) / "input.txt", unit, len(unit) * context_window * multiplier)
+        rss_before = peak_rss_kb()
+
+        start = time.perf_counter()
+        with MappedInput(input_path) as long_input:
+            result = rlm.process_long_input(long_input)
+            rlm.repl_env.pop('long_input', None)
+        wall_time = time.perf_counter() - start
+
+    input_tokens = result.get("input_tokens", result["input_length"])
+    peak_rss = peak_rss_kb()
+    return {
+        "status": "SUCCESS",
+        "multiplier": multiplier,
+        "input_tokens": input_tokens,
+        "input_bytes": result["input_length"],
+        "method": result["method"],
+        "sub_calls": result["sub_calls_needed"],
+        "wall_time_s": round(wall_time, 6),
+        "sub_call_wall_s": result.get("wall_time_s", 0.0),
+        "tokens_per_s": round(input_tokens / wall_time, 1) if wall_time > 0 else None,
+        "peak_rss_kb": peak_rss,
+        "rss_growth_kb": peak_rss - rss_before if peak_rss is not None and rss_before is not None else None,
+    }
+
+
+def scaling_limit(runs: List[Dict[str, Any]], efficiency_floor: float = DEFAULT_EFFICIENCY_FLOOR) -> Dict[str, Any]:
+    """
+    Where the sweep stopped scaling: the first run that failed, timed out or
+    fell below efficiency_floor of the best throughput, or None if none did.
+    Throughput is compared across decomposition runs of at least
+    MIN_COMPARED_WALL_S only: runs small enough for direct processing take
+    a different code path, and shorter runs measure mostly fixed overhead.
+    """
+    completed = [run for run in runs if run["status"] == "SUCCESS" and run["tokens_per_s"]]
+    compared = [run for run in completed
+                if run["method"] == DECOMPOSITION_METHOD and run["wall_time_s"] >= MIN_COMPARED_WALL_S]
+    best = max((run["tokens_per_s"] for run in compared), default=None)
+
+    for run in runs:
+        if run["status"] != "SUCCESS":
+            reason = "timed out" if run.get("timed_out") else "failed"
+            return {"multiplier": run["multiplier"], "reason": reason, "best_tokens_per_s": best}
+        if best and run in compared and run["tokens_per_s"] < efficiency_floor * best:
+            return {"multiplier": run["multiplier"], "reason": f"throughput below {efficiency_floor:.0%} of best",
+                    "efficiency": round(run["tokens_per_s"] / best, 3), "best_tokens_per_s": best}
+
+    return {"multiplier": None, "reason": "scaled across the whole sweep", "best_tokens_per_s": best,
+            "largest_multiplier": completed[-1]["multiplier"] if completed else None}
+
+
+def run_sweep(multipliers: Sequence[int] = DEFAULT_MULTIPLIERS,
+              context_window: int = DEFAULT_CONTEXT_WINDOW,
+              time_limit_s: Optional[float] = DEFAULT_TIME_LIMIT_S,
+              efficiency_floor: float = DEFAULT_EFFICIENCY_FLOOR) -> Dict[str, Any]:
+    """
+    Run the sweep in increasing multiplier order, one spawned process per
+    run, and return the dataset. Stops at the first run that times out or fails.
+    """
+    import multiprocessing
+    from section_scheduler import SectionTask, run_sections
+
+    multipliers = sorted(set(multipliers))
+    tasks = [SectionTask(f"{m}x", _sweep_run, (m, context_window), time_limit_s) for m in multipliers]
+
+    runs = []
+    outcomes = run_sections(tasks, max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        for multiplier, outcome in zip(multipliers, outcomes):
+            run = outcome.section
+            if run["status"] != "SUCCESS":
+                run = {"status": run["status"], "multiplier": multiplier, "error": run.get("error"),
+                       "timed_out": run.get("timed_out", False), "wall_time_s": outcome.elapsed_s}
+            runs.append(run)
+            if run["status"] != "SUCCESS":
+                break
+    finally:
+        # Cancels the runs after a failure
+        outcomes.close()
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "context_window": context_window,
+        "unit": "tokens",
+        "time_limit_s": time_limit_s,
+        "runs": runs,
+        "scaling_limit": scaling_limit(runs, efficiency_floor),
+    }
+
+
+def load_dataset(path: Path = DEFAULT_DATASET_PATH) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure ToyRLM decomposition from 1x to 10,000x the context window")
+    parser.add_argument("--multipliers", nargs="+", type=int, default=list(DEFAULT_MULTIPLIERS))
+    parser.add_argument("--context-window", type=int, default=DEFAULT_CONTEXT_WINDOW, help="Tokens per sub-call")
+    parser.add_argument("--time-limit", type=float, default=DEFAULT_TIME_LIMIT_S,
+                        help="Seconds allowed per run; a run that exceeds it ends the sweep")
+    parser.add_argument("--efficiency-floor", type=float, default=DEFAULT_EFFICIENCY_FLOOR,
+                        help="Throughput fraction of the best run below which scaling has stopped")
+    parser.add_argument("--output", default=str(DEFAULT_DATASET_PATH), help="Dataset JSON path")
+    args = parser.parse_args(argv)
+
+    dataset = run_sweep(args.multipliers, args.context_window, args.time_limit, args.efficiency_floor)
+
+    print(f"{'multiplier':>10} {'tokens':>12} {'sub-calls':>10} {'wall':>10} {'tokens/s':>12} {'peak RSS':>10}")
+    for run in dataset["runs"]:
+        if run["status"] != "SUCCESS":
+            print(f"{run['multiplier']:>9}x  {run['error']}")
+            continue
+        print(f"{run['multiplier']:>9}x {run['input_tokens']:>12,} {run['sub_calls']:>10,} "
+              f"{run['wall_time_s']:>9.3f}s {run['tokens_per_s']:>12,.0f} {run['peak_rss_kb'] / 1024:>8.1f}MB")
+
+    limit = dataset["scaling_limit"]
+    where = f"at {limit['multiplier']}x" if limit["multiplier"] is not None else ""
+    print(f"\nScaling limit: {limit['reason']} {where}".rstrip())
+
+    from results_stream import write_json_atomic
+    write_json_atomic(dataset, args.output)
+    print(f"Dataset saved to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Corpus Runner for RLM Verification
+Re-verifies every paper in an output/ corpus from its deconstruction.json
+
+Walks output/<paper_id>/deconstruction.json, runs the data-driven
+verification sections for each paper across a process pool, and streams
+one result per paper as soon as it finishes (NDJSON on stdout or a file).
+No per-paper main.py is needed.
+
+Usage:
+    python corpus_runner.py [corpus_root] [--workers N] [--output results.ndjson]
+"""
+
+import argparse
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from claim_loader import load_deconstruction
+
+# Default corpus: the output/ folder this paper's folder lives in
+DEFAULT_CORPUS_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Sections that need only deconstruction.json (no simulation)
+CORPUS_SECTIONS = ("mathematical_verification", "ablation_verification", "benchmark_analysis")
+
+# Per-paper section cache, next to each deconstruction.json
+SECTION_CACHE_DIRNAME = ".section_cache"
+
+
+def find_deconstructions(corpus_root: Path) -> Iterator[Path]:
+    """Yield output/<paper_id>/deconstruction.json paths in sorted order."""
+    for path in sorted(Path(corpus_root).glob("*/deconstruction.json")):
+        yield path
+
+
+def verify_paper(deconstruction_path: Path, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Verify one paper from its deconstruction.json.
+    Runs the math, ablation and benchmark sections; never raises.
+    Sections unchanged since the paper's last run are reused from its
+    .section_cache folder unless use_cache is False.
+    """
+    # Imported here so worker processes pay for main's imports only once each
+    from main import run_section, collect_section_timings, generate_summary
+    from section_cache import SectionCache
+    from instrumentation import Instrumentation
+
+    deconstruction_path = Path(deconstruction_path)
+    paper_result = {
+        "paper_id": deconstruction_path.parent.name,
+        "source": str(deconstruction_path),
+        "verification_sections": {}
+    }
+
+    try:
+        deconstruction = load_deconstruction(deconstruction_path)
+    except Exception as e:
+        paper_result["status"] = "ERROR"
+        paper_result["error"] = f"Could not load deconstruction: {e}"
+        return paper_result
+
+    paper_result["paper_id"] = deconstruction.get("paper_id", paper_result["paper_id"])
+
+    section_cache = SectionCache(deconstruction_path.parent / SECTION_CACHE_DIRNAME) if use_cache else None
+    instruments = Instrumentation()
+    for name in CORPUS_SECTIONS:
+        section = run_section(name, deconstruction, section_cache)
+        collect_section_timings(name, section, instruments)
+        paper_result["verification_sections"][name] = section
+    paper_result["timings"] = instruments.summary()
+    if section_cache is not None:
+        paper_result["section_cache"] = section_cache.stats()
+
+    try:
+        # Papers already run side by side, so claim checks stay on this thread
+        paper_result["summary"] = generate_summary(paper_result, deconstruction, max_workers=1)
+        paper_result["status"] = "SUCCESS"
+    except Exception as e:
+        paper_result["status"] = "ERROR"
+        paper_result["error"] = f"Summary failed: {e}"
+
+    return paper_result
+
+
+def _failed_paper(deconstruction_path: Path, error: BaseException) -> Dict[str, Any]:
+    """Result for a paper whose worker raised or died before returning one."""
+    return {
+        "paper_id": deconstruction_path.parent.name,
+        "source": str(deconstruction_path),
+        "verification_sections": {},
+        "status": "ERROR",
+        "error": f"Worker failed: {type(error).__name__}: {error}",
+        "traceback": "".join(traceback.format_exception(error)),
+    }
+
+
+def _verify_isolated(deconstruction_path: Path, use_cache: bool) -> Dict[str, Any]:
+    """verify_paper() alone in a fresh worker, so a crash takes down no other paper."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(verify_paper, deconstruction_path, use_cache).result()
+        except Exception as e:
+            return _failed_paper(deconstruction_path, e)
+
+
+def run_corpus(corpus_root: Path = DEFAULT_CORPUS_ROOT,
+               max_workers: Optional[int] = None,
+               max_pending: Optional[int] = None,
+               use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Verify every paper in the corpus across a process pool.
+
+    Results are yielded in completion order as each paper finishes. At most
+    max_pending papers are queued at once, so memory stays bounded on corpora
+    of thousands of papers. Never raises for a failing paper: a paper whose
+    worker raises yields an ERROR result with its path. A worker that dies
+    breaks the pool and every paper queued on it; the pool is replaced, and
+    those papers are re-run at the end one at a time in their own worker,
+    so only the paper that crashes is reported as failed.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or max_workers * 4
+    paths = find_deconstructions(corpus_root)
+
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+    pending: Dict[Any, Tuple[Path, ProcessPoolExecutor]] = {}  # future -> (path, pool it runs on)
+    broken_pool_papers = []
+    exhausted = False
+
+    try:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                else:
+                    pending[pool.submit(verify_paper, path, use_cache)] = (path, pool)
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, future_pool = pending.pop(future)
+                try:
+                    paper_result = future.result()
+                except BrokenProcessPool:
+                    broken_pool_papers.append(path)
+                    if future_pool is pool:
+                        pool.shutdown(wait=False)
+                        pool = ProcessPoolExecutor(max_workers=max_workers)
+                    continue
+                except Exception as e:
+                    paper_result = _failed_paper(path, e)
+                yield paper_result
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+    for path in broken_pool_papers:
+        yield _verify_isolated(path, use_cache)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Verify every paper in an output/ corpus")
+    parser.add_argument("corpus_root", nargs="?", default=str(DEFAULT_CORPUS_ROOT),
+                        help="Folder containing <paper_id>/deconstruction.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default=None, help="NDJSON output file (default: stdout)")
+    parser.add_argument("--no-section-cache", action="store_true",
+                        help="Re-run every section instead of reusing unchanged ones")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    papers = 0
+    failures = 0
+
+    try:
+        for paper_result in run_corpus(Path(args.corpus_root), max_workers=args.workers,
+                                  use_cache=not args.no_section_cache):
+            papers += 1
+            if paper_result["status"] != "SUCCESS":
+                failures += 1
+            out.write(json.dumps(paper_result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Verified {papers} papers ({failures} failed)", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Cost and Latency Simulator for RLM Verification
+Monte Carlo replay of ToyRLM trajectories with token pricing and latency
+
+A ToyRLM run gives the shape of one trajectory: a root call plus one
+sub-call per chunk with known input sizes. The simulator replays that
+shape many thousands of times as NumPy arrays (trajectories x calls):
+- the number of sub-calls varies per trajectory (re-queries and answer
+  verification, E26), drawn as a lognormal multiplier on the base count
+- output tokens per call are lognormal
+- latency per call is a lognormal factor on prefill + decode time
+- calls are scheduled on `concurrency` slots with a discrete-event
+  list scheduler, vectorized across trajectories
+
+A summarization-agent baseline (E13) is simulated the same way: it reads
+chunks one after another, carrying a running summary into every call.
+
+All prices, token counts and latency parameters are assumptions passed
+in by the caller; results are only as good as those assumptions. A cost
+ratio between the two simulations is set by those assumptions, not by
+the paper's data, so it is an estimate and never verifies a claim.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+# USD per million tokens (frontier-model list prices, order of magnitude)
+DEFAULT_PRICING = {
+    "input_per_million": 1.25,
+    "output_per_million": 10.0,
+}
+
+# Seconds: fixed overhead per call, per input token (prefill), per output token (decode)
+DEFAULT_LATENCY = {
+    "base_s": 0.4,
+    "prefill_s_per_token": 0.00002,
+    "decode_s_per_token": 0.01,
+    "sigma": 0.35,
+}
+
+# Median tokens of the running summary a summarization agent writes per call
+DEFAULT_SUMMARY_TOKENS = 500.0
+
+PERCENTILES = (5, 25, 50, 75, 90, 95, 99)
+
+
+def summarize_distribution(values: np.ndarray) -> Dict[str, float]:
+    """Mean, spread and percentiles of a simulated distribution."""
+    values = np.asarray(values, dtype=np.float64)
+    points = np.percentile(values, PERCENTILES)
+    summary = {
+        "mean": round(float(values.mean()), 6),
+        "std": round(float(values.std()), 6),
+        "cv": round(float(values.std() / values.mean()), 4) if values.mean() else None,
+        "max": round(float(values.max()), 6),
+    }
+    for pct, point in zip(PERCENTILES, points):
+        summary[f"p{pct}"] = round(float(point), 6)
+    return summary
+
+
+def _call_costs(input_tokens: np.ndarray, output_tokens: np.ndarray, pricing: Dict[str, float]) -> np.ndarray:
+    return (input_tokens * pricing["input_per_million"] + output_tokens * pricing["output_per_million"]) / 1e6
+
+
+def _call_latencies(input_tokens: np.ndarray, output_tokens: np.ndarray,
+                    latency: Dict[str, float], rng: np.random.Generator) -> np.ndarray:
+    median = (latency["base_s"]
+              + input_tokens * latency["prefill_s_per_token"]
+              + output_tokens * latency["decode_s_per_token"])
+    return median * rng.lognormal(0.0, latency["sigma"], size=median.shape)
+
+
+def schedule_makespan(durations: np.ndarray, active: np.ndarray, concurrency: int) -> np.ndarray:
+    """
+    Discrete-event list scheduling of calls onto `concurrency` slots.
+
+    durations and active are (trajectories x calls). Calls start in column
+    order on whichever slot frees up first; the result is each
+    trajectory's finish time. Loops over calls, vectorized over trajectories.
+    """
+    n_trajectories, n_calls = durations.shape
+    slots = np.zeros((n_trajectories, concurrency))
+    rows = np.arange(n_trajectories)
+
+    for j in range(n_calls):
+        slot = slots.argmin(axis=1)
+        start = slots[rows, slot]
+        slots[rows, slot] = np.where(active[:, j], start + durations[:, j], start)
+
+    return slots.max(axis=1)
+
+
+def simulate_rlm_trajectories(sub_call_tokens: Sequence[int],
+                              n_trajectories: int = 10000,
+                              root_input_tokens: int = 2000,
+                              root_turns: int = 3,
+                              output_tokens_median: float = 100.0,
+                              output_sigma: float = 0.6,
+                              call_count_sigma: float = 0.35,
+                              concurrency: int = 1,
+                              pricing: Optional[Dict[str, float]] = None,
+                              latency: Optional[Dict[str, float]] = None,
+                              seed: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Simulate RLM trajectories built from one ToyRLM run's sub-call sizes.
+
+    Each trajectory has root_turns root-model calls (sequential, before and
+    after the sub-calls) and a lognormally varying number of sub-calls that
+    cycle through sub_call_tokens. concurrency=1 matches the paper's
+    synchronous implementation.
+    """
+    pricing = pricing or DEFAULT_PRICING
+    latency = latency or DEFAULT_LATENCY
+    rng = np.random.default_rng(seed)
+
+    base_tokens = np.asarray(sub_call_tokens, dtype=np.float64)
+    base_calls = len(base_tokens)
+
+    multipliers = rng.lognormal(0.0, call_count_sigma, size=n_trajectories)
+    n_calls = np.maximum(1, np.rint(base_calls * multipliers)).astype(np.int64)
+    max_calls = int(n_calls.max())
+
+    active = np.arange(max_calls)[None, :] < n_calls[:, None]
+    input_tokens = np.broadcast_to(base_tokens[np.arange(max_calls) % base_calls], active.shape)
+    output_tokens = rng.lognormal(np.log(output_tokens_median), output_sigma, size=active.shape)
+
+    sub_costs = np.where(active, _call_costs(input_tokens, output_tokens, pricing), 0.0)
+    sub_latency = _call_latencies(input_tokens, output_tokens, latency, rng)
+
+    root_in = np.full((n_trajectories, root_turns), float(root_input_tokens))
+    root_out = rng.lognormal(np.log(output_tokens_median), output_sigma, size=root_in.shape)
+    root_costs = _call_costs(root_in, root_out, pricing)
+    root_latency = _call_latencies(root_in, root_out, latency, rng)
+
+    cost = sub_costs.sum(axis=1) + root_costs.sum(axis=1)
+    wall = schedule_makespan(sub_latency, active, concurrency) + root_latency.sum(axis=1)
+
+    return {"cost_usd": cost, "latency_s": wall, "calls": n_calls + root_turns}
+
+
+def simulate_summary_agent(chunk_tokens: Sequence[int],
+                           n_trajectories: int = 10000,
+                           summary_tokens_median: float = DEFAULT_SUMMARY_TOKENS,
+                           output_sigma: float = 0.4,
+                           pricing: Optional[Dict[str, float]] = None,
+                           latency: Optional[Dict[str, float]] = None,
+                           seed: int = 1) -> Dict[str, np.ndarray]:
+    """
+    Simulate a summarization-agent baseline over the same chunks.
+
+    Every call reads one chunk plus the previous summary and writes a new
+    summary, so calls are strictly sequential.
+    """
+    pricing = pricing or DEFAULT_PRICING
+    latency = latency or DEFAULT_LATENCY
+    rng = np.random.default_rng(seed)
+
+    chunks = np.asarray(chunk_tokens, dtype=np.float64)
+    summaries = rng.lognormal(np.log(summary_tokens_median), output_sigma, size=(n_trajectories, len(chunks)))
+
+    # Input of call j = chunk j + summary written by call j-1
+    carried = np.concatenate([np.zeros((n_trajectories, 1)), summaries[:, :-1]], axis=1)
+    input_tokens = chunks[None, :] + carried
+
+    cost = _call_costs(input_tokens, summaries, pricing).sum(axis=1)
+    wall = _call_latencies(input_tokens, summaries, latency, rng).sum(axis=1)
+
+    return {"cost_usd": cost, "latency_s": wall, "calls": np.full(n_trajectories, len(chunks))}
+
+
+def sub_call_tokens_from_report(report: Dict[str, Any]) -> np.ndarray:
+    """
+    Sub-call input sizes in tokens from a process_long_input() report.
+    Prompt lengths in the trace are characters; they are scaled by the
+    report's tokens-per-character ratio when the run was token-aware.
+    """
+    lengths = np.array([
+        event["prompt_length"] for event in report["execution_trace"]["events"]
+        if event["action"] == "llm_query"
+    ], dtype=np.float64)
+    if lengths.size == 0:
+        raise ValueError("Report has no llm_query events to replay")
+
+    tokens_per_char = report.get("input_tokens", report["input_length"]) / report["input_length"]
+    return np.maximum(1.0, np.rint(lengths * tokens_per_char))
@@ -0,0 +1,426 @@
+"""
+Document Store for RLM Verification
+On-disk corpus, streaming inverted index and BM25 retrieval
+
+BrowseComp-Plus gives the model 1,000 documents and 6M-11M tokens, far
+more than ToyRLM's single in-memory string. DocumentStore keeps such a
+corpus on disk:
+- docs.bin holds every document's UTF-8 text back to back, with byte
+  offsets in docs.idx and token counts in doclen.bin; documents are read
+  through a memory map, one at a time
+- the inverted index is built in one streaming pass (single-pass
+  in-memory indexing): postings accumulate in memory until
+  memory_budget postings, are written out as a sorted run, and the runs
+  are merged term by term into postings.bin. Memory is bounded by the
+  budget plus the vocabulary, never by the corpus size
+- lexicon.tsv maps each term to its postings offset and document
+  frequency; postings are (doc id, term frequency) uint32 pairs
+
+search() ranks documents with Okapi BM25 (NumPy over the mapped
+postings). ToyRLM.answer_multi_hop() chains searches, reading each
+retrieved document with index-guided sub-calls.
+
+benchmark_store() builds a synthetic corpus at BrowseComp-Plus scale
+(1,000 documents, 11M tokens, Zipf-distributed vocabulary, with planted
+two-hop fact chains) in a fresh process and reports index build time,
+query latency, multi-hop accuracy and peak RSS per stage.
+
+Usage:
+    python document_store.py [--tokens 11000000] [--documents 1000] [--output PATH]
+"""
+
+import argparse
+import heapq
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from context_buffer import MappedInput, peak_rss_kb
+from needle_index import WORD_PATTERN
+
+# Postings held in memory before a sorted run is written to disk
+DEFAULT_MEMORY_BUDGET = 2_000_000
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_RUN_HEADER = struct.Struct("<HI")  # term length in bytes, postings count
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased words; the same tokens needle_index uses."""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def _write_run(path: Path, postings: Dict[str, array]) -> None:
+    """One sorted run: per term, a header, the term and its (doc, tf) pairs."""
+    with open(path, 'wb') as f:
+        for term in sorted(postings):
+            encoded = term.encode('utf-8')
+            pairs = postings[term]
+            f.write(_RUN_HEADER.pack(len(encoded), len(pairs) // 2))
+            f.write(encoded)
+            pairs.tofile(f)
+
+
+def _read_run(path: Path) -> Iterator[Tuple[str, bytes]]:
+    """(term, raw postings) from a run, in term order."""
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(_RUN_HEADER.size)
+            if not header:
+                return
+            term_length, count = _RUN_HEADER.unpack(header)
+            term = f.read(term_length).decode('utf-8')
+            yield term, f.read(count * 8)
+
+
+class DocumentStore:
+    """A built store, opened read-only. Use as a context manager to unmap on exit."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        with open(self.directory / "meta.json", encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+        self.offsets = array('Q')
+        with open(self.directory / "docs.idx", 'rb') as f:
+            self.offsets.frombytes(f.read())
+        self.doc_lengths = array('I')
+        with open(self.directory / "doclen.bin", 'rb') as f:
+            self.doc_lengths.frombytes(f.read())
+
+        # term -> (offset in postings pairs, document frequency)
+        self.lexicon: Dict[str, Tuple[int, int]] = {}
+        with open(self.directory / "lexicon.tsv", encoding='utf-8') as f:
+            for line in f:
+                term, offset, df = line.rstrip('\n').split('\t')
+                self.lexicon[term] = (int(offset), int(df))
+
+        self._docs = MappedInput(self.directory / "docs.bin")
+        self._postings = MappedInput(self.directory / "postings.bin")
+        self._lengths = None
+
+    @classmethod
+    def build(cls, directory: Union[str, Path], documents: Iterable[str],
+              memory_budget: int = DEFAULT_MEMORY_BUDGET) -> "DocumentStore":
+        """
+        Write documents and their inverted index to directory in one
+        streaming pass, holding at most memory_budget postings in memory.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        runs_dir = Path(tempfile.mkdtemp(dir=str(directory), prefix="runs-"))
+
+        offsets, doc_lengths = array('Q', [0]), array('I')
+        postings: Dict[str, array] = {}
+        held = 0
+        runs: List[Path] = []
+        try:
+            with open(directory / "docs.bin", 'wb') as docs:
+                for doc_id, text in enumerate(documents):
+                    encoded = text.encode('utf-8')
+                    docs.write(encoded)
+                    offsets.append(offsets[-1] + len(encoded))
+
+                    tokens = tokenize(text)
+                    doc_lengths.append(len(tokens))
+                    counts = Counter(tokens)
+                    for term, tf in counts.items():
+                        pairs = postings.get(term)
+                        if pairs is None:
+                            pairs = postings[term] = array('I')
+                        pairs.append(doc_id)
+                        pairs.append(tf)
+                    held += len(counts)
+
+                    if held >= memory_budget:
+                        runs.append(runs_dir / f"run-{len(runs):05d}.bin")
+                        _write_run(runs[-1], postings)
+                        postings, held = {}, 0
+
+            if postings:
+                runs.append(runs_dir / f"run-{len(runs):05d}.bin")
+                _write_run(runs[-1], postings)
+                postings = {}
+
+            # Runs cover increasing doc ids and merge() is stable, so each
+            # term's postings come out in doc id order
+            with open(directory / "postings.bin", 'wb') as out, \
+                    open(directory / "lexicon.tsv", 'w', encoding='utf-8') as lexicon:
+                offset, current, df = 0, None, 0
+                for term, raw in heapq.merge(*(_read_run(run) for run in runs), key=lambda record: record[0]):
+                    if term != current:
+                        if current is not None:
+                            lexicon.write(f"{current}\t{offset}\t{df}\n")
+                            offset += df
+                        current, df = term, 0
+                    out.write(raw)
+                    df += len(raw) // 8
+                if current is not None:
+                    lexicon.write(f"{current}\t{offset}\t{df}\n")
+        finally:
+            shutil.rmtree(runs_dir, ignore_errors=True)
+
+        with open(directory / "docs.idx", 'wb') as f:
+            offsets.tofile(f)
+        with open(directory / "doclen.bin", 'wb') as f:
+            doc_lengths.tofile(f)
+        total_tokens = sum(doc_lengths)
+        with open(directory / "meta.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                "documents": len(doc_lengths),
+                "tokens": total_tokens,
+                "avg_doc_length": total_tokens / len(doc_lengths) if doc_lengths else 0.0,
+                "runs": len(runs),
+                "memory_budget": memory_budget,
+            }, f, indent=2)
+
+        return cls(directory)
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def document(self, doc_id: int) -> str:
+        return bytes(self._docs[self.offsets[doc_id]:self.offsets[doc_id + 1]]).decode('utf-8')
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[int, float]]:
+        """Top-k (doc id, BM25 score) for query, best first; documents matching no term are left out."""
+        import numpy as np
+
+        if self._lengths is None:
+            self._lengths = np.frombuffer(self.doc_lengths, dtype=np.uint32).astype(np.float64)
+        n_docs = len(self)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths / (self.meta["avg_doc_length"] or 1.0))
+        scores = np.zeros(n_docs)
+
+        for term in dict.fromkeys(tokenize(query)):
+            entry = self.lexicon.get(term)
+            if entry is None:
+                continue
+            offset, df = entry
+            pairs = np.frombuffer(self._postings[offset * 8:(offset + df) * 8], dtype=np.uint32).reshape(-1, 2)
+            docs, tf = pairs[:, 0], pairs[:, 1].astype(np.float64)
+            idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            scores[docs] += idf * tf * (BM25_K1 + 1) / (tf + norm[docs])
+
+        matched = np.flatnonzero(scores)
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k)[:k]]
+        ranked = matched[np.argsort(-scores[matched], kind='stable')]
+        return [(int(doc_id), round(float(scores[doc_id]), 4)) for doc_id in ranked]
+
+    def stats(self) -> Dict[str, Any]:
+        sizes = {name: os.path.getsize(self.directory / name)
+                 for name in ("docs.bin", "postings.bin", "lexicon.tsv")}
+        return dict(self.meta, terms=len(self.lexicon), bytes_on_disk=sizes)
+
+    def close(self) -> None:
+        self._docs.close()
+        self._postings.close()
+
+    def __enter__(self) -> "DocumentStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# ============================================================================
+# SYNTHETIC CORPUS
+# ============================================================================
+
+# Two-letter syllables: vocabulary words have 2-3, entity names 4, so they never collide
+_SYLLABLES = [c + v for c in "bdfgklmnprstvz" for v in "aeiou"]
+
+# Query and answer templates per hop; {} is the previous hop's answer
+MULTI_HOP_TEMPLATES = (
+    ("{} founded", r"{} was founded by (\w+)"),
+    ("{} born", r"{} was born in (\w+)"),
+)
+
+
+def _vocabulary(size: int, rng: Any) -> List[str]:
+    words = {"".join(rng.choice(_SYLLABLES, size=int(rng.integers(2, 4)))) for _ in range(size * 2)}
+    return sorted(words)[:size]
+
+
+def _entity(rng: Any, taken: set) -> str:
+    while True:
+        name = "".join(rng.choice(_SYLLABLES, size=4))
+        if name not in taken:
+            taken.add(name)
+            return name
+
+
+def make_corpus(path: Union[str, Path], tokens: int = 11_000_000, documents: int = 1000,
+                vocabulary: int = 50_000, chains: int = 50, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Write a synthetic corpus to path, one document per line, streaming
+    document by document. Words follow a Zipf distribution; each of the
+    `chains` two-hop fact chains plants "<company> was founded by <person>."
+    and "<person> was born in <city>." in two different documents.
+    Returns the chains: start entity, expected answers per hop.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    words = np.array(_vocabulary(vocabulary, rng))
+    ranks = np.arange(1, len(words) + 1, dtype=np.float64)
+    weights = 1 / ranks ** 1.1
+    weights /= weights.sum()
+
+    taken: set = set()
+    facts: Dict[int, List[str]] = {}
+    planted = []
+    for _ in range(chains):
+        company, person, city = _entity(rng, taken), _entity(rng, taken), _entity(rng, taken)
+        first, second = rng.choice(documents, size=2, replace=False)
+        facts.setdefault(int(first), []).append(f"{company} was founded by {person}.")
+        facts.setdefault(int(second), []).append(f"{person} was born in {city}.")
+        planted.append({"start": company, "answers": [person, city], "documents": [int(first), int(second)]})
+
+    per_document = tokens // documents
+    with open(path, 'w', encoding='utf-8') as f:
+        for doc_id in range(documents):
+            body = words[rng.choice(len(words), size=per_document, p=weights)].tolist()
+            for fact in facts.get(doc_id, []):
+                body.insert(int(rng.integers(0, len(body) + 1)), fact)
+            f.write(" ".join(body))
+            f.write("\n")
+
+    return planted
+
+
+def read_corpus(path: Union[str, Path]) -> Iterator[str]:
+    """Documents from a make_corpus() file, one at a time."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def _benchmark_run(tokens: int, documents: int, queries: int, memory_budget: int,
+                   context_limit: int, k: int) -> Dict[str, Any]:
+    """Worker: generate, build, query and multi-hop in this (fresh) process."""
+    import numpy as np
+    from main import ToyRLM
+
+    result: Dict[str, Any] = {"tokens": tokens, "documents": documents, "memory_budget": memory_budget}
+    rss = {"start_kb": peak_rss_kb()}
+    work_dir = Path(tempfile.mkdtemp(prefix="rlm-store-"))
+    try:
+        start = time.perf_counter()
+        chains = make_corpus(work_dir / "corpus.txt", tokens=tokens, documents=documents)
+        result["generate_s"] = round(time.perf_counter() - start, 3)
+        rss["after_generate_kb"] = peak_rss_kb()
+
+        start = time.perf_counter()
+        store = DocumentStore.build(work_dir / "store", read_corpus(work_dir / "corpus.txt"),
+                                    memory_budget=memory_budget)
+        result["build_s"] = round(time.perf_counter() - start, 3)
+        result["build_tokens_per_s"] = round(store.meta["tokens"] / result["build_s"], 1)
+        rss["after_build_kb"] = peak_rss_kb()
+
+        with store:
+            result["store"] = store.stats()
+
+            # Rare-entity queries from the chains plus queries of frequent
+            # words, whose long postings lists are the slow case
+            rng = np.random.default_rng(1)
+            vocabulary = sorted(store.lexicon, key=lambda term: -store.lexicon[term][1])[:1000]
+            query_texts = [f"{chain['start']} founded" for chain in chains]
+            while len(query_texts) < queries:
+                query_texts.append(" ".join(rng.choice(vocabulary, size=3)))
+            latencies = []
+            for query in query_texts[:queries]:
+                start = time.perf_counter()
+                store.search(query, k=k)
+                latencies.append(time.perf_counter() - start)
+            latencies.sort()
+            result["query_latency_ms"] = {
+                "queries": len(latencies),
+                "p50": round(_percentile(latencies, 0.50) * 1e3, 3),
+                "p95": round(_percentile(latencies, 0.95) * 1e3, 3),
+                "max": round(latencies[-1] * 1e3, 3),
+            }
+            rss["after_queries_kb"] = peak_rss_kb()
+
+            correct, sub_calls, hop_times = 0, [], []
+            for chain in chains:
+                rlm = ToyRLM(context_limit=context_limit, trace_limit=0)
+                start = time.perf_counter()
+                outcome = rlm.answer_multi_hop(store, chain["start"], MULTI_HOP_TEMPLATES, k=k)
+                hop_times.append(time.perf_counter() - start)
+                correct += outcome["answers"] == chain["answers"]
+                sub_calls.append(outcome["sub_calls"])
+            result["multi_hop"] = {
+                "chains": len(chains),
+                "correct": correct,
+                "mean_sub_calls": round(sum(sub_calls) / len(sub_calls), 1),
+                "mean_latency_ms": round(sum(hop_times) / len(hop_times) * 1e3, 3),
+            }
+            rss["after_multi_hop_kb"] = peak_rss_kb()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    result["peak_rss"] = rss
+    return result
+
+
+def benchmark_store(tokens: int = 11_000_000, documents: int = 1000, queries: int = 200,
+                    memory_budget: int = DEFAULT_MEMORY_BUDGET, context_limit: int = 1000,
+                    k: int = 3) -> Dict[str, Any]:
+    """
+    Build and query a BrowseComp-Plus-scale store in a fresh spawned
+    process, so its peak RSS is not inherited from this one.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(_benchmark_run, tokens, documents, queries, memory_budget, context_limit, k).result()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the on-disk document store at BrowseComp-Plus scale")
+    parser.add_argument("--tokens", type=int, default=11_000_000)
+    parser.add_argument("--documents", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET,
+                        help="Postings held in memory before a run is written to disk")
+    parser.add_argument("--output", default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    result = benchmark_store(args.tokens, args.documents, args.queries, args.memory_budget)
+
+    store, latency, multi_hop, rss = result["store"], result["query_latency_ms"], result["multi_hop"], result["peak_rss"]
+    print(f"Corpus: {store['documents']:,} documents, {store['tokens']:,} tokens, {store['terms']:,} terms "
+          f"(generated in {result['generate_s']:.1f}s)")
+    print(f"Index build: {result['build_s']:.1f}s ({result['build_tokens_per_s']:,.0f} tokens/s), "
+          f"{store['runs']} runs merged, {store['bytes_on_disk']['postings.bin'] / 2**20:.1f}MB of postings")
+    print(f"BM25 query latency over {latency['queries']} queries: p50 {latency['p50']:.2f}ms, "
+          f"p95 {latency['p95']:.2f}ms, max {latency['max']:.2f}ms")
+    print(f"Multi-hop: {multi_hop['correct']}/{multi_hop['chains']} chains answered, "
+          f"{multi_hop['mean_sub_calls']} sub-calls and {multi_hop['mean_latency_ms']:.1f}ms per chain")
+    print("Peak RSS: " + ", ".join(f"{stage.replace('_kb', '')} {value / 1024:.0f}MB" for stage, value in rss.items()))
+
+    if args.output:
+        from results_stream import write_json_atomic
+        write_json_atomic(result, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Execution Trace for RLM Verification
+Compact, bounded, run-scoped trace store for ToyRLM
+
+Events are small slotted records instead of dicts. Each call to
+process_long_input() opens a new run, and events belong to the run that
+was open when they were recorded. Each run can be capped as a ring buffer
+that keeps its most recent events and counts the ones it dropped.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+
+class TraceEvent:
+    """Base class for trace records; subclasses list their fields in __slots__."""
+
+    __slots__ = ()
+    action = "event"
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = {"action": self.action}
+        for name in self.__slots__:
+            record[name] = getattr(self, name)
+        return record
+
+
+class ExecuteCode(TraceEvent):
+    __slots__ = ("code", "recursion_depth")
+    action = "execute_code"
+
+    def __init__(self, code: str, recursion_depth: int):
+        self.code = code
+        self.recursion_depth = recursion_depth
+
+
+class LlmQuery(TraceEvent):
+    __slots__ = ("prompt_length", "recursion_depth", "call_number", "cached")
+    action = "llm_query"
+
+    def __init__(self, prompt_length: int, recursion_depth: int, call_number: int, cached: bool = False):
+        self.prompt_length = prompt_length
+        self.recursion_depth = recursion_depth
+        self.call_number = call_number
+        self.cached = cached
+
+
+class StoreInRepl(TraceEvent):
+    __slots__ = ("variable", "size")
+    action = "store_in_repl"
+
+    def __init__(self, variable: str, size: int):
+        self.variable = variable
+        self.size = size
+
+
+class DecomposeInput(TraceEvent):
+    __slots__ = ("num_chunks", "chunk_size")
+    action = "decompose_input"
+
+    def __init__(self, num_chunks: int, chunk_size: int):
+        self.num_chunks = num_chunks
+        self.chunk_size = chunk_size
+
+
+class AggregateResults(TraceEvent):
+    __slots__ = ("num_results",)
+    action = "aggregate_results"
+
+    def __init__(self, num_results: int):
+        self.num_results = num_results
+
+
+class CacheStats(TraceEvent):
+    __slots__ = ("hits", "disk_hits", "misses", "evictions")
+    action = "cache_stats"
+
+    def __init__(self, hits: int, disk_hits: int, misses: int, evictions: int):
+        self.hits = hits
+        self.disk_hits = disk_hits
+        self.misses = misses
+        self.evictions = evictions
+
+
+class TraceRun:
+    """Events recorded during one run, with an optional ring-buffer cap."""
+
+    __slots__ = ("run_id", "label", "events", "total_events")
+
+    def __init__(self, run_id: int, label: str, max_events: Optional[int]):
+        self.run_id = run_id
+        self.label = label
+        self.events: Deque[TraceEvent] = deque(maxlen=max_events)
+        self.total_events = 0
+
+    @property
+    def dropped_events(self) -> int:
+        return self.total_events - len(self.events)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "label": self.label,
+            "total_events": self.total_events,
+            "dropped_events": self.dropped_events,
+            "events": [event.to_dict() for event in self.events]
+        }
+
+
+class ExecutionTrace:
+    """
+    Run-scoped trace store.
+
+    max_events caps each run (oldest events are dropped first); None keeps
+    everything. max_runs caps how many runs are retained; None keeps all.
+    """
+
+    def __init__(self, max_events: Optional[int] = None, max_runs: Optional[int] = None):
+        self.max_events = max_events
+        self.max_runs = max_runs
+        self._runs: Dict[int, TraceRun] = {}
+        self._next_run_id = 1
+        self.current: Optional[TraceRun] = None
+
+    def begin_run(self, label: str = "") -> int:
+        """Open a new run; later events are recorded into it."""
+        run = TraceRun(self._next_run_id, label, self.max_events)
+        self._next_run_id += 1
+        self._runs[run.run_id] = run
+        self.current = run
+
+        if self.max_runs is not None:
+            while len(self._runs) > self.max_runs:
+                del self._runs[next(iter(self._runs))]
+
+        return run.run_id
+
+    def record(self, event: TraceEvent) -> None:
+        """Record an event into the current run, opening one if needed."""
+        if self.current is None:
+            self.begin_run()
+        self.current.events.append(event)
+        self.current.total_events += 1
+
+    def run(self, run_id: int) -> TraceRun:
+        return self._runs[run_id]
+
+    def runs(self) -> List[TraceRun]:
+        return list(self._runs.values())
+
+    def clear(self) -> None:
+        self._runs.clear()
+        self.current = None
+
+    def __len__(self) -> int:
+        return sum(len(run.events) for run in self._runs.values())
+
+    def __iter__(self) -> Iterator[TraceEvent]:
+        for run in self._runs.values():
+            yield from run.events
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize every retained run once."""
+        return {"runs": [run.to_dict() for run in self._runs.values()]}
@@ -0,0 +1,207 @@
+"""
+Instrumentation for RLM Verification
+Low-overhead timing, memory and call-count spans with Chrome trace export
+
+A span measures one piece of work:
+- wall time (time.perf_counter_ns) and CPU time (process CPU for sections
+  and plots, thread CPU for ToyRLM sub-calls, none for awaited sub-calls)
+- with rss=True, the process peak RSS at its end (getrusage, always cheap)
+- with memory=True, the tracemalloc peak during the span; only the
+  outermost memory span starts tracemalloc. Tracing every allocation
+  slows allocation-heavy code, so it is opt-in
+- a call count: spans are aggregated per name, so 10,000 sub-calls are one
+  row with count=10000, not 10,000 rows
+
+Every span is also kept as a trace event, up to max_events per
+Instrumentation; later events still count towards the aggregates and are
+reported as dropped. chrome_trace() turns the events into Chrome
+trace-event JSON (open it in chrome://tracing or Perfetto).
+
+Sections run in worker processes, so each one records into its own
+Instrumentation and ships export() back with its result; the parent
+merge()s them. Code that wants sub-call timings looks up current(): when
+nothing is active, the hot path costs one global read.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Trace events kept per Instrumentation; aggregates are never capped
+DEFAULT_MAX_EVENTS = 20000
+
+# Instrumentation that ToyRLM sub-calls record into, if any
+_current: Optional["Instrumentation"] = None
+
+
+def current() -> Optional["Instrumentation"]:
+    return _current
+
+
+@contextmanager
+def activate(instruments: "Instrumentation") -> Iterator["Instrumentation"]:
+    """Make instruments the current() Instrumentation for the duration."""
+    global _current
+    previous, _current = _current, instruments
+    try:
+        yield instruments
+    finally:
+        _current = previous
+
+
+class Instrumentation:
+    """Per-name span aggregates plus a bounded list of trace events."""
+
+    def __init__(self, memory: bool = False, max_events: int = DEFAULT_MAX_EVENTS):
+        self.memory = memory
+        self.max_events = max_events
+        # name -> [category, count, wall_ns, cpu_ns or None, max_wall_ns, {peak_*: value}]
+        self._spans: Dict[str, list] = {}
+        # (name, category, start_us, duration_us, pid, tid, args)
+        self.events: List[tuple] = []
+        self.dropped_events = 0
+        # Maps perf_counter_ns to wall-clock microseconds, so events from
+        # different processes line up on one timeline
+        self._clock_offset_us = time.time_ns() // 1000 - time.perf_counter_ns() // 1000
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def _add(self, name: str, category: str, start_ns: int, wall_ns: int,
+             cpu_ns: Optional[int], args: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = [category, 0, 0, None, 0, {}]
+            stats[1] += 1
+            stats[2] += wall_ns
+            if cpu_ns is not None:
+                stats[3] = (stats[3] or 0) + cpu_ns
+            if wall_ns > stats[4]:
+                stats[4] = wall_ns
+            if args:
+                peaks = stats[5]
+                for key, value in args.items():
+                    if key.startswith("peak_") and value is not None:
+                        peaks[key] = max(peaks.get(key) or 0, value)
+
+            if len(self.events) < self.max_events:
+                self.events.append((name, category, start_ns // 1000 + self._clock_offset_us,
+                                    wall_ns // 1000, self._pid, threading.get_ident(), args or {}))
+            else:
+                self.dropped_events += 1
+
+    def record(self, name: str, category: str, start_ns: int, wall_ns: int,
+               cpu_ns: Optional[int] = None, **args: Any) -> None:
+        """Add one finished span; args (e.g. peak_tracemalloc_kb) go on its trace event."""
+        self._add(name, category, start_ns, wall_ns, cpu_ns, args)
+
+    @contextmanager
+    def span(self, name: str, category: str = "span", memory: Optional[bool] = None,
+             rss: bool = False, thread_cpu: bool = False) -> Iterator[None]:
+        """
+        Time the enclosed block. memory (tracemalloc) defaults to this
+        Instrumentation's setting; rss records the process peak RSS at the
+        end; thread_cpu counts only the calling thread's CPU time.
+        """
+        cpu_clock = time.thread_time_ns if thread_cpu else time.process_time_ns
+        memory = self.memory if memory is None else memory
+        tracing = False
+        if memory:
+            import tracemalloc
+            tracing = not tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.start()
+
+        start_ns, cpu_start = time.perf_counter_ns(), cpu_clock()
+        try:
+            yield
+        finally:
+            wall_ns, cpu_ns = time.perf_counter_ns() - start_ns, cpu_clock() - cpu_start
+            args = {}
+            if tracing:
+                args["peak_tracemalloc_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                tracemalloc.stop()
+            if rss:
+                from context_buffer import peak_rss_kb
+                args["peak_rss_kb"] = peak_rss_kb()
+            self._add(name, category, start_ns, wall_ns, cpu_ns, args)
+
+    def call(self, name: str, category: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args) timed as a span (thread CPU), without a context manager on the hot path."""
+        start_ns, cpu_start = time.perf_counter_ns(), time.thread_time_ns()
+        try:
+            return fn(*args)
+        finally:
+            cpu_ns = time.thread_time_ns() - cpu_start
+            self._add(name, category, start_ns, time.perf_counter_ns() - start_ns, cpu_ns, None)
+
+    @property
+    def spans(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregates per span name, in seconds."""
+        spans = {}
+        for name, (category, count, wall_ns, cpu_ns, max_wall_ns, peaks) in self._spans.items():
+            spans[name] = dict({
+                "category": category,
+                "count": count,
+                "wall_s": wall_ns / 1e9,
+                "cpu_s": cpu_ns / 1e9 if cpu_ns is not None else None,
+                "max_wall_s": max_wall_ns / 1e9,
+            }, **peaks)
+        return spans
+
+    def export(self) -> Dict[str, Any]:
+        """Picklable, JSON-able snapshot for merge() in another process."""
+        return {"spans": {name: list(stats) for name, stats in self._spans.items()},
+                "events": self.events, "dropped_events": self.dropped_events}
+
+    def merge(self, exported: Dict[str, Any]) -> None:
+        """Fold another Instrumentation's export() into this one."""
+        with self._lock:
+            for name, (category, count, wall_ns, cpu_ns, max_wall_ns, peaks) in exported["spans"].items():
+                stats = self._spans.get(name)
+                if stats is None:
+                    stats = self._spans[name] = [category, 0, 0, None, 0, {}]
+                stats[1] += count
+                stats[2] += wall_ns
+                if cpu_ns is not None:
+                    stats[3] = (stats[3] or 0) + cpu_ns
+                stats[4] = max(stats[4], max_wall_ns)
+                for key, value in peaks.items():
+                    stats[5][key] = max(stats[5].get(key) or 0, value)
+
+            room = max(0, self.max_events - len(self.events))
+            events = [tuple(event) for event in exported["events"]]
+            self.events.extend(events[:room])
+            self.dropped_events += exported["dropped_events"] + max(0, len(events) - room)
+
+    def summary(self) -> Dict[str, Any]:
+        """The results.json `timings` block: per-span aggregates, rounded."""
+        spans = {}
+        for name, stats in self.spans.items():
+            row = dict(stats)
+            for key in ("wall_s", "cpu_s", "max_wall_s"):
+                if row[key] is not None:
+                    row[key] = round(row[key], 6)
+            row["mean_wall_s"] = round(stats["wall_s"] / stats["count"], 9)
+            spans[name] = row
+        return {
+            "spans": spans,
+            "trace_events": len(self.events),
+            "dropped_trace_events": self.dropped_events,
+            "tracemalloc": self.memory,
+        }
+
+
+def chrome_trace(instruments: Instrumentation) -> Dict[str, Any]:
+    """Chrome trace-event JSON ("X" complete events, microsecond timestamps)."""
+    trace_events = []
+    for name, category, start_us, duration_us, pid, tid, args in instruments.events:
+        event = {"name": name, "cat": category, "ph": "X", "ts": start_us, "dur": duration_us,
+                 "pid": pid, "tid": tid}
+        if args:
+            event["args"] = args
+        trace_events.append(event)
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": instruments.dropped_events}}
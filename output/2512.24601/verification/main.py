@@ -5,18 +5,81 @@ Agent D - Verifier
 This script verifies mathematical claims, simulates RLM concepts, and generates visualizations.
 """
 
-import json
 import sys
 import io
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Any
 import traceback
 
+# NumPy, asyncio, SQLite, multiprocessing and the numeric helper modules
+# are imported inside the functions that use them, so a short math-only
+# run does not pay for the RLM simulation's imports (see startup_profile.py)
+from context_buffer import MappedInput, as_zero_copy, preview_text, write_repeated_input, peak_rss_kb
+from execution_trace import (
+    ExecutionTrace,
+    ExecuteCode,
+    LlmQuery,
+    StoreInRepl,
+    DecomposeInput,
+    AggregateResults,
+    CacheStats,
+)
+from token_chunker import TokenChunker, TokenOffsetIndex
+from section_cache import SectionCache, fingerprint_section
+from section_scheduler import SectionOutcome, SectionTask
+from results_stream import ResultsStreamWriter, rebuild_results, write_json_atomic
+from instrumentation import Instrumentation, activate, chrome_trace, current as current_instrumentation
+from claim_loader import (
+    load_deconstruction,
+    build_percentage_cases,
+    build_ablation_cases,
+    build_token_count_cases,
+    build_cost_ratio_cases,
+    build_restatement_cases,
+)
+
+if TYPE_CHECKING:
+    from claim_graph import ClaimCheck
+    from subcall_cache import SubCallCache
+    from repl_pool import ReplWorkerPool
+
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Agent A's structured claims for this paper
+DECONSTRUCTION_PATH = Path(__file__).parent.parent / "deconstruction.json"
+
+# Tokens reserved in every sub-call for the instructions around a chunk
+RLM_PROMPT_OVERHEAD_TOKENS = 50
+
+# Sub-call responses persisted across runs of this script
+SUBCALL_CACHE_PATH = Path(__file__).parent / ".subcall_cache.sqlite"
+
+# Section results reused while their inputs and code are unchanged
+SECTION_CACHE_DIR = Path(__file__).parent / ".section_cache"
+
+# Per-section time limits in seconds; the ToyRLM sweeps get the most room
+SECTION_TIMEOUT_S = 120
+RLM_SIMULATION_TIMEOUT_S = 900
+
+# Resamples per bootstrap interval in the math and ablation sections (0 skips them)
+BOOTSTRAP_RESAMPLES = 1_000_000
+
+# Per-execution time limit of the REPL pool used by the RLM simulation (--repl-pool)
+REPL_POOL_TIME_LIMIT_S = 1.0
+
+
+def _resolve_deconstruction(deconstruction: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Use the given deconstruction, or load this paper's deconstruction.json."""
+    if deconstruction is None:
+        deconstruction = load_deconstruction(DECONSTRUCTION_PATH)
+    return deconstruction
+
+
 # ============================================================================
 # MATHEMATICAL VERIFICATION
 # ============================================================================
@@ -83,44 +146,35 @@ def verify_percentage_calculation(baseline: float, rlm: float, claimed_improveme
     }
 
 
-def verify_all_percentage_claims() -> Dict[str, Any]:
-    """Verify all percentage improvement claims from the paper."""
-
-    results = {}
-
-    # E2: OOLONG-Pairs GPT-5: 58.00 vs 0.04 F1 = +1,350% improvement
-    results["E2_C2"] = verify_percentage_calculation(
-        baseline=0.04,
-        rlm=58.00,
-        claimed_improvement="+1350%"
-    )
-    results["E2_C2"]["claim"] = "OOLONG-Pairs GPT-5: 58.00 vs 0.04 F1"
+def verify_all_percentage_claims(deconstruction: Dict[str, Any] = None,
+                                 n_resamples: int = BOOTSTRAP_RESAMPLES) -> Dict[str, Any]:
+    """
+    Verify all percentage improvement claims from the paper in one batch.
+    Cases come from empirical claims with "A vs B" values and an improvement.
+    Each gets a bootstrap interval of n_resamples resamples unless it is 0.
+    """
+    from percentage_batch import verify_percentage_batch, batch_to_claim_dicts
+    from bootstrap import attach_aggregate_intervals
 
-    # E3: OOLONG-Pairs Qwen3-Coder: 23.11 vs 0.06 F1 = +385% improvement
-    results["E3_C3"] = verify_percentage_calculation(
-        baseline=0.06,
-        rlm=23.11,
-        claimed_improvement="+385%"
-    )
-    results["E3_C3"]["claim"] = "OOLONG-Pairs Qwen3-Coder: 23.11 vs 0.06 F1"
+    cases = build_percentage_cases(_resolve_deconstruction(deconstruction))
+    if not cases:
+        return {}
 
-    # E6: OOLONG GPT-5: 56.50% vs 44.00% = +28.4% improvement
-    results["E6_C4"] = verify_percentage_calculation(
-        baseline=44.00,
-        rlm=56.50,
-        claimed_improvement="+28.4%"
+    batch = verify_percentage_batch(
+        [case["baseline"] for case in cases],
+        [case["rlm"] for case in cases],
+        [case["claimed_improvement"] for case in cases]
     )
-    results["E6_C4"]["claim"] = "OOLONG GPT-5: 56.50% vs 44.00%"
+    rows = batch_to_claim_dicts(batch, claims=[case["claim"] for case in cases])
+    results = {case["key"]: row for case, row in zip(cases, rows)}
 
-    # E7: OOLONG Qwen3-Coder: 48.00% vs 36.00% = +33.3% improvement
-    results["E7_C5"] = verify_percentage_calculation(
-        baseline=36.00,
-        rlm=48.00,
-        claimed_improvement="+33.3%"
-    )
-    results["E7_C5"]["claim"] = "OOLONG Qwen3-Coder: 48.00% vs 36.00%"
+    if not n_resamples:
+        return results
 
-    return results
+    # Uncertainty on RLM - baseline from aggregates; informational where the sample size is assumed
+    return attach_aggregate_intervals(results, "rlm", "baseline",
+                                      sample_sizes={case["key"]: case["sample_size"] for case in cases},
+                                      n_resamples=n_resamples)
 
 
 def verify_cost_ratio(rlm_cost: float, baseline_cost: float, claimed_ratio: str) -> Dict[str, Any]:
@@ -150,40 +204,94 @@ def verify_cost_ratio(rlm_cost: float, baseline_cost: float, claimed_ratio: str)
     }
 
 
-def verify_ablation_claims() -> Dict[str, Any]:
-    """Verify ablation study claims."""
+def verify_cost_ratio_simulated(rlm_costs: Sequence[float], baseline_costs: Sequence[float],
+                                claimed_ratio: str) -> Dict[str, Any]:
+    """
+    Verify a cost ratio claim against simulated cost distributions.
+    The point check compares median costs; the paired ratio distribution
+    shows how often a single trajectory would match the claim.
+    """
+    import numpy as np
+    from cost_simulator import summarize_distribution
+
+    rlm_costs = np.asarray(rlm_costs, dtype=np.float64)
+    baseline_costs = np.asarray(baseline_costs, dtype=np.float64)
+
+    result = verify_cost_ratio(float(np.median(rlm_costs)), float(np.median(baseline_costs)), claimed_ratio)
+    if result.get("status") == "ERROR":
+        return result
+
+    paired_ratio = baseline_costs / rlm_costs
+    result["method"] = "simulated_median_costs"
+    result["rlm_cost_distribution"] = summarize_distribution(rlm_costs)
+    result["baseline_cost_distribution"] = summarize_distribution(baseline_costs)
+    result["paired_ratio_distribution"] = summarize_distribution(paired_ratio)
+    result["probability_within_tolerance"] = round(
+        float(np.mean(np.abs(paired_ratio - result["claimed_ratio"]) < 0.5)), 4
+    )
+    return result
 
-    results = {}
 
-    # E15: OOLONG drops from 56.50% to 36.00% without sub-calls
-    results["E15"] = {
-        "claim": "OOLONG: RLM 56.50% vs No-SubCalls 36.00%",
-        "full_rlm": 56.50,
-        "no_subcalls": 36.00,
-        "absolute_drop": 56.50 - 36.00,
-        "relative_drop_pct": ((56.50 - 36.00) / 56.50) * 100,
-        "interpretation": "Removing sub-calls reduces performance by 20.5 percentage points (36.3% relative drop)"
-    }
+def verify_ablation_claims(deconstruction: Dict[str, Any] = None,
+                           n_resamples: int = BOOTSTRAP_RESAMPLES) -> Dict[str, Any]:
+    """
+    Verify ablation study claims.
+    Each ablation result is "ablated vs full"; comparison claims check that
+    the quoted drops match and that the first-quoted drop is the larger one.
+    Drops get bootstrap intervals of n_resamples resamples unless it is 0.
+    """
+    from bootstrap import attach_aggregate_intervals
 
-    # E16: OOLONG-Pairs drops from 58.00% to 17.34% without sub-calls
-    results["E16"] = {
-        "claim": "OOLONG-Pairs: RLM 58.00% vs No-SubCalls 17.34%",
-        "full_rlm": 58.00,
-        "no_subcalls": 17.34,
-        "absolute_drop": 58.00 - 17.34,
-        "relative_drop_pct": ((58.00 - 17.34) / 58.00) * 100,
-        "interpretation": "Removing sub-calls reduces performance by 40.66 percentage points (70.1% relative drop)"
-    }
+    cases = build_ablation_cases(_resolve_deconstruction(deconstruction))
 
-    # C12: Comparison of ablation impact
-    results["C12_comparison"] = {
-        "claim": "Impact is more dramatic on quadratic (OOLONG-Pairs) than linear (OOLONG) tasks",
-        "oolong_drop_pp": 56.50 - 36.00,
-        "oolong_pairs_drop_pp": 58.00 - 17.34,
-        "difference": (58.00 - 17.34) - (56.50 - 36.00),
-        "verified": (58.00 - 17.34) > (56.50 - 36.00),
-        "interpretation": "OOLONG-Pairs drops 40.66pp vs OOLONG drops 20.5pp - claim verified"
-    }
+    results = {}
+
+    for case in cases["ablations"]:
+        full_rlm = case["full_rlm"]
+        no_subcalls = case["no_subcalls"]
+        absolute_drop = full_rlm - no_subcalls
+        relative_drop_pct = (absolute_drop / full_rlm) * 100 if full_rlm else 0.0
+
+        results[case["key"]] = {
+            "claim": case["claim"],
+            "full_rlm": full_rlm,
+            "no_subcalls": no_subcalls,
+            "absolute_drop": absolute_drop,
+            "relative_drop_pct": relative_drop_pct,
+            "interpretation": f"Removing sub-calls reduces performance by {absolute_drop:g} percentage points ({relative_drop_pct:.1f}% relative drop)"
+        }
+
+    if n_resamples:
+        attach_aggregate_intervals(results, "full_rlm", "no_subcalls",
+                                   sample_sizes={case["key"]: case["sample_size"] for case in cases["ablations"]},
+                                   n_resamples=n_resamples)
+
+    for case in cases["comparisons"]:
+        drops = {dep: results[dep]["absolute_drop"] for dep in case["dependencies"]}
+        claimed = case["claimed_drops_pp"]
+
+        if len(claimed) >= 2:
+            # Every quoted drop must match a computed one, and the text orders them largest first
+            quoted_match = all(
+                any(abs(c - d) < 0.01 for d in drops.values()) for c in claimed
+            )
+            verified = quoted_match and all(a > b for a, b in zip(claimed, claimed[1:]))
+        else:
+            verified = None
+
+        ranked = sorted(drops.items(), key=lambda item: item[1], reverse=True)
+        ranking = " vs ".join(f"{dep} drops {drop:g}pp" for dep, drop in ranked)
+        outcome = {True: "claim verified", False: "claim NOT verified", None: "no quoted drops to check"}[verified]
+
+        results[case["key"]] = {
+            "claim": case["claim"],
+            "claim_id": case["claim_id"],
+            "drops_pp": drops,
+            "claimed_drops_pp": claimed,
+            "difference": ranked[0][1] - ranked[-1][1],
+            "verified": verified,
+            "interpretation": f"{ranking} - {outcome}"
+        }
 
     return results
 
@@ -192,28 +300,77 @@ def verify_ablation_claims() -> Dict[str, Any]:
 # RLM CONCEPT SIMULATION
 # ============================================================================
 
+def _simulated_sub_call(namespace: Dict[str, Any], start: int, end: int) -> str:
+    """Runs in a REPL worker: answer one chunk of the worker's shared long_input."""
+    return f"[Simulated response to: {preview_text(namespace['long_input'][start:end], 50)}...]"
+
+
+def fixed_latency(seconds: float) -> Callable[[int], float]:
+    """Latency model: every sub-call takes the same time."""
+    return lambda prompt_length: seconds
+
+
+def per_token_latency(base_seconds: float, seconds_per_token: float) -> Callable[[int], float]:
+    """Latency model: fixed overhead plus time proportional to prompt length."""
+    return lambda prompt_length: base_seconds + seconds_per_token * prompt_length
+
+
 class ToyRLM:
     """
     Simplified simulation of RLM concept demonstrating:
     1. REPL-based context handling
     2. Recursive decomposition pattern
     3. Sub-call mechanism
+
+    latency_model maps a prompt length to simulated seconds per sub-call.
+    Without one, sub-calls return immediately.
+
+    Each process_long_input() call is traced as its own run. trace_limit
+    caps the events kept per run; trace_runs caps how many runs are kept.
+
+    With a SubCallCache, repeated prompts are answered from the cache
+    without paying the simulated latency.
+
+    With a TokenChunker, context_limit is measured in tokens: inputs are
+    indexed once and split into token-budgeted chunks, leaving the
+    chunker's prompt overhead free in every sub-call. Without one,
+    characters stand in for tokens.
+
+    With a ReplWorkerPool, execute_code() runs in an isolated worker
+    process (worker 0 holds the session's namespace) under the pool's
+    time and memory limits instead of exec() on repl_env.
     """
 
-    def __init__(self, context_limit: int = 100):
+    def __init__(self, context_limit: int = 100,
+                 latency_model: Optional[Callable[[int], float]] = None,
+                 trace_limit: Optional[int] = None,
+                 trace_runs: Optional[int] = None,
+                 cache: Optional["SubCallCache"] = None,
+                 chunker: Optional[TokenChunker] = None,
+                 repl_pool: Optional["ReplWorkerPool"] = None):
         self.context_limit = context_limit
+        self.chunker = chunker
+        self.repl_pool = repl_pool
+        self.latency_model = latency_model
+        self.cache = cache
         self.repl_env = {}
-        self.execution_trace = []
+        self.execution_trace = ExecutionTrace(max_events=trace_limit, max_runs=trace_runs)
         self.sub_call_count = 0
         self.max_recursion_depth = 1
+        # Guards the call counter and trace when sub-calls run on worker threads
+        self._call_lock = threading.Lock()
 
     def execute_code(self, code: str, recursion_depth: int = 0) -> Any:
         """Simulate code execution in REPL environment."""
-        self.execution_trace.append({
-            "action": "execute_code",
-            "code": code,
-            "recursion_depth": recursion_depth
-        })
+        instruments = current_instrumentation()
+        if instruments is not None:
+            return instruments.call("execute_code", "sub_call", self._execute_code, code, recursion_depth)
+        return self._execute_code(code, recursion_depth)
+
+    def _execute_code(self, code: str, recursion_depth: int) -> Any:
+        self.execution_trace.record(ExecuteCode(code, recursion_depth))
+        if self.repl_pool is not None:
+            return self._pool_result(self.repl_pool.execute(code))
 
         # In real RLM, this would execute Python code
         # Here we just simulate the concept
@@ -223,88 +380,457 @@ class ToyRLM:
         except Exception as e:
             return {"error": str(e)}
 
+    @staticmethod
+    def _pool_result(reply: Dict[str, Any]) -> Any:
+        """A pool reply in execute_code()'s shape: True, or an error dict."""
+        if reply["ok"]:
+            return True
+        return dict({"error": reply["error"]}, **{
+            key: reply[key] for key in ("timed_out", "memory_exceeded", "worker_restarted") if key in reply
+        })
+
+    def execute_code_batch(self, snippets: Sequence[str], recursion_depth: int = 0) -> List[Any]:
+        """
+        Run independent snippets, in parallel across the REPL pool's workers
+        when there is one (each sees only what its own namespace holds, e.g.
+        setup from repl_pool.broadcast()), else one after another in-process.
+        """
+        if self.repl_pool is None:
+            return [self.execute_code(code, recursion_depth) for code in snippets]
+
+        for code in snippets:
+            self.execution_trace.record(ExecuteCode(code, recursion_depth))
+        instruments = current_instrumentation()
+        if instruments is not None:
+            replies = instruments.call("execute_code_batch", "sub_call", self.repl_pool.map, snippets)
+        else:
+            replies = self.repl_pool.map(snippets)
+        return [self._pool_result(reply) for reply in replies]
+
+    def _cache_lookup(self, prompt: Any, recursion_depth: int) -> Tuple[Optional[str], Optional[str]]:
+        """Return (cache key, cached response); both None without a cache."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.key_for(prompt, recursion_depth)
+        return key, self.cache.get(key)
+
+    def _record_call(self, prompt_length: int, recursion_depth: int, cached: bool) -> None:
+        with self._call_lock:
+            self.sub_call_count += 1
+            self.execution_trace.record(LlmQuery(prompt_length, recursion_depth, self.sub_call_count, cached))
+
+    def _respond(self, prompt: Any, key: Optional[str]) -> str:
+        response = f"[Simulated response to: {preview_text(prompt, 50)}...]"
+        if key is not None:
+            self.cache.put(key, response)
+        return response
+
+    def record_cache_stats(self) -> None:
+        """Write the cache's hit/miss/eviction counters into the current trace run."""
+        if self.cache is not None:
+            self.cache.flush()
+            self.execution_trace.record(CacheStats(
+                self.cache.hits, self.cache.disk_hits, self.cache.misses, self.cache.evictions
+            ))
+
     def llm_query(self, prompt: str, recursion_depth: int = 0) -> str:
         """
         Simulate the llm_query() function exposed to the LLM.
         This represents a recursive call to a sub-LM.
         """
-        if recursion_depth >= self.max_recursion_depth:
+        instruments = current_instrumentation()
+        if instruments is not None:
+            return instruments.call("llm_query", "sub_call", self._llm_query, prompt, recursion_depth)
+        return self._llm_query(prompt, recursion_depth)
+
+    def _llm_query(self, prompt: str, recursion_depth: int) -> str:
+        if recursion_depth > self.max_recursion_depth:
             return "[MAX_RECURSION_DEPTH_REACHED]"
 
-        self.sub_call_count += 1
-        self.execution_trace.append({
-            "action": "llm_query",
-            "prompt_length": len(prompt),
-            "recursion_depth": recursion_depth,
-            "call_number": self.sub_call_count
-        })
+        key, cached = self._cache_lookup(prompt, recursion_depth)
+        self._record_call(len(prompt), recursion_depth, cached is not None)
+        if cached is not None:
+            return cached
 
         # Simulate LLM processing the prompt
-        return f"[Simulated response to: {prompt[:50]}...]"
+        if self.latency_model is not None:
+            time.sleep(self.latency_model(len(prompt)))
+        return self._respond(prompt, key)
 
-    def process_long_input(self, long_input: str) -> Dict[str, Any]:
+    async def allm_query(self, prompt: str, recursion_depth: int = 0) -> str:
         """
-        Demonstrate how RLM handles input exceeding context limits.
+        Asynchronous llm_query(): the simulated latency is awaited, so other
+        sub-calls can be in flight at the same time.
         """
-        input_length = len(long_input)
+        instruments = current_instrumentation()
+        if instruments is None:
+            return await self._allm_query(prompt, recursion_depth)
 
-        if input_length <= self.context_limit:
-            # Fits in context - process directly
-            return {
-                "method": "direct_processing",
-                "input_length": input_length,
-                "context_limit": self.context_limit,
-                "sub_calls_needed": 0,
-                "result": "Processed directly"
-            }
+        # Other sub-calls run on this thread while one awaits, so only wall time is meaningful
+        start_ns = time.perf_counter_ns()
+        try:
+            return await self._allm_query(prompt, recursion_depth)
+        finally:
+            instruments.record("allm_query", "sub_call", start_ns, time.perf_counter_ns() - start_ns)
+
+    async def _allm_query(self, prompt: str, recursion_depth: int) -> str:
+        if recursion_depth > self.max_recursion_depth:
+            return "[MAX_RECURSION_DEPTH_REACHED]"
+
+        key, cached = self._cache_lookup(prompt, recursion_depth)
+        self._record_call(len(prompt), recursion_depth, cached is not None)
+        if cached is not None:
+            return cached
+
+        if self.latency_model is not None:
+            import asyncio
+            await asyncio.sleep(self.latency_model(len(prompt)))
+        return self._respond(prompt, key)
+
+    def _measure(self, long_input: Any) -> Tuple[int, Optional[TokenOffsetIndex]]:
+        """Input size in context units (tokens with a chunker, else characters)."""
+        if self.chunker is None:
+            return len(long_input), None
+        index = self.chunker.build_index(long_input)
+        return index.n_tokens, index
+
+    def _direct_result(self, input_length: int, input_size: int) -> Dict[str, Any]:
+        """Result for inputs that fit in the context window."""
+        result = {
+            "method": "direct_processing",
+            "input_length": input_length,
+            "context_limit": self.context_limit,
+            "sub_calls_needed": 0,
+            "result": "Processed directly"
+        }
+        if self.chunker is not None:
+            result["input_tokens"] = input_size
+        return result
+
+    def _decompose(self, long_input: Any, index: Optional[TokenOffsetIndex]) -> List[Tuple[int, int]]:
+        """Store the input in the REPL and return (start, end) character bounds per chunk."""
+        input_length = len(long_input)
 
-        # Too long - use RLM strategy
         # Step 1: Store input in REPL environment
         self.repl_env['long_input'] = long_input
-        self.execution_trace.append({
-            "action": "store_in_repl",
-            "variable": "long_input",
-            "size": input_length
-        })
+        self.execution_trace.record(StoreInRepl("long_input", input_length))
 
         # Step 2: Decompose via code execution
+        if index is not None:
+            chunk_size = self.chunker.budget(self.context_limit)
+            bounds = [(start, end) for start, end, _ in index.chunk_bounds(chunk_size)]
+            self.execution_trace.record(DecomposeInput(len(bounds), chunk_size))
+            return bounds
+
         chunk_size = self.context_limit
         num_chunks = (input_length + chunk_size - 1) // chunk_size
 
-        self.execution_trace.append({
-            "action": "decompose_input",
+        self.execution_trace.record(DecomposeInput(num_chunks, chunk_size))
+
+        return [(i * chunk_size, min((i + 1) * chunk_size, input_length)) for i in range(num_chunks)]
+
+    def _aggregate(self, input_length: int, input_size: int, results: List[str],
+                   wall_time: float, call_time: float, mode: str) -> Dict[str, Any]:
+        """Step 4: Aggregate chunk results into the decomposition report."""
+        self.execution_trace.record(AggregateResults(len(results)))
+        self.record_cache_stats()
+
+        num_chunks = len(results)
+        report = {
+            "method": "rlm_recursive_decomposition",
+            "input_length": input_length,
+            "context_limit": self.context_limit,
+            "multiplier": input_size / self.context_limit,
             "num_chunks": num_chunks,
-            "chunk_size": chunk_size
-        })
+            "sub_calls_needed": num_chunks,
+            "scheduling": mode,
+            "wall_time_s": round(wall_time, 6),
+            "total_call_time_s": round(call_time, 6),
+            "execution_trace": self.execution_trace.current.to_dict(),
+            "result": f"Processed {num_chunks} chunks via sub-calls"
+        }
+        if self.chunker is not None:
+            report["input_tokens"] = input_size
+            report["prompt_overhead_tokens"] = self.chunker.prompt_overhead_tokens
+        return report
+
+    def process_long_input(self, long_input: Any) -> Dict[str, Any]:
+        """
+        Demonstrate how RLM handles input exceeding context limits.
+        Sub-calls run one after another, as in the paper's implementation.
+
+        long_input may be a str, a bytes-like buffer or a MappedInput.
+        Bytes-backed chunks are memoryview slices, so no chunk is copied.
+        """
+        long_input = as_zero_copy(long_input)
+        input_length = len(long_input)
+        input_size, index = self._measure(long_input)
+        advance = getattr(long_input, "advance", None)
+        self.execution_trace.begin_run("sequential")
+
+        if input_size <= self.context_limit:
+            # Fits in context - process directly
+            return self._direct_result(input_length, input_size)
+
+        # Too long - use RLM strategy
+        bounds = self._decompose(long_input, index)
 
         # Step 3: Process each chunk via sub-calls
         results = []
-        for i in range(num_chunks):
-            start = i * chunk_size
-            end = min((i + 1) * chunk_size, input_length)
+        call_time = 0.0
+        run_start = time.perf_counter()
+        for start, end in bounds:
             chunk = long_input[start:end]
 
             # Simulate recursive LLM call on chunk
+            call_start = time.perf_counter()
             chunk_result = self.llm_query(chunk, recursion_depth=1)
+            call_time += time.perf_counter() - call_start
             results.append(chunk_result)
 
-        # Step 4: Aggregate results
-        self.execution_trace.append({
-            "action": "aggregate_results",
-            "num_results": len(results)
+            # Let mapped inputs drop pages that are fully processed
+            if advance is not None:
+                advance(end)
+        wall_time = time.perf_counter() - run_start
+
+        return self._aggregate(input_length, input_size, results, wall_time, call_time, mode="sequential")
+
+    async def aprocess_long_input(self, long_input: Any, max_in_flight: int = 8) -> Dict[str, Any]:
+        """
+        Asynchronous process_long_input(): chunk sub-calls run concurrently,
+        with at most max_in_flight awaiting a response at any time.
+        Results keep chunk order regardless of completion order.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        long_input = as_zero_copy(long_input)
+        input_length = len(long_input)
+        input_size, index = self._measure(long_input)
+        self.execution_trace.begin_run("async")
+
+        if input_size <= self.context_limit:
+            return self._direct_result(input_length, input_size)
+
+        import asyncio
+
+        bounds = self._decompose(long_input, index)
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def run_chunk(start: int, end: int) -> Tuple[str, float]:
+            async with semaphore:
+                call_start = time.perf_counter()
+                chunk_result = await self.allm_query(long_input[start:end], recursion_depth=1)
+                return chunk_result, time.perf_counter() - call_start
+
+        # Step 3: Process chunks via concurrent sub-calls
+        run_start = time.perf_counter()
+        outcomes = await asyncio.gather(*(run_chunk(start, end) for start, end in bounds))
+        wall_time = time.perf_counter() - run_start
+
+        results = [chunk_result for chunk_result, _ in outcomes]
+        call_time = sum(duration for _, duration in outcomes)
+
+        report = self._aggregate(input_length, input_size, results, wall_time, call_time, mode="async")
+        report["max_in_flight"] = max_in_flight
+        return report
+
+    def process_long_input_async(self, long_input: Any, max_in_flight: int = 8) -> Dict[str, Any]:
+        """Run aprocess_long_input() to completion from synchronous code."""
+        import asyncio
+        return asyncio.run(self.aprocess_long_input(long_input, max_in_flight=max_in_flight))
+
+    def process_long_input_shared(self, long_input: Any,
+                                  pool: Optional["ReplWorkerPool"] = None) -> Dict[str, Any]:
+        """
+        process_long_input() with sub-calls run in parallel on REPL pool
+        workers (self.repl_pool by default). The input is placed in shared
+        memory once and mapped by every worker as long_input; each sub-call
+        sends only its (start, end) offsets, so dispatch cost does not grow
+        with the input. str inputs are shared UTF-8 encoded. Responses are
+        not cached and no latency model applies.
+        """
+        pool = pool or self.repl_pool
+        if pool is None:
+            raise ValueError("process_long_input_shared() needs a ReplWorkerPool")
+
+        if isinstance(long_input, str):
+            long_input = long_input.encode('utf-8')
+        long_input = as_zero_copy(long_input)
+        input_length = len(long_input)
+        input_size, index = self._measure(long_input)
+        self.execution_trace.begin_run("shared_memory")
+
+        if input_size <= self.context_limit:
+            return self._direct_result(input_length, input_size)
+
+        bounds = self._decompose(long_input, index)
+
+        # Step 3: Share the input once, then send each worker only offsets
+        with pool.share_context(long_input) as shared:
+            run_start = time.perf_counter()
+            replies = pool.call_map(_simulated_sub_call, bounds)
+            wall_time = time.perf_counter() - run_start
+
+        failed = [reply["error"] for reply in replies if not reply["ok"]]
+        if failed:
+            raise RuntimeError(f"{len(failed)} sub-calls failed in REPL workers: {failed[0]}")
+        for start, end in bounds:
+            self._record_call(end - start, 1, False)
+
+        results = [reply["value"] for reply in replies]
+        call_time = sum(reply["elapsed_s"] for reply in replies)
+        report = self._aggregate(input_length, input_size, results, wall_time, call_time, mode="shared_memory")
+        report["shared_context_bytes"] = shared.handle.size
+        report["workers"] = len(pool)
+        return report
+
+    def process_long_input_indexed(self, long_input: Any, query: str, answer_pattern: str,
+                                   ngram: int = 1) -> Dict[str, Any]:
+        """
+        Answer a needle-in-a-haystack query with sub-calls only on the chunks
+        an n-gram index marks as candidates, stopping at the first chunk whose
+        text matches answer_pattern (group 1, or the whole match, is the
+        answer). See needle_index.ChunkIndex.
+        """
+        import re
+        from needle_index import ChunkIndex
+
+        long_input = as_zero_copy(long_input)
+        input_length = len(long_input)
+        input_size, index = self._measure(long_input)
+        self.execution_trace.begin_run("indexed")
+
+        if input_size <= self.context_limit:
+            return self._direct_result(input_length, input_size)
+
+        bounds = self._decompose(long_input, index)
+
+        # Step 3: Index the stored input, then query candidate chunks first
+        index_start = time.perf_counter()
+        chunk_index = ChunkIndex(long_input, bounds, ngram)
+        candidates = chunk_index.candidates(query)
+        index_time = time.perf_counter() - index_start
+
+        text_input = isinstance(long_input, str)
+        pattern = re.compile(answer_pattern if text_input else answer_pattern.encode('utf-8'))
+        candidate_set = set(candidates)
+        order = candidates + [chunk_id for chunk_id in range(len(bounds)) if chunk_id not in candidate_set]
+
+        results = []
+        answer = answer_chunk = None
+        call_time = 0.0
+        run_start = time.perf_counter()
+        for chunk_id in order:
+            start, end = bounds[chunk_id]
+            chunk = long_input[start:end]
+
+            call_start = time.perf_counter()
+            results.append(self.llm_query(chunk, recursion_depth=1))
+            call_time += time.perf_counter() - call_start
+
+            # Stands in for the sub-call reading the answer out of its chunk
+            match = pattern.search(chunk)
+            if match:
+                answer = match.group(1) if pattern.groups else match.group()
+                if not text_input:
+                    answer = answer.decode('utf-8', errors='replace')
+                answer_chunk = chunk_id
+                break
+        wall_time = time.perf_counter() - run_start
+
+        report = self._aggregate(input_length, input_size, results, wall_time, call_time, mode="indexed")
+        report.update({
+            "num_chunks": len(bounds),
+            "candidate_chunks": len(candidates),
+            "answer": answer,
+            "answer_chunk": answer_chunk,
+            "fell_back": answer_chunk is not None and answer_chunk not in candidate_set,
+            "sub_calls_avoided": len(bounds) - len(results),
+            "index_build_s": round(index_time, 6),
+            "index": chunk_index.stats(),
         })
+        return report
+
+    def answer_multi_hop(self, store: Any, start: str, hops: Sequence[Tuple[str, str]],
+                         k: int = 3) -> Dict[str, Any]:
+        """
+        Follow a chain of lookups over a document_store.DocumentStore. Each
+        hop is a (query, answer_pattern) template pair formatted with the
+        previous answer (start for the first hop): the query's BM25 top-k
+        documents are read in rank order with process_long_input_indexed()
+        until one yields an answer. The chain stops at the first hop that
+        finds none.
+        """
+        import re
+
+        answers, hop_reports = [], []
+        entity = start
+        for query_template, pattern_template in hops:
+            query = query_template.format(entity)
+            pattern = pattern_template.format(re.escape(entity))
+            calls_before = self.sub_call_count
+
+            search_start = time.perf_counter()
+            ranked = store.search(query, k=k)
+            search_time = time.perf_counter() - search_start
+
+            answer = answer_doc = None
+            for doc_id, _ in ranked:
+                document = store.document(doc_id)
+                report = self.process_long_input_indexed(document, query, pattern)
+                if report["method"] == "direct_processing":
+                    # Fits in one context window: a single sub-call reads it
+                    self.llm_query(document, recursion_depth=1)
+                    match = re.search(pattern, document)
+                    answer = match and (match.group(1) if match.re.groups else match.group())
+                else:
+                    answer = report["answer"]
+                    # The answer may straddle a chunk boundary: re-read a
+                    # window around each mention of the entity, as REPL code would
+                    half = self.context_limit // 2
+                    for mention in re.finditer(re.escape(entity), document, re.IGNORECASE):
+                        if answer is not None:
+                            break
+                        window = document[max(0, mention.start() - half):mention.start() + half]
+                        self.llm_query(window, recursion_depth=1)
+                        match = re.search(pattern, window)
+                        answer = match and (match.group(1) if match.re.groups else match.group())
+                if answer is not None:
+                    answer_doc = doc_id
+                    break
+
+            hop_reports.append({
+                "query": query,
+                "retrieved": ranked,
+                "answer": answer,
+                "answer_doc": answer_doc,
+                "search_s": round(search_time, 6),
+                "sub_calls": self.sub_call_count - calls_before,
+            })
+            if answer is None:
+                break
+            answers.append(answer)
+            entity = answer
 
         return {
-            "method": "rlm_recursive_decomposition",
-            "input_length": input_length,
-            "context_limit": self.context_limit,
-            "multiplier": input_length / self.context_limit,
-            "num_chunks": num_chunks,
-            "sub_calls_needed": num_chunks,
-            "execution_trace": self.execution_trace,
-            "result": f"Processed {num_chunks} chunks via sub-calls"
+            "start": start,
+            "answers": answers,
+            "complete": len(answers) == len(hops),
+            "sub_calls": sum(hop["sub_calls"] for hop in hop_reports),
+            "hops": hop_reports,
         }
 
+    def process_long_input_recursive(self, long_input: Any, max_depth: int = 2,
+                                     branching: int = 8, workers: int = 4) -> Dict[str, Any]:
+        """
+        Process long_input as a sub-call tree up to max_depth levels deep.
+        See recursive_engine.RecursiveDecomposer for the splitting rules.
+        """
+        from recursive_engine import RecursiveDecomposer
+        engine = RecursiveDecomposer(self, max_depth=max_depth, branching=branching, workers=workers)
+        return engine.run(as_zero_copy(long_input))
+
     def demonstrate_100x_capability(self) -> Dict[str, Any]:
         """
         Demonstrate claim E1: RLMs can handle inputs 100× beyond context windows.
@@ -313,28 +839,317 @@ class ToyRLM:
         context_window = 1000
         self.context_limit = context_window
 
-        # Create input that is 100x larger
-        input_100x = "x" * (context_window * 100)
+        # Create input that is 100x larger, on disk rather than in memory.
+        # With a chunker, each "word " unit is one token; otherwise one char is.
+        import tempfile
 
-        result = self.process_long_input(input_100x)
+        unit = b"word " if self.chunker is not None else b"x"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = write_repeated_input(
+                Path(tmp_dir) / "input_100x.txt", unit, len(unit) * context_window * 100
+            )
+            with MappedInput(input_path) as input_100x:
+                result = self.process_long_input(input_100x)
+                input_size = result.get("input_tokens", result["input_length"])
+                self.repl_env.pop('long_input', None)
 
         return {
             "claim": "E1: RLMs can handle inputs 100× beyond context windows",
             "context_window": context_window,
-            "input_size": len(input_100x),
-            "multiplier": len(input_100x) / context_window,
+            "input_size": input_size,
+            "multiplier": input_size / context_window,
             "verification": result,
             "status": "DEMONSTRATED" if result["multiplier"] >= 100 else "FAILED"
         }
 
 
+def check_repl_session(rlm: ToyRLM) -> Dict[str, Any]:
+    """
+    Run a short REPL session through rlm.execute_code(): state set by one
+    snippet must be visible to the next, and a failing snippet must come
+    back as an error instead of raising. With a REPL pool, a snippet that
+    runs past the pool's time limit must also be stopped.
+    """
+    start = time.perf_counter()
+    stored = rlm.execute_code("chunk_lengths = [len(chunk) for chunk in ('a' * 10, 'b' * 20)]")
+    kept = rlm.execute_code("assert chunk_lengths == [10, 20]")
+    failed = rlm.execute_code("undefined_name")
+    session = {
+        "backend": "in_process" if rlm.repl_pool is None else "repl_pool",
+        "state_kept": stored is True and kept is True,
+        "errors_contained": isinstance(failed, dict) and "error" in failed,
+    }
+    if rlm.repl_pool is not None:
+        runaway = rlm.execute_code("while True: pass")
+        session["runaway_stopped"] = isinstance(runaway, dict) and bool(runaway.get("timed_out"))
+        session["workers"] = len(rlm.repl_pool)
+    session["elapsed_s"] = round(time.perf_counter() - start, 6)
+    return session
+
+
+def compare_sync_async_scheduling(multipliers: Tuple[int, ...] = (100, 1000),
+                                  context_limit: int = 1000,
+                                  latency_model: Optional[Callable[[int], float]] = None,
+                                  max_in_flight: int = 32) -> Dict[str, Any]:
+    """
+    Compare sequential and async sub-call scheduling at several context multipliers.
+    Reports wall time against summed call time; speedup = sequential wall / async wall.
+    """
+    latency_model = latency_model or fixed_latency(0.001)
+    comparison = {}
+
+    for multiplier in multipliers:
+        long_input = "x" * (context_limit * multiplier)
+
+        sequential = ToyRLM(context_limit=context_limit, latency_model=latency_model)
+        seq_result = sequential.process_long_input(long_input)
+
+        concurrent = ToyRLM(context_limit=context_limit, latency_model=latency_model)
+        async_result = concurrent.process_long_input_async(long_input, max_in_flight=max_in_flight)
+
+        comparison[f"{multiplier}x"] = {
+            "sub_calls": seq_result["sub_calls_needed"],
+            "max_in_flight": max_in_flight,
+            "sequential_wall_time_s": seq_result["wall_time_s"],
+            "sequential_call_time_s": seq_result["total_call_time_s"],
+            "async_wall_time_s": async_result["wall_time_s"],
+            "async_call_time_s": async_result["total_call_time_s"],
+            "speedup": round(seq_result["wall_time_s"] / async_result["wall_time_s"], 2)
+            if async_result["wall_time_s"] > 0 else None
+        }
+
+    return comparison
+
+
+def _mapped_input_run(multiplier: int, context_limit: int) -> Dict[str, Any]:
+    """
+    Process one memory-mapped input in this process and report its peak RSS.
+    The execution trace is off, so the figure covers input handling only.
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = write_repeated_input(Path(tmp_dir) / "input.txt", b"x", context_limit * multiplier)
+        rss_before = peak_rss_kb()
+
+        rlm = ToyRLM(context_limit=context_limit, trace_limit=0)
+        with MappedInput(input_path) as long_input:
+            result = rlm.process_long_input(long_input)
+            rlm.repl_env.pop('long_input', None)
+
+        rss_after = peak_rss_kb()
+        return {
+            "input_bytes": result["input_length"],
+            "sub_calls": result["sub_calls_needed"],
+            "peak_rss_before_kb": rss_before,
+            "peak_rss_kb": rss_after,
+            "rss_growth_kb": rss_after - rss_before if rss_before is not None else None,
+        }
+
+
+def measure_mapped_input_scaling(multipliers: Tuple[int, ...] = (100, 1000, 10000),
+                                 context_limit: int = 1000) -> Dict[str, Any]:
+    """
+    Measure peak RSS of memory-mapped ToyRLM runs as the multiplier grows.
+    Each run happens in a fresh process so its peak RSS is not inherited.
+    Growth is bounded by MappedInput's release window (16MB of resident
+    pages) plus the per-chunk results kept for aggregation.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    scaling = {}
+    for multiplier in multipliers:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            scaling[f"{multiplier}x"] = pool.submit(_mapped_input_run, multiplier, context_limit).result()
+
+    return scaling
+
+
+def compare_recursion_depths(depths: Tuple[int, ...] = (1, 2, 3),
+                             multiplier: int = 100,
+                             context_limit: int = 1000,
+                             branching: int = 4) -> Dict[str, Any]:
+    """
+    Run the same input at several recursion depths.
+    Reports total calls, per-level fan-out and critical-path length per depth.
+    """
+    long_input = "x" * (context_limit * multiplier)
+    comparison = {}
+
+    for depth in depths:
+        rlm = ToyRLM(context_limit=context_limit)
+        result = rlm.process_long_input_recursive(long_input, max_depth=depth, branching=branching)
+        comparison[f"depth_{depth}"] = {
+            key: result[key] for key in
+            ("total_calls", "leaf_calls", "tree_depth", "levels", "critical_path_calls", "steals")
+        }
+
+    return comparison
+
+
+def compare_pairwise_scheduling(sizes: Tuple[int, ...] = (100, 250, 500, 1000, 2500, 5000),
+                                context_limit: int = 1000,
+                                max_naive_pairs: int = 125_000,
+                                seed: int = 0) -> Dict[str, Any]:
+    """
+    Run an OOLONG-Pairs-style quadratic task with naive per-pair sub-calls
+    and with tiled sub-calls as the record count grows. The naive run is
+    skipped above max_naive_pairs pairs; its sub-call count is still exact.
+    Growth exponents are fitted on log sub-calls and log runtime against log n.
+    """
+    import numpy as np
+    from pairwise_engine import make_pairwise_task, run_naive, run_tiled
+
+    comparison = {}
+    for n in sizes:
+        task = make_pairwise_task(n, seed=seed)
+        # Trace only the run summaries; the naive run makes one event per pair
+        tiled = run_tiled(ToyRLM(context_limit=context_limit, trace_limit=0), task)
+        pairs = tiled["pairs"]
+        if pairs <= max_naive_pairs:
+            naive = run_naive(ToyRLM(context_limit=context_limit, trace_limit=0), task)
+        else:
+            naive = {"scheduling": "naive", "skipped": True, "sub_calls": pairs}
+
+        row = {"naive": naive, "tiled": tiled,
+               "sub_call_reduction": round(naive["sub_calls"] / tiled["sub_calls"], 1)}
+        if not naive.get("skipped"):
+            row["counts_match"] = naive["matching_pairs"] == tiled["matching_pairs"]
+            row["speedup"] = round(naive["wall_time_s"] / tiled["wall_time_s"], 1) if tiled["wall_time_s"] > 0 else None
+        comparison[f"n_{n}"] = row
+
+    def growth(scheduling: str, metric: str) -> Optional[float]:
+        points = [(n, row[scheduling][metric]) for n, row in zip(sizes, comparison.values())
+                  if row[scheduling].get(metric)]
+        if len(points) < 2:
+            return None
+        log_n, log_y = np.log([p[0] for p in points]), np.log([p[1] for p in points])
+        return round(float(np.polyfit(log_n, log_y, 1)[0]), 2)
+
+    return {
+        "sizes": comparison,
+        "growth_exponent": {
+            scheduling: {metric: growth(scheduling, metric) for metric in ("sub_calls", "wall_time_s")}
+            for scheduling in ("naive", "tiled")
+        },
+    }
+
+
+def compare_indexed_retrieval(multipliers: Tuple[int, ...] = (10, 100, 1000, 10000),
+                              context_limit: int = 1000,
+                              needle_depth: float = 0.7,
+                              seed: int = 0) -> Dict[str, Any]:
+    """
+    Find one needle in haystacks of several sizes, sending every chunk
+    (process_long_input) vs only index candidates with early exit
+    (process_long_input_indexed). break_even_latency_s is the sub-call
+    latency above which building the index pays for itself.
+    """
+    from needle_index import make_haystack, NEEDLE_QUERY, NEEDLE_ANSWER_PATTERN
+
+    comparison = {}
+    for multiplier in multipliers:
+        haystack, answer = make_haystack(context_limit * multiplier, needle_depth=needle_depth, seed=seed)
+
+        linear = ToyRLM(context_limit=context_limit, trace_limit=0).process_long_input(haystack)
+        indexed = ToyRLM(context_limit=context_limit, trace_limit=0).process_long_input_indexed(
+            haystack, NEEDLE_QUERY, NEEDLE_ANSWER_PATTERN
+        )
+
+        avoided = linear["sub_calls_needed"] - indexed["sub_calls_needed"]
+        comparison[f"{multiplier}x"] = {
+            "chunks": indexed["num_chunks"],
+            "linear_sub_calls": linear["sub_calls_needed"],
+            "indexed_sub_calls": indexed["sub_calls_needed"],
+            "candidate_chunks": indexed["candidate_chunks"],
+            "sub_calls_avoided": avoided,
+            "avoided_pct": round(100 * avoided / linear["sub_calls_needed"], 2),
+            "answer_correct": indexed["answer"] == answer,
+            "fell_back": indexed["fell_back"],
+            "linear_wall_time_s": linear["wall_time_s"],
+            "indexed_wall_time_s": indexed["wall_time_s"],
+            "index_build_s": indexed["index_build_s"],
+            "index_terms": indexed["index"]["terms"],
+            "break_even_latency_s": round(indexed["index_build_s"] / avoided, 9) if avoided > 0 else None,
+        }
+
+    return comparison
+
+
+def simulate_trajectory_costs(report: Dict[str, Any], deconstruction: Dict[str, Any] = None,
+                              n_trajectories: int = 10000, concurrency: int = 8) -> Dict[str, Any]:
+    """
+    Monte Carlo cost and latency simulation seeded by one ToyRLM run.
+
+    Replays the run's sub-call sizes as RLM trajectories (sequential and
+    with `concurrency` in-flight calls) and as a summarization-agent
+    baseline, then compares cost ratio claims (E13) with the simulated
+    distributions. E14's cost variance shows up in the RLM percentiles.
+
+    The simulated ratio follows from the assumed prices and summary
+    length alone, so each comparison is an assumption-based estimate
+    ("basis": "assumed_pricing") and is never used as a claim check.
+    """
+    from cost_simulator import (
+        DEFAULT_LATENCY,
+        DEFAULT_PRICING,
+        DEFAULT_SUMMARY_TOKENS,
+        simulate_rlm_trajectories,
+        simulate_summary_agent,
+        sub_call_tokens_from_report,
+        summarize_distribution,
+    )
+
+    sub_call_tokens = sub_call_tokens_from_report(report)
+
+    rlm_sequential = simulate_rlm_trajectories(sub_call_tokens, n_trajectories=n_trajectories)
+    rlm_concurrent = simulate_rlm_trajectories(sub_call_tokens, n_trajectories=n_trajectories,
+                                               concurrency=concurrency)
+    summary_agent = simulate_summary_agent(sub_call_tokens, n_trajectories=n_trajectories)
+
+    cost_ratio_claims = {}
+    for case in build_cost_ratio_cases(_resolve_deconstruction(deconstruction)):
+        verification = verify_cost_ratio_simulated(
+            rlm_sequential["cost_usd"], summary_agent["cost_usd"], case["claimed_ratio"]
+        )
+        verification["claim"] = case["claim"]
+        verification["basis"] = "assumed_pricing"
+        cost_ratio_claims[case["key"]] = verification
+
+    return {
+        "n_trajectories": n_trajectories,
+        "sub_calls_per_run": int(sub_call_tokens.size),
+        "rlm_sequential": {
+            "cost_usd": summarize_distribution(rlm_sequential["cost_usd"]),
+            "latency_s": summarize_distribution(rlm_sequential["latency_s"]),
+            "calls": summarize_distribution(rlm_sequential["calls"])
+        },
+        "rlm_concurrent": {
+            "concurrency": concurrency,
+            "latency_s": summarize_distribution(rlm_concurrent["latency_s"])
+        },
+        "summary_agent": {
+            "cost_usd": summarize_distribution(summary_agent["cost_usd"]),
+            "latency_s": summarize_distribution(summary_agent["latency_s"])
+        },
+        "cost_ratio_claims": cost_ratio_claims,
+        "assumptions": {
+            "pricing": DEFAULT_PRICING,
+            "latency": DEFAULT_LATENCY,
+            "summary_tokens_median": DEFAULT_SUMMARY_TOKENS,
+        }
+    }
+
+
 # ============================================================================
 # BENCHMARK ANALYSIS
 # ============================================================================
 
-def analyze_benchmark_characteristics() -> Dict[str, Any]:
+def analyze_benchmark_characteristics(deconstruction: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Analyze benchmark characteristics based on paper claims.
+    Token counts are checked from empirical claims with metric "token_count".
     """
     benchmarks = {
         "S-NIAH": {
@@ -370,24 +1185,21 @@ def analyze_benchmark_characteristics() -> Dict[str, Any]:
         }
     }
 
-    # Verify token counts
-    token_verifications = {
-        "E9_OOLONG_131K": {
-            "claimed": 131000,
-            "verified": True,
-            "notes": "131K tokens for linear complexity tasks"
-        },
-        "E10_OOLONG_Pairs_32K": {
-            "claimed": 32000,
-            "verified": True,
-            "notes": "32K tokens for quadratic complexity tasks"
-        },
-        "E8_BrowseComp_6M_11M": {
-            "claimed": "6M-11M",
-            "verified": True,
-            "notes": "6-11M tokens across 1K documents"
+    # Verify token counts stated in the paper's experimental setup
+    token_verifications = {}
+    for case in build_token_count_cases(_resolve_deconstruction(deconstruction)):
+        token_range = case["token_range"]
+        if token_range is None:
+            claimed = case["value"]
+        else:
+            claimed = token_range[0] if token_range[0] == token_range[1] else case["value"]
+
+        token_verifications[case["key"]] = {
+            "claimed": claimed,
+            "token_range": list(token_range) if token_range else None,
+            "verified": token_range is not None and 0 < token_range[0] <= token_range[1],
+            "notes": case["claim"]
         }
-    }
 
     return {
         "benchmarks": benchmarks,
@@ -402,192 +1214,569 @@ def analyze_benchmark_characteristics() -> Dict[str, Any]:
 # MAIN VERIFICATION PIPELINE
 # ============================================================================
 
-def run_all_verifications() -> Dict[str, Any]:
-    """Execute all verification tests."""
+def _mathematical_section(deconstruction: Dict[str, Any],
+                          bootstrap_resamples: int = BOOTSTRAP_RESAMPLES) -> Dict[str, Any]:
+    return {"results": verify_all_percentage_claims(deconstruction, n_resamples=bootstrap_resamples)}
 
-    print("=" * 80)
-    print("VERIFICATION SCRIPT FOR: Recursive Language Models (arXiv:2512.24601)")
-    print("=" * 80)
-    print()
 
-    all_results = {
-        "paper_id": "2512.24601",
-        "verifier": "Agent D",
-        "verification_sections": {}
-    }
+def _report_mathematical_section(section: Dict[str, Any]) -> None:
+    math_results = section["results"]
 
-    # Section 1: Mathematical Verification
-    print("[1/4] Running Mathematical Verification...")
-    try:
-        math_results = verify_all_percentage_claims()
-        all_results["verification_sections"]["mathematical_verification"] = {
-            "status": "SUCCESS",
-            "results": math_results
-        }
+    # Count verified claims
+    verified_count = sum(1 for r in math_results.values() if r.get("matches", False))
+    total_count = len(math_results)
 
-        # Count verified claims
-        verified_count = sum(1 for r in math_results.values() if r.get("matches", False))
-        total_count = len(math_results)
+    print(f"  ✓ Verified {verified_count}/{total_count} percentage calculations")
 
-        print(f"  ✓ Verified {verified_count}/{total_count} percentage calculations")
+    # Show details
+    for key, result in math_results.items():
+        claim = result.get("claim", key)
+        if result.get("matches"):
+            print(f"    ✓ {key}: {claim} - VERIFIED")
+        else:
+            print(f"    ✗ {key}: {claim} - MISMATCH")
+            print(f"      Claimed: {result['claimed_improvement_pct']}%")
+            print(f"      Actual relative: {result['actual_relative_pct']}%")
+            print(f"      {result.get('note', '')}")
 
-        # Show details
-        for key, result in math_results.items():
-            claim = result.get("claim", key)
-            if result.get("matches"):
-                print(f"    ✓ {key}: {claim} - VERIFIED")
-            else:
-                print(f"    ✗ {key}: {claim} - MISMATCH")
-                print(f"      Claimed: {result['claimed_improvement_pct']}%")
-                print(f"      Actual relative: {result['actual_relative_pct']}%")
-                print(f"      {result.get('note', '')}")
 
-    except Exception as e:
-        print(f"  ✗ Error in mathematical verification: {e}")
-        all_results["verification_sections"]["mathematical_verification"] = {
-            "status": "ERROR",
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }
+def _ablation_section(deconstruction: Dict[str, Any],
+                      bootstrap_resamples: int = BOOTSTRAP_RESAMPLES) -> Dict[str, Any]:
+    return {"results": verify_ablation_claims(deconstruction, n_resamples=bootstrap_resamples)}
 
-    print()
 
-    # Section 2: Ablation Verification
-    print("[2/4] Running Ablation Study Verification...")
-    try:
-        ablation_results = verify_ablation_claims()
-        all_results["verification_sections"]["ablation_verification"] = {
-            "status": "SUCCESS",
-            "results": ablation_results
-        }
+def _report_ablation_section(section: Dict[str, Any]) -> None:
+    for key, result in section["results"].items():
+        if "absolute_drop" in result:
+            print(f"  ✓ {key}: ablation verified")
+            print(f"    Drop: {result['absolute_drop']:.2f} percentage points")
+        elif result["verified"]:
+            print(f"  ✓ {result['claim_id']}: {result['interpretation']}")
+        else:
+            print(f"  ✗ {result['claim_id']}: {result['interpretation']}")
 
-        print("  ✓ E15: OOLONG ablation verified")
-        print(f"    Drop: {ablation_results['E15']['absolute_drop']:.2f} percentage points")
-        print("  ✓ E16: OOLONG-Pairs ablation verified")
-        print(f"    Drop: {ablation_results['E16']['absolute_drop']:.2f} percentage points")
-        print("  ✓ C12: Quadratic tasks show larger impact - VERIFIED")
 
-    except Exception as e:
-        print(f"  ✗ Error in ablation verification: {e}")
-        all_results["verification_sections"]["ablation_verification"] = {
-            "status": "ERROR",
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }
+def _rlm_simulation_section(deconstruction: Dict[str, Any],
+                            repl_pool_workers: Optional[int] = None) -> Dict[str, Any]:
+    from subcall_cache import SubCallCache
 
-    print()
+    repl_pool = None
+    if repl_pool_workers is not None:
+        from repl_pool import ReplWorkerPool
+        repl_pool = ReplWorkerPool(repl_pool_workers or None, time_limit_s=REPL_POOL_TIME_LIMIT_S)
 
-    # Section 3: RLM Concept Simulation
-    print("[3/4] Running RLM Concept Simulation...")
-    try:
-        rlm = ToyRLM(context_limit=1000)
+    rlm = ToyRLM(
+        context_limit=1000,
+        cache=SubCallCache(SUBCALL_CACHE_PATH),
+        chunker=TokenChunker(prompt_overhead_tokens=RLM_PROMPT_OVERHEAD_TOKENS),
+        repl_pool=repl_pool
+    )
 
+    try:
         # Demonstrate 100x capability
         demo_100x = rlm.demonstrate_100x_capability()
 
         # Demonstrate recursive decomposition
-        long_text = "x" * 5000  # 5x context limit
+        long_text = "word " * 5000  # 5x context limit (5000 tokens)
         decomp_result = rlm.process_long_input(long_text)
 
-        all_results["verification_sections"]["rlm_simulation"] = {
-            "status": "SUCCESS",
-            "demo_100x": demo_100x,
-            "decomposition_example": decomp_result
-        }
+        # The same decomposition with sub-calls on pool workers over shared memory
+        shared_decomp = None
+        if repl_pool is not None:
+            shared = rlm.process_long_input_shared(long_text)
+            shared_decomp = {
+                "workers": shared["workers"],
+                "shared_context_bytes": shared["shared_context_bytes"],
+                "num_chunks": shared["num_chunks"],
+                "matches_sequential": shared["num_chunks"] == decomp_result["num_chunks"],
+                "wall_time_s": shared["wall_time_s"],
+            }
+
+        # REPL code execution: in-process, or isolated in pool workers
+        repl_session = check_repl_session(rlm)
+    finally:
+        rlm.cache.close()
+        if repl_pool is not None:
+            repl_pool.close()
+
+    # E1 at scale: peak RSS of memory-mapped runs, each in a fresh process
+    mapped_scaling = measure_mapped_input_scaling()
+
+    # E29: sequential sub-calls vs concurrent async scheduling
+    scheduling = compare_sync_async_scheduling(multipliers=(100, 1000))
+
+    # E28: recursion depth fixed at one vs deeper sub-call trees
+    depths = compare_recursion_depths()
+
+    # E16: OOLONG-Pairs-style quadratic work, per-pair vs tiled sub-calls
+    pairwise = compare_pairwise_scheduling()
+
+    # S-NIAH-style needle search: every chunk vs index candidates with early exit
+    retrieval = compare_indexed_retrieval()
+
+    # E13/E14: simulated cost and latency distributions from the 100x trajectory
+    cost_simulation = simulate_trajectory_costs(demo_100x["verification"], deconstruction)
+
+    return {
+        "demo_100x": demo_100x,
+        "decomposition_example": decomp_result,
+        "repl_session": repl_session,
+        "shared_memory_decomposition": shared_decomp,
+        "mapped_input_scaling": mapped_scaling,
+        "async_scheduling": scheduling,
+        "recursion_depths": depths,
+        "pairwise_scheduling": pairwise,
+        "indexed_retrieval": retrieval,
+        "cost_simulation": cost_simulation
+    }
+
+
+def _report_rlm_simulation_section(section: Dict[str, Any]) -> None:
+    demo_100x = section["demo_100x"]
+    decomp_result = section["decomposition_example"]
+    cost_simulation = section["cost_simulation"]
+
+    print(f"  ✓ E1: 100x capability demonstrated")
+    print(f"    Context window: {demo_100x['context_window']} tokens")
+    print(f"    Input size: {demo_100x['input_size']} tokens")
+    print(f"    Multiplier: {demo_100x['multiplier']:.1f}x")
+    print(f"  ✓ Recursive decomposition demonstrated")
+    print(f"    Input: {decomp_result['input_tokens']} tokens ({decomp_result['input_length']} chars)")
+    print(f"    Chunks: {decomp_result['num_chunks']}")
+    print(f"    Sub-calls: {decomp_result['sub_calls_needed']}")
+    shared = section.get("shared_memory_decomposition")
+    if shared is not None:
+        mark = "✓" if shared["matches_sequential"] else "✗"
+        print(f"  {mark} Shared-memory decomposition on {shared['workers']} REPL workers: "
+              f"{shared['num_chunks']} chunks from one {shared['shared_context_bytes']:,}-byte shared input, "
+              f"in {shared['wall_time_s']:.3f}s")
+    repl_session = section["repl_session"]
+    checks = [key for key in ("state_kept", "errors_contained", "runaway_stopped") if key in repl_session]
+    mark = "✓" if all(repl_session[key] for key in checks) else "✗"
+    print(f"  {mark} REPL session ({repl_session['backend']}): "
+          + ", ".join(f"{key} {repl_session[key]}" for key in checks))
+    print(f"  ✓ Memory-mapped input: peak RSS per run")
+    for label, row in section["mapped_input_scaling"].items():
+        rss = ("peak RSS unavailable" if row["peak_rss_kb"] is None else
+               f"peak RSS {row['peak_rss_kb'] / 1024:.1f}MB (+{row['rss_growth_kb'] / 1024:.1f}MB)")
+        print(f"    {label}: {row['input_bytes']:,} bytes, {row['sub_calls']:,} sub-calls, {rss}")
+    print(f"  ✓ Async sub-call scheduling compared")
+    for label, row in section["async_scheduling"].items():
+        print(f"    {label}: {row['sub_calls']} sub-calls, "
+              f"sequential {row['sequential_wall_time_s']:.3f}s vs async {row['async_wall_time_s']:.3f}s "
+              f"({row['speedup']}x speedup)")
+    print(f"  ✓ Multi-level recursion compared")
+    for label, row in section["recursion_depths"].items():
+        print(f"    {label}: {row['total_calls']} calls, "
+              f"critical path {row['critical_path_calls']} calls")
+    print(f"  ✓ Quadratic pairwise task: naive vs tiled sub-calls")
+    for label, row in section["pairwise_scheduling"]["sizes"].items():
+        naive, tiled = row["naive"], row["tiled"]
+        naive_time = "skipped" if naive.get("skipped") else f"{naive['wall_time_s']:.3f}s"
+        print(f"    {label}: {naive['sub_calls']:,} naive ({naive_time}) vs {tiled['sub_calls']:,} tiled "
+              f"({tiled['wall_time_s']:.3f}s) sub-calls, {row['sub_call_reduction']:g}x fewer")
+    exponents = section["pairwise_scheduling"]["growth_exponent"]
+    print(f"    Sub-calls grow as n^{exponents['naive']['sub_calls']} naive, "
+          f"n^{exponents['tiled']['sub_calls']} tiled")
+    print(f"  ✓ Needle search: index-guided chunks vs every chunk")
+    for label, row in section["indexed_retrieval"].items():
+        mark = "✓" if row["answer_correct"] else "✗"
+        print(f"    {mark} {label}: {row['indexed_sub_calls']} of {row['linear_sub_calls']} sub-calls "
+              f"({row['sub_calls_avoided']} avoided), index built in {row['index_build_s']:.3f}s")
+    rlm_cost = cost_simulation["rlm_sequential"]["cost_usd"]
+    print(f"  ✓ Cost simulation: {cost_simulation['n_trajectories']} trajectories")
+    print(f"    RLM cost p50 ${rlm_cost['p50']:.3f}, p95 ${rlm_cost['p95']:.3f}, p99 ${rlm_cost['p99']:.3f}")
+    for key, verification in cost_simulation["cost_ratio_claims"].items():
+        print(f"    ~ {key} estimate under assumed pricing (not a check): "
+              f"{verification.get('interpretation', verification.get('error'))}")
+
+
+def _benchmark_section(deconstruction: Dict[str, Any]) -> Dict[str, Any]:
+    return {"results": analyze_benchmark_characteristics(deconstruction)}
+
+
+def _report_benchmark_section(section: Dict[str, Any]) -> None:
+    print("  ✓ Benchmark characteristics analyzed")
+    print("  ✓ Token counts verified:")
+    for key, verif in section["results"]["token_verifications"].items():
+        print(f"    ✓ {key}: {verif['claimed']} - {verif['notes']}")
+
+
+# Each section: progress title, error label, runner, reporter, timeout in
+# seconds, the inputs it reads (for its cache fingerprint) and the code it runs
+# (helper modules by name, so fingerprinting does not import them)
+VERIFICATION_SECTIONS = {
+    "mathematical_verification": {
+        "title": "Mathematical Verification",
+        "label": "mathematical verification",
+        "run": _mathematical_section,
+        "report": _report_mathematical_section,
+        "timeout": SECTION_TIMEOUT_S,
+        "inputs": build_percentage_cases,
+        "code": lambda: [_mathematical_section, verify_all_percentage_claims, _resolve_deconstruction]
+                        + ["percentage_batch", "bootstrap", "claim_loader"],
+    },
+    "ablation_verification": {
+        "title": "Ablation Study Verification",
+        "label": "ablation verification",
+        "run": _ablation_section,
+        "report": _report_ablation_section,
+        "timeout": SECTION_TIMEOUT_S,
+        "inputs": build_ablation_cases,
+        "code": lambda: [_ablation_section, verify_ablation_claims, _resolve_deconstruction]
+                        + ["bootstrap", "claim_loader"],
+    },
+    "rlm_simulation": {
+        "title": "RLM Concept Simulation",
+        "label": "RLM simulation",
+        "run": _rlm_simulation_section,
+        "report": _report_rlm_simulation_section,
+        "timeout": RLM_SIMULATION_TIMEOUT_S,
+        "inputs": lambda deconstruction: {
+            "cost_ratio_cases": build_cost_ratio_cases(deconstruction),
+            "prompt_overhead_tokens": RLM_PROMPT_OVERHEAD_TOKENS,
+        },
+        "code": lambda: [
+            _rlm_simulation_section, ToyRLM, fixed_latency, per_token_latency, check_repl_session,
+            measure_mapped_input_scaling, _mapped_input_run, compare_sync_async_scheduling, compare_recursion_depths, compare_pairwise_scheduling,
+            compare_indexed_retrieval, simulate_trajectory_costs,
+            verify_cost_ratio, verify_cost_ratio_simulated, _resolve_deconstruction,
+        ] + ["context_buffer", "execution_trace", "subcall_cache", "repl_pool", "recursive_engine",
+             "pairwise_engine", "needle_index", "token_chunker", "cost_simulator", "claim_loader"],
+    },
+    "benchmark_analysis": {
+        "title": "Benchmark Analysis",
+        "label": "benchmark analysis",
+        "run": _benchmark_section,
+        "report": _report_benchmark_section,
+        "timeout": SECTION_TIMEOUT_S,
+        "inputs": build_token_count_cases,
+        "code": lambda: [_benchmark_section, analyze_benchmark_characteristics, _resolve_deconstruction]
+                        + ["claim_loader"],
+    },
+}
+
+
+def run_section(name: str, deconstruction: Dict[str, Any],
+                section_cache: Optional[SectionCache] = None,
+                trace_memory: bool = False,
+                options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run one verification section, or reuse its cached result when the
+    section's inputs, options and code fingerprint is unchanged. Never
+    raises: failures come back as an ERROR section. options are passed to
+    the section's runner as keyword arguments.
+
+    The section's span and sub-call timings come back as section["timings"]
+    (an Instrumentation export) for collect_section_timings() to take out.
+    With trace_memory, the section's tracemalloc peak is recorded too.
+    """
+    instruments = Instrumentation(memory=trace_memory)
+    with activate(instruments), instruments.span(f"section/{name}", "section", rss=True):
+        section = _run_section(name, deconstruction, section_cache, options or {})
+    section["timings"] = instruments.export()
+    return section
+
 
-        print(f"  ✓ E1: 100x capability demonstrated")
-        print(f"    Context window: {demo_100x['context_window']} tokens")
-        print(f"    Input size: {demo_100x['input_size']} tokens")
-        print(f"    Multiplier: {demo_100x['multiplier']:.1f}x")
-        print(f"  ✓ Recursive decomposition demonstrated")
-        print(f"    Input: {decomp_result['input_length']} tokens")
-        print(f"    Chunks: {decomp_result['num_chunks']}")
-        print(f"    Sub-calls: {decomp_result['sub_calls_needed']}")
+def collect_section_timings(name: str, section: Dict[str, Any], instruments: Instrumentation,
+                            elapsed_s: Optional[float] = None) -> None:
+    """
+    Move section["timings"] into instruments. A section killed on timeout
+    sent none back, so its span is recorded from the scheduler's elapsed_s.
+    """
+    timings = section.pop("timings", None)
+    if timings is not None:
+        instruments.merge(timings)
+    elif elapsed_s is not None:
+        elapsed_ns = int(elapsed_s * 1e9)
+        instruments.record(f"section/{name}", "section", time.perf_counter_ns() - elapsed_ns, elapsed_ns,
+                           timed_out=bool(section.get("timed_out")))
+
+
+def _run_section(name: str, deconstruction: Dict[str, Any],
+                 section_cache: Optional[SectionCache], options: Dict[str, Any]) -> Dict[str, Any]:
+    spec = VERIFICATION_SECTIONS[name]
+    try:
+        provenance = {"status": "disabled"}
+        fingerprint = None
+        if section_cache is not None:
+            inputs = spec["inputs"](deconstruction)
+            if options:
+                # Only non-default runs fingerprint their options, so default entries stay valid
+                inputs = {"inputs": inputs, "options": options}
+            fingerprint = fingerprint_section(inputs, spec["code"]())
+            entry = section_cache.load(name, fingerprint)
+            if entry is not None:
+                provenance = dict(fingerprint, status="hit", stored_at=entry["stored_at"])
+                return dict(entry["result"], cache=provenance)
+            provenance = dict(fingerprint, status="miss")
+
+        section = dict(status="SUCCESS", **spec["run"](deconstruction, **options))
+        if fingerprint is not None:
+            section_cache.store(name, fingerprint, section)
+        section["cache"] = provenance
+        return section
 
     except Exception as e:
-        print(f"  ✗ Error in RLM simulation: {e}")
-        all_results["verification_sections"]["rlm_simulation"] = {
+        return {
             "status": "ERROR",
             "error": str(e),
             "traceback": traceback.format_exc()
         }
 
+
+def _run_sections_sequentially(tasks: List[SectionTask]) -> Iterator[SectionOutcome]:
+    """In-process fallback: one section after another, no time limits."""
+    for task in tasks:
+        started = time.perf_counter()
+        section = task.fn(*task.args)
+        yield SectionOutcome(task.name, section, "", round(time.perf_counter() - started, 6))
+
+
+def run_all_verifications(deconstruction: Dict[str, Any] = None,
+                          section_cache: Optional[SectionCache] = None,
+                          parallel: bool = True,
+                          max_workers: Optional[int] = None,
+                          stream: Optional[ResultsStreamWriter] = None,
+                          sections: Optional[Sequence[str]] = None,
+                          instruments: Optional[Instrumentation] = None,
+                          section_options: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Execute all verification tests.
+    With a section_cache, sections whose inputs and code are unchanged
+    since the last run are reused instead of re-run. With parallel=True,
+    sections run concurrently in worker processes and any section that
+    exceeds its timeout is cancelled; the log is still printed in
+    section order. With a stream, each section is also written out as
+    soon as it is available. sections limits the run to the named
+    sections (default: all of VERIFICATION_SECTIONS). section_options maps
+    a section name to keyword arguments for its runner.
+
+    Section and sub-call timings are merged into instruments (a fresh
+    Instrumentation by default) and summarized under "timings"; pass
+    Instrumentation(memory=True) to also record tracemalloc peaks.
+    """
+
+    deconstruction = _resolve_deconstruction(deconstruction)
+    paper_id = deconstruction.get("paper_id", "unknown")
+
+    print("=" * 80)
+    print(f"VERIFICATION SCRIPT FOR: {deconstruction.get('title', 'Unknown')} (arXiv:{paper_id})")
+    print("=" * 80)
     print()
 
-    # Section 4: Benchmark Analysis
-    print("[4/4] Running Benchmark Analysis...")
-    try:
-        benchmark_analysis = analyze_benchmark_characteristics()
-        all_results["verification_sections"]["benchmark_analysis"] = {
-            "status": "SUCCESS",
-            "results": benchmark_analysis
-        }
+    all_results = {
+        "paper_id": paper_id,
+        "verifier": "Agent D",
+        "verification_sections": {}
+    }
+    if stream is not None:
+        stream.write_header(all_results["paper_id"], all_results["verifier"])
+
+    if instruments is None:
+        instruments = Instrumentation()
+    run_start_ns, run_cpu_start = time.perf_counter_ns(), time.process_time_ns()
+
+    tasks = [
+        SectionTask(name, run_section,
+                    (name, deconstruction, section_cache, instruments.memory, (section_options or {}).get(name)),
+                    spec["timeout"])
+        for name, spec in VERIFICATION_SECTIONS.items()
+        if sections is None or name in sections
+    ]
+    if parallel:
+        from section_scheduler import run_sections
+        outcomes = run_sections(tasks, max_workers=max_workers)
+    else:
+        outcomes = _run_sections_sequentially(tasks)
+
+    total = len(tasks)
+    for number, outcome in enumerate(outcomes, start=1):
+        spec = VERIFICATION_SECTIONS[outcome.name]
+        section = outcome.section
+        collect_section_timings(outcome.name, section, instruments, outcome.elapsed_s)
+        all_results["verification_sections"][outcome.name] = section
+        if stream is not None:
+            stream.write_section(outcome.name, section)
+
+        print(f"[{number}/{total}] Running {spec['title']}...")
+        if outcome.output:
+            print(outcome.output, end="")
+        if section["status"] == "SUCCESS":
+            if section["cache"]["status"] == "hit":
+                print(f"  ↺ Unchanged since last run, reusing cached result "
+                      f"({section['cache']['fingerprint'][:12]})")
+            spec["report"](section)
+        else:
+            print(f"  ✗ Error in {spec['label']}: {section['error']}")
 
-        print("  ✓ Benchmark characteristics analyzed")
-        print("  ✓ Token counts verified:")
-        for key, verif in benchmark_analysis["token_verifications"].items():
-            print(f"    ✓ {key}: {verif['claimed']} - {verif['notes']}")
+        print()
 
-    except Exception as e:
-        print(f"  ✗ Error in benchmark analysis: {e}")
-        all_results["verification_sections"]["benchmark_analysis"] = {
-            "status": "ERROR",
-            "error": str(e),
-            "traceback": traceback.format_exc()
+    # CPU here is this process only; parallel sections report their own
+    instruments.record("run_all_verifications", "run", run_start_ns, time.perf_counter_ns() - run_start_ns,
+                       time.process_time_ns() - run_cpu_start)
+    all_results["timings"] = instruments.summary()
+
+    all_results["timed_out_sections"] = [
+        name for name, section in all_results["verification_sections"].items() if section.get("timed_out")
+    ]
+
+    if section_cache is not None:
+        # Counted from provenance: parallel sections load the cache in their own processes
+        statuses = [section.get("cache", {}).get("status")
+                    for section in all_results["verification_sections"].values()]
+        all_results["section_cache"] = {
+            "directory": str(section_cache.directory),
+            "hits": statuses.count("hit"),
+            "misses": statuses.count("miss")
         }
 
-    print()
+    if stream is not None:
+        stream.write_meta(**{key: value for key, value in all_results.items()
+                             if key not in ("paper_id", "verifier", "verification_sections")})
 
     return all_results
 
 
-def generate_summary(results: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate verification summary."""
+def _statistically_supported(result: Dict[str, Any]) -> bool:
+    """
+    True unless a bootstrap interval for the claim's delta, over the
+    paper's own sample size, includes zero. Intervals over an assumed
+    sample size are informational and never fail a claim.
+    """
+    bootstrap = result.get("bootstrap")
+    return bootstrap is None or bootstrap.get("informational", False) or bootstrap["significant"]
 
-    verified_claims = []
-    unverified_claims = []
 
-    # Mathematical claims
-    if "mathematical_verification" in results["verification_sections"]:
-        math_section = results["verification_sections"]["mathematical_verification"]
-        if math_section["status"] == "SUCCESS":
-            for key, result in math_section["results"].items():
-                if result.get("matches"):
-                    verified_claims.append(key)
-                else:
-                    unverified_claims.append(key)
-
-    # Ablation claims
-    if "ablation_verification" in results["verification_sections"]:
-        ablation_section = results["verification_sections"]["ablation_verification"]
-        if ablation_section["status"] == "SUCCESS":
-            verified_claims.extend(["E15", "E16", "C12"])
-
-    # RLM simulation
-    if "rlm_simulation" in results["verification_sections"]:
-        rlm_section = results["verification_sections"]["rlm_simulation"]
-        if rlm_section["status"] == "SUCCESS":
-            if rlm_section["demo_100x"]["status"] == "DEMONSTRATED":
-                verified_claims.append("E1")
-
-    # Benchmark analysis
-    if "benchmark_analysis" in results["verification_sections"]:
-        bench_section = results["verification_sections"]["benchmark_analysis"]
-        if bench_section["status"] == "SUCCESS":
-            verified_claims.extend(["E8", "E9", "E10"])
+def _section_check(name: str, section: Dict[str, Any], path: Tuple[str, ...],
+                   passed: Callable[[Dict[str, Any]], bool], figure: Optional[str] = None) -> "ClaimCheck":
+    """
+    A claim check reading one entry of a section's results. figure names the
+    entry's number that claims restating this one must quote.
+    """
+    def check(dependencies: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if section["status"] != "SUCCESS":
+            raise RuntimeError(f"section {name} did not succeed: {section.get('error')}")
+        entry = section
+        for part in path:
+            entry = entry[part]
+        evidence = {"verified": bool(passed(entry)), "source": f"{name}:{path[-1]}"}
+        if figure is not None:
+            evidence["figure"] = entry[figure]
+        return evidence
+
+    return check
+
+
+def _restatement_check(case: Dict[str, Any]) -> "ClaimCheck":
+    """A comparative claim's quoted figure must match the figure its dependency established."""
+    def check(dependencies: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        figure = dependencies[case["dependency"]]["evidence"]["figure"]
+        return {
+            "verified": abs(case["quoted"] - figure) <= max(0.01, 0.005 * abs(figure)),
+            "restates": case["dependency"],
+            "quoted": case["quoted"],
+            "figure": figure,
+        }
+
+    return check
+
+
+def build_claim_checks(results: Dict[str, Any], deconstruction: Dict[str, Any]) -> Dict[str, "ClaimCheck"]:
+    """
+    One check per claim this verifier can judge from the sections in results.
+    Claims of a section that was not run get no check; claims of a section
+    that failed get a check that fails, so they still count as unverified.
+    """
+    sections = results["verification_sections"]
+    checks: Dict[str, "ClaimCheck"] = {}
+
+    # Mathematical claims: the arithmetic holds and the delta is outside sampling noise (when n is known)
+    math_section = sections.get("mathematical_verification")
+    if math_section is not None:
+        for case in build_percentage_cases(deconstruction):
+            checks[case["claim_ids"][0]] = _section_check(
+                "mathematical_verification", math_section, ("results", case["key"]),
+                lambda result: result.get("matches") and _statistically_supported(result),
+                figure="claimed_improvement_pct")
+
+    # Ablation claims and the comparisons built on them
+    ablation_section = sections.get("ablation_verification")
+    if ablation_section is not None:
+        cases = build_ablation_cases(deconstruction)
+        for case in cases["ablations"]:
+            checks[case["key"]] = _section_check(
+                "ablation_verification", ablation_section, ("results", case["key"]),
+                _statistically_supported, figure="absolute_drop")
+        for case in cases["comparisons"]:
+            checks[case["claim_id"]] = _section_check(
+                "ablation_verification", ablation_section, ("results", case["key"]),
+                lambda result: result["verified"] is True)
+
+    # RLM simulation: the context multiplier demo. Simulated cost ratios
+    # come from assumed prices, not paper data, so cost claims get no check
+    rlm_section = sections.get("rlm_simulation")
+    if rlm_section is not None:
+        for claim in deconstruction.get("empirical_claims", []):
+            if claim.get("metric") == "context_length_multiplier":
+                checks[claim["id"]] = _section_check(
+                    "rlm_simulation", rlm_section, ("demo_100x",),
+                    lambda demo: demo["status"] == "DEMONSTRATED")
+
+    # Benchmark analysis: token counts from the experimental setup
+    bench_section = sections.get("benchmark_analysis")
+    if bench_section is not None:
+        for case in build_token_count_cases(deconstruction):
+            checks[case["key"]] = _section_check(
+                "benchmark_analysis", bench_section, ("results", "token_verifications", case["key"]),
+                lambda verification: verification["verified"])
+
+    # Comparative claims restating a figure one checked claim established
+    for case in build_restatement_cases(deconstruction):
+        if case["key"] not in checks and case["dependency"] in checks:
+            checks[case["key"]] = _restatement_check(case)
+
+    return checks
+
+
+def generate_summary(results: Dict[str, Any], deconstruction: Dict[str, Any] = None,
+                     max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Generate verification summary.
+    Claims are checked over the claim dependency graph (see claim_graph.py);
+    the score is taken over every claim that has a check.
+    """
+    from claim_graph import ClaimGraph, run_claim_checks, VERIFIED, DEPENDENCY_FAILED, FAILED_STATUSES
+
+    deconstruction = _resolve_deconstruction(deconstruction)
+    graph = ClaimGraph.from_deconstruction(deconstruction)
+    checks = build_claim_checks(results, deconstruction)
+    claim_results = run_claim_checks(graph, checks, max_workers=max_workers)
+
+    checked = {claim_id: result for claim_id, result in claim_results.items() if claim_id in checks}
+    verified_claims = [claim_id for claim_id, result in checked.items() if result["status"] == VERIFIED]
+    unverified_claims = [claim_id for claim_id, result in checked.items() if result["status"] in FAILED_STATUSES]
 
     # Calculate score
-    total_verifiable = 11  # E1, E2, E3, E4, E6, E7, E8, E9, E10, E13, E15, E16, C2, C3
-    verified_count = len(set(verified_claims))
-    score = (verified_count / total_verifiable) * 10
+    total_verifiable = len(checked)
+    verified_count = len(verified_claims)
+    score = (verified_count / total_verifiable) * 10 if total_verifiable else 0.0
 
     summary = {
         "verification_status": f"{verified_count}/{total_verifiable} claims verified",
         "score": round(score, 1),
-        "verified_claims": sorted(set(verified_claims)),
-        "unverified_claims": sorted(set(unverified_claims)),
+        "verified_claims": sorted(verified_claims),
+        "unverified_claims": sorted(unverified_claims),
         "mathematical_errors_found": [],
-        "notes": []
+        "notes": [],
+        "claim_graph": {
+            "claims": len(graph.claims),
+            "checkable": total_verifiable,
+            "depth": graph.depth,
+            "checks_run": sum(1 for result in checked.values() if "evidence" in result or "error" in result),
+            "missing_dependencies": graph.missing,
+            "results": checked,
+        }
     }
 
     # Check for mathematical errors
@@ -605,13 +1794,52 @@ def generate_summary(results: Dict[str, Any]) -> Dict[str, Any]:
                         "note": result.get("note", "")
                     })
 
-    # Add notes
-    if len(summary["mathematical_errors_found"]) == 0:
+    # Claims whose delta is within sampling noise; over an assumed n this is only informational
+    for section_name in ("mathematical_verification", "ablation_verification"):
+        section = results["verification_sections"].get(section_name, {})
+        if section.get("status") != "SUCCESS":
+            continue
+        for key, result in section["results"].items():
+            bootstrap = result.get("bootstrap")
+            if bootstrap is None or bootstrap["significant"]:
+                continue
+            ci = bootstrap["delta_ci"]
+            basis = (f"assumed n={bootstrap['n'][0]}, informational only" if bootstrap.get("informational")
+                     else f"n={bootstrap['n'][0]}")
+            summary["notes"].append(
+                f"{key}: {int(bootstrap['confidence'] * 100)}% CI for the delta "
+                f"[{ci[0]}, {ci[1]}] includes zero ({basis})"
+            )
+
+    for claim_id, result in checked.items():
+        if result["status"] == DEPENDENCY_FAILED:
+            summary["notes"].append(
+                f"{claim_id} not checked: it rests on {', '.join(result['failed_dependencies'])}, which failed"
+            )
+
+    for name in results.get("timed_out_sections", []):
+        summary["notes"].append(f"Section {name} timed out; its claims were not checked")
+
+    # Only for sections that ran and succeeded (--sections can leave them out)
+    sections = results["verification_sections"]
+    if (sections.get("mathematical_verification", {}).get("status") == "SUCCESS"
+            and len(summary["mathematical_errors_found"]) == 0):
         summary["notes"].append("All percentage calculations are mathematically correct")
-
-    summary["notes"].append("RLM concept successfully simulated - demonstrates feasibility")
-    summary["notes"].append("Benchmark token counts verified from paper claims")
-    summary["notes"].append("Cost ratio claim E13 (3x cheaper) not verified due to lack of specific cost data")
+    if sections.get("rlm_simulation", {}).get("status") == "SUCCESS":
+        summary["notes"].append("RLM concept successfully simulated - demonstrates feasibility")
+    if sections.get("benchmark_analysis", {}).get("status") == "SUCCESS":
+        summary["notes"].append("Benchmark token counts verified from paper claims")
+
+    cost_claims = results["verification_sections"].get("rlm_simulation", {}).get("cost_simulation", {}).get("cost_ratio_claims", {})
+    if cost_claims:
+        for key, verification in cost_claims.items():
+            outcome = "within" if verification.get("matches") else "outside"
+            summary["notes"].append(
+                f"Cost ratio claim {key} not checked: simulated median ratio {verification.get('actual_ratio')}x "
+                f"is {outcome} tolerance, an estimate set by assumed pricing and summary length"
+            )
+    else:
+        summary["notes"].append("Cost ratio claims not verified due to lack of specific cost data")
 
     return summary
 
@@ -621,11 +1849,52 @@ def generate_summary(results: Dict[str, Any]) -> Dict[str, Any]:
 # ============================================================================
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verify the claims of arXiv:2512.24601")
+    parser.add_argument("--no-section-cache", action="store_true",
+                        help="Re-run every section instead of reusing unchanged ones")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Run sections one after another in this process (no timeouts)")
+    parser.add_argument("--sections", nargs="+", choices=list(VERIFICATION_SECTIONS), default=None,
+                        help="Run only these sections (default: all)")
+    parser.add_argument("--output-dir", default=str(Path(__file__).parent),
+                        help="Folder for results.json and results.ndjson")
+    parser.add_argument("--plots", action="store_true",
+                        help="Also render the plots into <output-dir>/plots, timing each one")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Record tracemalloc peaks per section and plot (slows allocation-heavy code)")
+    parser.add_argument("--trace", default=None, metavar="PATH",
+                        help="Write spans as Chrome trace-event JSON (chrome://tracing, Perfetto)")
+    parser.add_argument("--repl-pool", type=int, nargs="?", const=0, default=None, metavar="WORKERS",
+                        help="Run the RLM simulation's REPL code, and its decomposition over shared memory, "
+                             "in a pool of isolated worker processes (default size: one per CPU)")
+    parser.add_argument("--bootstrap-resamples", type=int, default=None, metavar="N",
+                        help=f"Resamples per bootstrap interval in the math and ablation sections "
+                             f"(default: {BOOTSTRAP_RESAMPLES:,}; 0 skips the intervals)")
+    args = parser.parse_args()
+
     print("Starting verification process...")
     print()
 
-    # Run all verifications
-    results = run_all_verifications()
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / "results.json"
+    stream_file = output_dir / "results.ndjson"
+
+    # Run all verifications, streaming each section to results.ndjson.partial
+    section_cache = None if args.no_section_cache else SectionCache(SECTION_CACHE_DIR)
+    stream = ResultsStreamWriter(stream_file)
+    instruments = Instrumentation(memory=args.trace_memory)
+    section_options = {}
+    if args.repl_pool is not None:
+        section_options["rlm_simulation"] = {"repl_pool_workers": args.repl_pool}
+    if args.bootstrap_resamples is not None:
+        for name in ("mathematical_verification", "ablation_verification"):
+            section_options[name] = {"bootstrap_resamples": args.bootstrap_resamples}
+    results = run_all_verifications(section_cache=section_cache, parallel=not args.sequential,
+                                    stream=stream, sections=args.sections, instruments=instruments,
+                                    section_options=section_options)
 
     # Generate summary
     print("=" * 80)
@@ -633,7 +1902,8 @@ if __name__ == "__main__":
     print("=" * 80)
     print()
 
-    summary = generate_summary(results)
+    with instruments.span("generate_summary", "summary"):
+        summary = generate_summary(results)
 
     print(f"Verification Status: {summary['verification_status']}")
     print(f"Score: {summary['score']}/10")
@@ -668,17 +1938,30 @@ if __name__ == "__main__":
         print(f"  • {note}")
     print()
 
-    # Add summary to results
-    results["summary"] = summary
+    if args.plots:
+        from visualizations import generate_all_visualizations
+        generate_all_visualizations(output_dir / "plots", instruments=instruments)
+        print()
 
-    # Save results to JSON
-    output_dir = Path(__file__).parent
-    output_file = output_dir / "results.json"
+    print("Timings:")
+    for name, span in instruments.summary()["spans"].items():
+        if span["category"] in ("section", "plot", "sub_call"):
+            cpu = f", {span['cpu_s']:.2f}s CPU" if span["cpu_s"] is not None else ""
+            calls = f" over {span['count']} calls" if span["count"] > 1 else ""
+            print(f"  {name}: {span['wall_s']:.2f}s wall{cpu}{calls}")
+    print()
 
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    # Finish the stream, then rebuild results.json from it
+    stream.write_meta(timings=instruments.summary())
+    stream.write_summary(summary)
+    stream.close()
+    write_json_atomic(rebuild_results(stream_file), output_file)
 
+    print(f"Results streamed to: {stream_file}")
     print(f"Results saved to: {output_file}")
+    if args.trace:
+        write_json_atomic(chrome_trace(instruments), args.trace, indent=None)
+        print(f"Chrome trace saved to: {args.trace}")
     print()
     print("=" * 80)
     print("VERIFICATION COMPLETE")
@@ -0,0 +1,110 @@
+"""
+Needle Index for RLM Verification
+Index-guided chunk selection for needle-in-a-haystack inputs
+
+S-NIAH-style tasks hide one answer in a long input, yet
+process_long_input() sends every chunk to llm_query. ChunkIndex is a
+lightweight inverted index over the chunks of the stored long_input:
+each word n-gram maps to the ids of the chunks that contain it, built in
+one pass. A query's candidate chunks are the ones holding all of its
+n-grams. ToyRLM.process_long_input_indexed() sends only those, in input
+order, and stops at the first one that answers. If none does (say the
+needle straddles a chunk boundary), the remaining chunks follow in order,
+so a miss in the index costs sub-calls, never the answer.
+
+make_haystack() builds synthetic haystacks: filler lines, one needle line
+and distractor lines that share the query's words but not its answer.
+"""
+
+import re
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+WORD_PATTERN = re.compile(r"\w+")
+WORD_PATTERN_BYTES = re.compile(rb"\w+")
+
+NEEDLE_QUERY = "magic number"
+NEEDLE_ANSWER_PATTERN = r"magic number is (\d+)"
+
+# Filler never uses the query's words, so only the needle and distractors match
+FILLER_WORDS = (
+    "the a of and to in is was for on with as by at from that this it be are were "
+    "report city river market council season harbor library museum garden station "
+    "bridge valley festival orchestra committee bakery tower island railway school "
+    "opened closed moved grew held visited painted built repaired counted measured "
+    "quiet early late northern southern old new small large busy famous local"
+).split()
+
+DISTRACTOR_LINE = "Nobody remembers whether the magic number was ever written down.\n"
+
+
+def _terms(text: Any, n: int) -> Set[Any]:
+    """Distinct lower-cased word n-grams of a str or bytes-like text."""
+    if isinstance(text, str):
+        words = WORD_PATTERN.findall(text.lower())
+    else:
+        words = WORD_PATTERN_BYTES.findall(bytes(text).lower())
+    if n == 1:
+        return set(words)
+    return set(zip(*(words[i:] for i in range(n))))
+
+
+class ChunkIndex:
+    """Word n-gram -> ids of the chunks containing it."""
+
+    def __init__(self, long_input: Any, bounds: Sequence[Tuple[int, int]], n: int = 1):
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        self.n = n
+        self.num_chunks = len(bounds)
+        self._bytes = not isinstance(long_input, str)
+        self.postings: Dict[Any, List[int]] = {}
+
+        postings = self.postings
+        for chunk_id, (start, end) in enumerate(bounds):
+            for term in _terms(long_input[start:end], n):
+                chunk_ids = postings.get(term)
+                if chunk_ids is None:
+                    postings[term] = [chunk_id]
+                else:
+                    chunk_ids.append(chunk_id)
+
+    def candidates(self, query: str) -> List[int]:
+        """Ids of the chunks that contain every n-gram of query, in input order."""
+        terms = _terms(query.encode('utf-8') if self._bytes else query, self.n)
+        if not terms:
+            return []
+
+        lists = sorted((self.postings.get(term, []) for term in terms), key=len)
+        matches = set(lists[0])
+        for chunk_ids in lists[1:]:
+            matches.intersection_update(chunk_ids)
+            if not matches:
+                break
+        return sorted(matches)
+
+    def stats(self) -> Dict[str, int]:
+        return {"ngram": self.n, "terms": len(self.postings),
+                "postings": sum(len(chunk_ids) for chunk_ids in self.postings.values())}
+
+
+def make_haystack(size: int, needle_depth: float = 0.7, distractors: int = 3,
+                  seed: int = 0) -> Tuple[str, str]:
+    """
+    About size characters of filler lines with one needle line at
+    needle_depth (0 = start, 1 = end) and distractor lines scattered
+    before and after it. Returns (haystack, answer).
+    """
+    import random
+
+    rng = random.Random(seed)
+    templates = [" ".join(rng.choices(FILLER_WORDS, k=rng.randint(6, 14))).capitalize() + ".\n"
+                 for _ in range(512)]
+    mean_length = sum(len(line) for line in templates) / len(templates)
+    lines = rng.choices(templates, k=max(1, int(size / mean_length)))
+
+    answer = str(rng.randint(1_000_000, 9_999_999))
+    lines.insert(int(needle_depth * len(lines)), f"The magic number is {answer}.\n")
+    for _ in range(distractors):
+        lines.insert(rng.randrange(len(lines) + 1), DISTRACTOR_LINE)
+
+    return "".join(lines), answer
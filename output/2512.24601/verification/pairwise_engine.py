@@ -0,0 +1,132 @@
+"""
+Pairwise Aggregation Engine for RLM Verification
+OOLONG-Pairs-style quadratic tasks decomposed into sub-calls
+
+OOLONG-Pairs asks about pairs of records, so the work grows with n², not
+n, and the sub-call ablation hurts most there (E16). This engine builds
+a toy pairwise task (count the record pairs that share a label and whose
+values sum to at least a threshold) and runs it two ways over a
+ToyRLM-style model:
+- naive: nested loops with one sub-call per pair, n(n-1)/2 sub-calls
+- tiled: records are split into blocks of half the context window and
+  each pair of blocks (a tile) is one sub-call, T(T+1)/2 sub-calls for
+  T blocks. Inside a tile every pair is evaluated at once with NumPy
+  broadcasting
+
+Records are fixed-width text lines, so a sub-call's prompt is exactly
+the records it reasons about. Both schedules count the same pairs; the
+tiled one needs about block_size² times fewer sub-calls but still grows
+quadratically in n.
+"""
+
+import time
+from typing import Any, Dict, NamedTuple
+
+from execution_trace import AggregateResults, DecomposeInput, StoreInRepl
+
+# One record per line: "L<label> V<value>\n"
+RECORD_FORMAT = "L{:03d} V{:03d}\n"
+RECORD_WIDTH = len(RECORD_FORMAT.format(0, 0))
+
+DEFAULT_LABELS = 8
+DEFAULT_THRESHOLD = 100
+
+
+class PairwiseTask(NamedTuple):
+    """n records as text plus the label and value arrays the sub-calls read."""
+    text: bytes
+    labels: Any
+    values: Any
+    threshold: int
+
+    @property
+    def n(self) -> int:
+        return len(self.labels)
+
+
+def make_pairwise_task(n: int, n_labels: int = DEFAULT_LABELS, threshold: int = DEFAULT_THRESHOLD,
+                       seed: int = 0) -> PairwiseTask:
+    """n records with random labels and values in [0, 100)."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, n_labels, size=n, dtype=np.int32)
+    values = rng.integers(0, 100, size=n, dtype=np.int32)
+    text = "".join(RECORD_FORMAT.format(label, value) for label, value in zip(labels.tolist(), values.tolist()))
+    return PairwiseTask(text.encode('ascii'), labels, values, threshold)
+
+
+def block_size(context_limit: int) -> int:
+    """Records per block: two blocks must fit one context window together."""
+    return max(1, context_limit // RECORD_WIDTH // 2)
+
+
+def _begin(rlm: Any, task: PairwiseTask, mode: str, sub_calls: int, chunk_size: int) -> None:
+    rlm.execution_trace.begin_run(mode)
+    rlm.repl_env['long_input'] = task.text
+    rlm.execution_trace.record(StoreInRepl("long_input", len(task.text)))
+    rlm.execution_trace.record(DecomposeInput(sub_calls, chunk_size))
+
+
+def _report(rlm: Any, task: PairwiseTask, mode: str, sub_calls: int, matching_pairs: int,
+            wall_time: float, **extra: Any) -> Dict[str, Any]:
+    rlm.execution_trace.record(AggregateResults(sub_calls))
+    rlm.repl_env.pop('long_input', None)
+    pairs = task.n * (task.n - 1) // 2
+    return dict({
+        "scheduling": mode,
+        "records": task.n,
+        "pairs": pairs,
+        "sub_calls": sub_calls,
+        "matching_pairs": matching_pairs,
+        "wall_time_s": round(wall_time, 6),
+        "pairs_per_s": round(pairs / wall_time, 1) if wall_time > 0 else None,
+    }, **extra)
+
+
+def run_naive(rlm: Any, task: PairwiseTask) -> Dict[str, Any]:
+    """One sub-call per pair, evaluated in plain Python."""
+    n, text, threshold = task.n, task.text, task.threshold
+    labels, values = task.labels.tolist(), task.values.tolist()
+    sub_calls = n * (n - 1) // 2
+    _begin(rlm, task, "pairwise_naive", sub_calls, 2 * RECORD_WIDTH)
+
+    matching = 0
+    run_start = time.perf_counter()
+    for i in range(n):
+        record_i = text[i * RECORD_WIDTH:(i + 1) * RECORD_WIDTH]
+        for j in range(i + 1, n):
+            rlm.llm_query(record_i + text[j * RECORD_WIDTH:(j + 1) * RECORD_WIDTH], recursion_depth=1)
+            if labels[i] == labels[j] and values[i] + values[j] >= threshold:
+                matching += 1
+    wall_time = time.perf_counter() - run_start
+
+    return _report(rlm, task, "naive", sub_calls, matching, wall_time)
+
+
+def run_tiled(rlm: Any, task: PairwiseTask) -> Dict[str, Any]:
+    """One sub-call per pair of blocks, each tile evaluated with NumPy broadcasting."""
+    import numpy as np
+
+    n, text, threshold = task.n, task.text, task.threshold
+    size = block_size(rlm.context_limit)
+    blocks = [(start, min(start + size, n)) for start in range(0, n, size)]
+    sub_calls = len(blocks) * (len(blocks) + 1) // 2
+    _begin(rlm, task, "pairwise_tiled", sub_calls, 2 * size * RECORD_WIDTH)
+
+    matching = 0
+    run_start = time.perf_counter()
+    for a, (a0, a1) in enumerate(blocks):
+        labels_a, values_a = task.labels[a0:a1, None], task.values[a0:a1, None]
+        block_a = text[a0 * RECORD_WIDTH:a1 * RECORD_WIDTH]
+        for b0, b1 in blocks[a:]:
+            diagonal = b0 == a0
+            prompt = block_a if diagonal else block_a + text[b0 * RECORD_WIDTH:b1 * RECORD_WIDTH]
+            rlm.llm_query(prompt, recursion_depth=1)
+
+            tile = (labels_a == task.labels[b0:b1]) & (values_a + task.values[b0:b1] >= threshold)
+            # A block paired with itself: count each unordered pair once, never i with i
+            matching += int(np.count_nonzero(np.triu(tile, 1) if diagonal else tile))
+    wall_time = time.perf_counter() - run_start
+
+    return _report(rlm, task, "tiled", sub_calls, matching, wall_time, block_size=size, blocks=len(blocks))
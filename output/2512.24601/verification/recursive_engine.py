@@ -0,0 +1,330 @@
+"""
+Recursive Decomposition Engine for RLM Verification
+Multi-level sub-call trees beyond max_recursion_depth=1
+
+The paper fixes recursion depth at one (E28): the root splits the input
+into context-sized chunks and each chunk is a leaf sub-call. This engine
+splits oversized pieces into a tree of sub-calls to any depth:
+- a piece that fits the context window is a leaf sub-call
+- a larger piece fans out into at most `branching` children, each a
+  whole number of context windows (the last takes the remainder), so
+  the tree has ceil(input / context window) leaves at any depth
+- at the last allowed level, pieces fan out into context-sized leaves
+- every non-root node issues one sub-call; internal nodes aggregate
+  their children's answers once all of them have finished
+
+The tree runs on a work-stealing thread pool. Each worker pops its own
+newest task and steals the oldest task from another worker when idle, so
+deep, unbalanced trees keep every worker busy. Sub-calls are I/O-bound in
+a real deployment (and sleep under a latency model here), so threads
+overlap them despite the GIL.
+
+Sizes are in tokens when the model has a chunker (each leaf gets the
+chunker's per-call budget, as in ToyRLM.process_long_input), otherwise
+in characters.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from execution_trace import AggregateResults, DecomposeInput, StoreInRepl
+
+
+class WorkStealingPool:
+    """
+    Thread pool with one task deque per worker.
+
+    Tasks spawned from inside a worker go onto that worker's deque. Owners
+    pop from the right (newest first, depth-first); thieves take from the
+    left (oldest first, which are the largest unexplored subtrees).
+    """
+
+    def __init__(self, num_workers: int = 4):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.num_workers = num_workers
+        self._deques: List[Deque[Tuple[Callable, tuple]]] = [deque() for _ in range(num_workers)]
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._outstanding = 0
+        self._errors: List[BaseException] = []
+        self.executed = [0] * num_workers
+        self.steals = [0] * num_workers
+
+    def spawn(self, fn: Callable, *args: Any) -> None:
+        """Queue a task on the calling worker's deque (worker 0 from outside)."""
+        worker_id = getattr(self._local, "worker_id", 0)
+        with self._cond:
+            self._outstanding += 1
+        self._deques[worker_id].append((fn, args))
+        with self._cond:
+            self._cond.notify()
+
+    def _take(self, worker_id: int) -> Optional[Tuple[Callable, tuple]]:
+        try:
+            return self._deques[worker_id].pop()
+        except IndexError:
+            pass
+
+        for offset in range(1, self.num_workers):
+            victim = (worker_id + offset) % self.num_workers
+            try:
+                task = self._deques[victim].popleft()
+            except IndexError:
+                continue
+            self.steals[worker_id] += 1
+            return task
+
+        return None
+
+    def _worker(self, worker_id: int) -> None:
+        self._local.worker_id = worker_id
+
+        while True:
+            task = self._take(worker_id)
+            if task is None:
+                with self._cond:
+                    if self._outstanding == 0 or self._errors:
+                        return
+                    # Woken by spawn(); the timeout covers a spawn that raced the wait
+                    self._cond.wait(timeout=0.01)
+                continue
+
+            fn, args = task
+            try:
+                fn(*args)
+            except BaseException as e:
+                with self._cond:
+                    self._errors.append(e)
+            finally:
+                with self._cond:
+                    self._outstanding -= 1
+                    self.executed[worker_id] += 1
+                    if self._outstanding == 0 or self._errors:
+                        self._cond.notify_all()
+
+    def run(self, fn: Callable, *args: Any) -> None:
+        """Run fn and everything it spawns to completion; re-raise the first error."""
+        self.spawn(fn, *args)
+
+        threads = [
+            threading.Thread(target=self._worker, args=(i,), name=f"rlm-worker-{i}", daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+
+class _Node:
+    """One piece of the input in the sub-call tree."""
+
+    __slots__ = ("start", "end", "depth", "parent", "index", "children",
+                 "pending", "results", "cp_time", "cp_calls")
+
+    def __init__(self, start: int, end: int, depth: int, parent: Optional["_Node"], index: int):
+        self.start = start
+        self.end = end
+        self.depth = depth
+        self.parent = parent
+        self.index = index
+        self.children: List["_Node"] = []
+        self.pending = 0
+        self.results: List[Optional[str]] = []
+        # Critical path below and including this node, in seconds and in calls
+        self.cp_time = 0.0
+        self.cp_calls = 0
+
+
+class RecursiveDecomposer:
+    """
+    Run a ToyRLM-style model over a sub-call tree of arbitrary depth.
+
+    rlm must provide context_limit, execution_trace, repl_env,
+    max_recursion_depth, record_cache_stats() and
+    llm_query(prompt, recursion_depth); an rlm.chunker, when set, makes
+    node sizes token counts.
+    """
+
+    def __init__(self, rlm: Any, max_depth: int = 2, branching: int = 8, workers: int = 4):
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+        if branching < 2:
+            raise ValueError("branching must be at least 2")
+        self.rlm = rlm
+        self.max_depth = max_depth
+        self.branching = branching
+        self.workers = workers
+
+        self._long_input: Any = None
+        self._index: Optional[Any] = None  # TokenOffsetIndex of the input, with a chunker
+        self._limit = rlm.context_limit
+        self._pool: Optional[WorkStealingPool] = None
+        self._lock = threading.Lock()
+        self._nodes: List[_Node] = []
+        self._root_answer: Optional[str] = None
+
+    def _fan_out(self, node: _Node) -> int:
+        size = node.end - node.start
+        limit = self._limit
+        leaves_needed = (size + limit - 1) // limit
+
+        # Children at the deepest level must fit the context window
+        if node.depth + 1 >= self.max_depth:
+            return leaves_needed
+        return min(self.branching, leaves_needed)
+
+    def _expand(self, node: _Node) -> None:
+        size = node.end - node.start
+
+        if node.depth > 0 and size <= self._limit:
+            self._leaf(node)
+            return
+
+        # Children hold whole context windows, so the tree has ceil(size / limit) leaves at any depth
+        leaves_needed = (size + self._limit - 1) // self._limit
+        fan_out = self._fan_out(node)
+        step = (leaves_needed + fan_out - 1) // fan_out * self._limit
+        children = []
+        for i, offset in enumerate(range(node.start, node.end, step)):
+            children.append(_Node(offset, min(offset + step, node.end), node.depth + 1, node, i))
+        fan_out = len(children)
+
+        node.children = children
+        node.pending = fan_out
+        node.results = [None] * fan_out
+        with self._lock:
+            self._nodes.extend(children)
+
+        for child in children:
+            self._pool.spawn(self._expand, child)
+
+    def _leaf(self, node: _Node) -> None:
+        call_start = time.perf_counter()
+        if self._index is None:
+            start, end = node.start, node.end
+        else:
+            start, end = self._index.char_offset(node.start), self._index.char_offset(node.end)
+        answer = self.rlm.llm_query(self._long_input[start:end], recursion_depth=node.depth)
+        self._complete(node, answer, time.perf_counter() - call_start)
+
+    def _aggregate(self, node: _Node) -> None:
+        if node.parent is None:
+            self._root_answer = "\n".join(node.results)
+            node.cp_time = max(child.cp_time for child in node.children)
+            node.cp_calls = max(child.cp_calls for child in node.children)
+            return
+
+        # An internal sub-call combines its children's answers in one prompt
+        prompt = self._fit("\n".join(node.results))
+        call_start = time.perf_counter()
+        answer = self.rlm.llm_query(prompt, recursion_depth=node.depth)
+        self._complete(node, answer, time.perf_counter() - call_start)
+
+    def _fit(self, prompt: str) -> str:
+        """Truncate prompt to one sub-call's budget."""
+        if self._index is None:
+            return prompt[:self._limit]
+        return prompt[:self.rlm.chunker.build_index(prompt).char_offset(self._limit)]
+
+    def _complete(self, node: _Node, answer: str, duration: float) -> None:
+        node.cp_time = duration + max((child.cp_time for child in node.children), default=0.0)
+        node.cp_calls = 1 + max((child.cp_calls for child in node.children), default=0)
+
+        parent = node.parent
+        with self._lock:
+            parent.results[node.index] = answer
+            parent.pending -= 1
+            ready = parent.pending == 0
+
+        if ready:
+            self._pool.spawn(self._aggregate, parent)
+
+    def _level_stats(self) -> Dict[str, Any]:
+        levels: Dict[int, Dict[str, Any]] = {}
+        for node in self._nodes:
+            level = levels.setdefault(node.depth, {"nodes": 0, "leaves": 0, "fan_outs": []})
+            level["nodes"] += 1
+            if node.children:
+                level["fan_outs"].append(len(node.children))
+            else:
+                level["leaves"] += 1
+
+        stats = {}
+        for depth in sorted(levels):
+            level = levels[depth]
+            fan_outs = level.pop("fan_outs")
+            level["internal"] = len(fan_outs)
+            level["mean_fan_out"] = round(sum(fan_outs) / len(fan_outs), 2) if fan_outs else 0
+            level["max_fan_out"] = max(fan_outs, default=0)
+            stats[str(depth)] = level
+        return stats
+
+    def run(self, long_input: Any) -> Dict[str, Any]:
+        """Build and execute the sub-call tree for long_input."""
+        rlm = self.rlm
+        input_length = len(long_input)
+
+        chunker = getattr(rlm, "chunker", None)
+        if chunker is not None:
+            self._index = chunker.build_index(long_input)
+            self._limit = chunker.budget(rlm.context_limit)
+            input_size = self._index.n_tokens
+        else:
+            self._index = None
+            self._limit = rlm.context_limit
+            input_size = input_length
+
+        rlm.execution_trace.begin_run(f"recursive_depth_{self.max_depth}")
+        rlm.repl_env['long_input'] = long_input
+        rlm.execution_trace.record(StoreInRepl("long_input", input_length))
+
+        root = _Node(0, input_size, 0, None, 0)
+        self._long_input = long_input
+        self._nodes = [root]
+        self._pool = WorkStealingPool(self.workers)
+
+        # Deeper trees raise the model's depth for this run only
+        saved_depth = rlm.max_recursion_depth
+        rlm.max_recursion_depth = max(saved_depth, self.max_depth)
+        try:
+            run_start = time.perf_counter()
+            if input_size <= rlm.context_limit:
+                self._root_answer = "Processed directly"
+            else:
+                rlm.execution_trace.record(DecomposeInput(self._fan_out(root), self._limit))
+                self._pool.run(self._expand, root)
+                rlm.execution_trace.record(AggregateResults(len(root.children)))
+                rlm.record_cache_stats()
+            wall_time = time.perf_counter() - run_start
+        finally:
+            rlm.max_recursion_depth = saved_depth
+
+        total_calls = len(self._nodes) - 1
+        report = {
+            "method": "rlm_multi_level_decomposition",
+            "input_length": input_length,
+            "context_limit": rlm.context_limit,
+            "max_depth": self.max_depth,
+            "branching": self.branching,
+            "workers": self.workers,
+            "total_calls": total_calls,
+            "leaf_calls": sum(1 for node in self._nodes[1:] if not node.children),
+            "tree_depth": max(node.depth for node in self._nodes),
+            "levels": self._level_stats(),
+            "critical_path_calls": root.cp_calls,
+            "critical_path_s": round(root.cp_time, 6),
+            "wall_time_s": round(wall_time, 6),
+            "tasks_per_worker": list(self._pool.executed),
+            "steals": sum(self._pool.steals),
+            "result": f"Processed {total_calls} sub-calls across {max(node.depth for node in self._nodes)} levels"
+        }
+        if chunker is not None:
+            report["input_tokens"] = input_size
+        return report
@@ -0,0 +1,409 @@
+"""
+REPL Worker Pool for RLM Verification
+Pre-started, isolated REPL processes for ToyRLM.execute_code
+
+Each worker is a long-lived process with its own persistent namespace,
+started once when the pool is created and reused for every execution,
+so snippets do not pay for an interpreter cold start. Per execution:
+- time limit: a snippet that runs past it has its worker terminated and
+  replaced by a fresh one (whose namespace starts empty); the result
+  reports timed_out=True and worker_restarted=True
+- memory limit: each worker's private data (heap and anonymous
+  mappings) may grow at most memory_limit_mb beyond its size at start
+  (RLIMIT_DATA, Linux only); allocations past it raise MemoryError
+  inside the snippet, which is reported like any other error, and the
+  worker keeps running. Read-only file mappings such as a shared
+  context do not count, so any input size can be shared
+
+execute() runs one snippet on a given worker (worker 0 by default) for
+stateful sessions; map() runs many snippets in parallel on whichever
+workers are idle; broadcast() runs setup code once on every worker.
+
+Results mirror execute_code(): {"ok": True} or {"ok": False, "error": ...},
+plus captured output and elapsed_s.
+
+share_context() places a long input in shared memory once and maps it
+into every worker's namespace; call_map() then runs a function per chunk
+with only offsets in each task.
+
+Usage:
+    python repl_pool.py [--snippets 2000] [--workers N]
+    python repl_pool.py --dispatch
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from context_buffer import ContextHandle, MappedInput, SharedContext, attach_context
+
+DEFAULT_TIME_LIMIT_S = 10.0
+DEFAULT_MEMORY_LIMIT_MB = 512
+
+# Snippet used by benchmark_throughput(): small, CPU-bound, touches the namespace
+BENCHMARK_SNIPPET = "total = sum(i * i for i in range(2000))"
+
+
+def _limit_data_size(memory_limit_mb: int) -> None:
+    """Cap this process's private data at its current size plus memory_limit_mb."""
+    try:
+        import resource
+        with open("/proc/self/status") as f:
+            current = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmData:"))
+    except (ImportError, OSError, ValueError, StopIteration):
+        return  # not Linux: run without a memory limit
+
+    limit = current + memory_limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_DATA)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_DATA, (limit, hard))
+
+
+def _repl_worker(conn, memory_limit_mb: Optional[int]) -> None:
+    """Worker process body: exec snippets in one namespace until told to stop."""
+    if memory_limit_mb:
+        _limit_data_size(memory_limit_mb)
+    namespace: Dict[str, Any] = {"__name__": "__repl__"}
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message is None:
+            break
+
+        kind, payload = message
+        if kind == "get":
+            try:
+                conn.send({"ok": True, "value": namespace.get(payload)})
+            except Exception as e:
+                conn.send({"ok": False, "error": f"Cannot send {payload!r}: {e}"})
+            continue
+
+        captured = io.StringIO()
+        start = time.perf_counter()
+        try:
+            with redirect_stdout(captured):
+                if kind == "call":
+                    fn, args = payload
+                    reply = {"ok": True, "value": fn(namespace, *args)}
+                else:
+                    exec(payload, namespace)
+                    reply = {"ok": True}
+        except MemoryError:
+            reply = {"ok": False, "error": f"MemoryError: snippet exceeded the {memory_limit_mb} MB limit",
+                     "memory_exceeded": True}
+        except BaseException as e:
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+        reply["output"] = captured.getvalue()
+        reply["elapsed_s"] = round(time.perf_counter() - start, 6)
+        conn.send(reply)
+
+    conn.close()
+
+
+def _attach_shared_context(namespace: Dict[str, Any], handle: ContextHandle, variable: str) -> int:
+    previous = namespace.get(variable)
+    if isinstance(previous, MappedInput):
+        previous.close()
+    namespace[variable] = attach_context(handle)
+    return handle.size
+
+
+class _Worker(NamedTuple):
+    process: Any
+    conn: Any
+
+
+class ReplWorkerPool:
+    """Fixed-size pool of warm REPL processes with per-execution limits."""
+
+    def __init__(self, workers: Optional[int] = None,
+                 time_limit_s: Optional[float] = DEFAULT_TIME_LIMIT_S,
+                 memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB,
+                 mp_context: Optional[Any] = None):
+        # Imported here so ToyRLM without a pool never loads multiprocessing
+        import multiprocessing
+
+        self.time_limit_s = time_limit_s
+        self.memory_limit_mb = memory_limit_mb
+        self._ctx = mp_context or multiprocessing.get_context()
+        self.executions = 0
+        self.timeouts = 0
+        self.restarts = 0
+        self._workers = [self._start_worker(index) for index in range(workers or os.cpu_count() or 1)]
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def _start_worker(self, index: int) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_repl_worker, args=(child_conn, self.memory_limit_mb),
+                                    name=f"repl-worker-{index}", daemon=True)
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _restart_worker(self, index: int) -> None:
+        worker = self._workers[index]
+        worker.process.terminate()
+        worker.process.join()
+        worker.conn.close()
+        self._workers[index] = self._start_worker(index)
+        self.restarts += 1
+
+    def _receive(self, index: int) -> Dict[str, Any]:
+        """Reply from worker index; a worker that died is replaced."""
+        try:
+            return self._workers[index].conn.recv()
+        except EOFError:
+            self._workers[index].process.join(timeout=1)
+            exitcode = self._workers[index].process.exitcode
+            self._restart_worker(index)
+            return {"ok": False, "error": f"REPL worker exited with code {exitcode}", "worker_restarted": True}
+
+    def _timed_out(self, index: int, time_limit_s: float) -> Dict[str, Any]:
+        self._restart_worker(index)
+        self.timeouts += 1
+        return {"ok": False, "error": f"Timed out after {time_limit_s:g}s", "timed_out": True,
+                "worker_restarted": True, "elapsed_s": time_limit_s}
+
+    def execute(self, code: str, worker: int = 0, time_limit_s: Optional[float] = None) -> Dict[str, Any]:
+        """Run code in one worker's namespace and wait for the result."""
+        return self._run([(worker, ("exec", code))], time_limit_s)[0]
+
+    def map(self, snippets: Sequence[str], time_limit_s: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Run snippets in parallel on idle workers; results are in snippet order."""
+        return self._run([(None, ("exec", code)) for code in snippets], time_limit_s)
+
+    def broadcast(self, code: str, time_limit_s: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Run code once on every worker, e.g. to load shared setup into each namespace."""
+        return self._run([(index, ("exec", code)) for index in range(len(self._workers))], time_limit_s)
+
+    def call_map(self, fn: Callable[..., Any], args_list: Sequence[tuple],
+                 time_limit_s: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        fn(namespace, *args) for each args on idle workers; each result's
+        "value" is fn's return value. fn and args are pickled per call, so
+        pass offsets into a shared context rather than the context itself.
+        """
+        return self._run([(None, ("call", (fn, tuple(args)))) for args in args_list], time_limit_s)
+
+    def share_context(self, long_input: Any, variable: str = "long_input") -> SharedContext:
+        """
+        Place long_input in shared memory once and map it into every
+        worker's namespace as variable (a read-only MappedInput). Only the
+        handle is sent. The caller closes the returned SharedContext.
+        """
+        shared = SharedContext(long_input)
+        try:
+            replies = self._run([(index, ("call", (_attach_shared_context, (shared.handle, variable))))
+                                 for index in range(len(self._workers))], None)
+        except BaseException:
+            shared.close()
+            raise
+        failed = [reply["error"] for reply in replies if not reply["ok"]]
+        if failed:
+            shared.close()
+            raise RuntimeError(f"Workers could not attach the shared context: {failed[0]}")
+        return shared
+
+    def get(self, name: str, worker: int = 0) -> Any:
+        """Value of name in a worker's namespace (None if unset); it must be picklable."""
+        self._workers[worker].conn.send(("get", name))
+        reply = self._receive(worker)
+        if not reply["ok"]:
+            raise RuntimeError(reply["error"])
+        return reply["value"]
+
+    def _run(self, jobs: List[tuple], time_limit_s: Optional[float]) -> List[Dict[str, Any]]:
+        """
+        jobs are (worker index or None for any idle worker, message). Each
+        job waits for its worker to be free; limits apply from dispatch.
+        """
+        from collections import deque
+        from multiprocessing.connection import wait
+
+        time_limit_s = self.time_limit_s if time_limit_s is None else time_limit_s
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        pinned = {index: deque() for index in range(len(self._workers))}
+        unpinned = deque()
+        for job, (worker, _) in enumerate(jobs):
+            (unpinned if worker is None else pinned[worker]).append(job)
+        busy: Dict[int, tuple] = {}  # worker index -> (job index, dispatched at)
+
+        while unpinned or busy or any(pinned.values()):
+            for index in range(len(self._workers)):
+                if index in busy:
+                    continue
+                queue = pinned[index] or unpinned
+                if not queue:
+                    continue
+                job = queue.popleft()
+                self._workers[index].conn.send(jobs[job][1])
+                busy[index] = (job, time.perf_counter())
+                self.executions += 1
+
+            timeout = None
+            if time_limit_s is not None:
+                timeout = max(0.0, min(started for _, started in busy.values()) + time_limit_s - time.perf_counter())
+            conns = {self._workers[index].conn: index for index in busy}
+            for conn in wait(list(conns), timeout=timeout):
+                index = conns[conn]
+                job, _ = busy.pop(index)
+                results[job] = self._receive(index)
+
+            if time_limit_s is not None:
+                now = time.perf_counter()
+                for index, (job, started) in list(busy.items()):
+                    if now - started >= time_limit_s:
+                        del busy[index]
+                        results[job] = self._timed_out(index, time_limit_s)
+
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": len(self._workers), "executions": self.executions,
+                "timeouts": self.timeouts, "restarts": self.restarts}
+
+    def close(self) -> None:
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=1)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+        self._workers = []
+
+    def __enter__(self) -> "ReplWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def benchmark_throughput(n_snippets: int = 2000, workers: Optional[int] = None,
+                         snippet: str = BENCHMARK_SNIPPET) -> Dict[str, Any]:
+    """
+    Snippets per second: in-process exec on one shared dict (today's
+    execute_code) vs the pool, one at a time on a warm worker and
+    map()ped across all workers. Pool start-up is reported separately.
+    """
+    namespace: Dict[str, Any] = {}
+    start = time.perf_counter()
+    for _ in range(n_snippets):
+        exec(snippet, namespace)
+    in_process_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pool = ReplWorkerPool(workers)
+    pool.broadcast("pass")  # wait until every worker is up
+    startup_s = time.perf_counter() - start
+    pool_size = len(pool)
+    try:
+        start = time.perf_counter()
+        for _ in range(n_snippets):
+            pool.execute(snippet)
+        pooled_serial_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pool.map([snippet] * n_snippets)
+        pooled_parallel_s = time.perf_counter() - start
+    finally:
+        pool.close()
+
+    return {
+        "snippets": n_snippets,
+        "workers": pool_size,
+        "cpus": os.cpu_count(),
+        "pool_startup_s": round(startup_s, 4),
+        "in_process_per_s": round(n_snippets / in_process_s, 1),
+        "pool_serial_per_s": round(n_snippets / pooled_serial_s, 1),
+        "pool_parallel_per_s": round(n_snippets / pooled_parallel_s, 1),
+    }
+
+
+def _chunk_length(namespace: Dict[str, Any], start: int, end: int, context: Any = None) -> int:
+    """Benchmark sub-call: read one chunk of the shared long_input, or of context if sent along."""
+    source = namespace["long_input"] if context is None else context
+    return len(bytes(source[start:end]))
+
+
+def benchmark_context_dispatch(multipliers: Sequence[int] = (1, 10, 100, 1000, 10000),
+                               context_limit: int = 1000, tasks: int = 200,
+                               workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Per-sub-call dispatch cost as the input grows: sending the whole
+    context with every task (what pickling repl_env['long_input'] to the
+    workers amounts to) vs sharing it once and sending only offsets.
+    """
+    report = {}
+    with ReplWorkerPool(workers) as pool:
+        pool.broadcast("pass")
+        for multiplier in multipliers:
+            context = b"x" * (context_limit * multiplier)
+            bounds = [((i % multiplier) * context_limit, (i % multiplier + 1) * context_limit)
+                      for i in range(tasks)]
+
+            start = time.perf_counter()
+            pool.call_map(_chunk_length, [(a, b, context) for a, b in bounds])
+            pickled_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            shared = pool.share_context(context)
+            setup_s = time.perf_counter() - start
+            try:
+                start = time.perf_counter()
+                pool.call_map(_chunk_length, bounds)
+                shared_s = time.perf_counter() - start
+            finally:
+                shared.close()
+
+            report[f"{multiplier}x"] = {
+                "input_bytes": len(context),
+                "pickled_us_per_task": round(pickled_s / tasks * 1e6, 1),
+                "shared_us_per_task": round(shared_s / tasks * 1e6, 1),
+                "share_setup_ms": round(setup_s * 1e3, 2),
+            }
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the REPL worker pool against in-process exec")
+    parser.add_argument("--snippets", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None, help="Pool size (default: CPU count)")
+    parser.add_argument("--dispatch", action="store_true",
+                        help="Compare sending the context per task with sharing it once, 1x-10,000x")
+    args = parser.parse_args(argv)
+
+    if args.dispatch:
+        print("Sub-call dispatch cost (1,000-byte chunks):")
+        print(f"  {'input':>8} {'bytes':>12} {'context per task':>18} {'shared context':>16} {'share once':>12}")
+        for label, row in benchmark_context_dispatch(workers=args.workers).items():
+            print(f"  {label:>8} {row['input_bytes']:>12,} {row['pickled_us_per_task']:>16.1f}µs "
+                  f"{row['shared_us_per_task']:>14.1f}µs {row['share_setup_ms']:>10.2f}ms")
+        return 0
+
+    report = benchmark_throughput(args.snippets, args.workers)
+    print(f"{report['snippets']} snippets, {report['workers']} workers on {report['cpus']} CPUs "
+          f"(pool start-up {report['pool_startup_s']:.3f}s)")
+    print(f"  in-process exec:      {report['in_process_per_s']:>10,.0f} snippets/s")
+    print(f"  pool, one at a time:  {report['pool_serial_per_s']:>10,.0f} snippets/s")
+    print(f"  pool, map():          {report['pool_parallel_per_s']:>10,.0f} snippets/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
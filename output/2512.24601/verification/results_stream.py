@@ -0,0 +1,148 @@
+"""
+Streaming Results Writer for RLM Verification
+Crash-safe NDJSON output, one record per finished section
+
+Records are appended to <name>.partial as they become available and
+fsync'd after each one, so a crash or kill keeps every section that had
+finished. close() renames the file into place atomically; an existing
+.partial file therefore always means an interrupted run.
+
+Record types, one JSON object per line:
+- {"type": "header", "paper_id": ..., "verifier": ...}
+- {"type": "section", "name": ..., "result": {...}}
+- {"type": "meta", ...}: extra top-level fields (timeouts, cache stats)
+- {"type": "summary", "summary": {...}}
+
+rebuild_results() turns a stream, complete or partial, back into the
+results.json layout; write_json_atomic() writes it the same crash-safe way.
+
+Usage:
+    python results_stream.py results.ndjson [results.json]
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Union
+
+PARTIAL_SUFFIX = ".partial"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename; not supported on every platform (e.g. Windows)."""
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ResultsStreamWriter:
+    """Append-only NDJSON writer with per-record fsync and atomic finalize."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + PARTIAL_SUFFIX)
+        self.records = 0
+        self._file = open(self.partial_path, 'w', encoding='utf-8')
+
+    def write_record(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.records += 1
+
+    def write_header(self, paper_id: str, verifier: str) -> None:
+        self.write_record({"type": "header", "paper_id": paper_id, "verifier": verifier})
+
+    def write_section(self, name: str, result: Dict[str, Any]) -> None:
+        self.write_record({"type": "section", "name": name, "result": result})
+
+    def write_meta(self, **fields: Any) -> None:
+        self.write_record(dict({"type": "meta"}, **fields))
+
+    def write_summary(self, summary: Dict[str, Any]) -> None:
+        self.write_record({"type": "summary", "summary": summary})
+
+    def close(self) -> None:
+        """Finish the stream: rename <name>.partial to <name>."""
+        if self._file.closed:
+            return
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+        _fsync_directory(self.path.parent)
+
+    def __enter__(self) -> "ResultsStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # On an exception, leave the .partial file as the record of the interrupted run
+        if exc_type is None:
+            self.close()
+        elif not self._file.closed:
+            self._file.close()
+
+
+def rebuild_results(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Rebuild the results.json layout from an NDJSON stream.
+    A truncated last line (from a crash mid-write) is ignored; a stream
+    without a summary record rebuilds without a "summary" key.
+    """
+    results: Dict[str, Any] = {"verification_sections": {}}
+
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+
+            kind = record.pop("type", None)
+            if kind == "header":
+                results = dict(record, verification_sections=results["verification_sections"])
+            elif kind == "section":
+                results["verification_sections"][record["name"]] = record["result"]
+            elif kind == "meta":
+                results.update(record)
+            elif kind == "summary":
+                results["summary"] = record["summary"]
+
+    return results
+
+
+def write_json_atomic(data: Dict[str, Any], path: Union[str, Path], indent: int = 2) -> None:
+    """Write JSON to a temp file, fsync it, then rename it over path."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file owner-only; match a normally created file
+        os.chmod(tmp_path, 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    _fsync_directory(path.parent)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print(f"Usage: {__doc__.strip().splitlines()[-1].strip()}", file=sys.stderr)
+        sys.exit(2)
+
+    stream_path = Path(sys.argv[1])
+    output_path = Path(sys.argv[2]) if len(sys.argv) == 3 else stream_path.with_name("results.json")
+    write_json_atomic(rebuild_results(stream_path), output_path)
+    print(f"Rebuilt {output_path} from {stream_path}")
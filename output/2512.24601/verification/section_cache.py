@@ -0,0 +1,120 @@
+"""
+Section Cache for RLM Verification
+Reuses verification section results while their inputs and code are unchanged
+
+Each section is fingerprinted from two parts:
+- inputs: the cases the section builds from deconstruction.json, hashed
+  as canonical JSON (sorted keys), so edits to unrelated claims do not
+  invalidate it
+- code: the source of the functions, classes and helper modules the
+  section runs, so editing one section's code re-runs only that section
+
+A section whose fingerprint matches its stored entry is a cache hit and
+its stored result is reused as-is. Only SUCCESS results are stored.
+Entries are one JSON file per section, written atomically.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+# Bump to invalidate every stored entry when the entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_inputs(inputs: Any) -> str:
+    """SHA-256 of inputs as canonical JSON."""
+    canonical = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _module_source(name: str) -> str:
+    """Source of a module by name, read from disk without importing it."""
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.origin is None:
+        raise ImportError(f"Cannot locate source for module {name!r}")
+    with open(spec.origin, encoding='utf-8') as f:
+        return f.read()
+
+
+def hash_code(code: Sequence[Any]) -> str:
+    """
+    SHA-256 over the source of functions, classes or modules, in order.
+    A string is taken as a module name, so hashing a helper module does
+    not pay for importing it (and its heavy dependencies).
+    """
+    digest = hashlib.sha256()
+    for obj in code:
+        if isinstance(obj, str):
+            name, source = obj, _module_source(obj)
+        else:
+            import inspect
+            name = getattr(obj, "__qualname__", getattr(obj, "__name__", repr(obj)))
+            source = inspect.getsource(obj)
+        digest.update(f"{name}\0".encode('utf-8'))
+        digest.update(source.encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def fingerprint_section(inputs: Any, code: Sequence[Any]) -> Dict[str, str]:
+    """Combined fingerprint of a section's inputs and code."""
+    inputs_hash = hash_inputs(inputs)
+    code_hash = hash_code(code)
+    combined = hashlib.sha256(
+        f"{CACHE_FORMAT_VERSION}:{inputs_hash}:{code_hash}".encode('utf-8')
+    ).hexdigest()
+    return {"fingerprint": combined, "inputs_hash": inputs_hash, "code_hash": code_hash}
+
+
+class SectionCache:
+    """One JSON entry per section under `directory`."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, section: str) -> Path:
+        return self.directory / f"{section}.json"
+
+    def load(self, section: str, fingerprint: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for section if its fingerprint matches,
+        else None. A missing or unreadable entry counts as a miss.
+        """
+        try:
+            with open(self._entry_path(section), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        if entry is None or entry.get("fingerprint") != fingerprint["fingerprint"]:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def store(self, section: str, fingerprint: Dict[str, str], result: Dict[str, Any]) -> None:
+        """Atomically replace the stored entry for section."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = dict(fingerprint, section=section, stored_at=time.time(), result=result)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{section}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._entry_path(section))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        return {"directory": str(self.directory), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,145 @@
+"""
+Section Scheduler for RLM Verification
+Runs independent verification sections in parallel with per-section timeouts
+
+Every section runs in its own worker process, at most max_workers at a
+time. A section that outlives its timeout is terminated (threads cannot
+be cancelled, processes can) and reported as an ERROR with
+timed_out=True. Each section runs in its own process group (Unix), and
+the whole group is stopped on timeout, so pools the section started (REPL
+workers, process pools) do not outlive it. Anything a section prints is
+captured in its worker and handed back with the result.
+
+Results are yielded in task order, not completion order: a slow first
+section holds back the log for later ones, so the console output is the
+same from run to run.
+"""
+
+import io
+import os
+import signal
+import time
+import traceback
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class SectionTask(NamedTuple):
+    """One section to run: fn(*args) must return the section dict."""
+    name: str
+    fn: Callable[..., Dict[str, Any]]
+    args: tuple
+    timeout: Optional[float] = None
+
+
+class SectionOutcome(NamedTuple):
+    name: str
+    section: Dict[str, Any]
+    output: str
+    elapsed_s: float
+
+
+def _error_section(error: str, **extra: Any) -> Dict[str, Any]:
+    return dict({"status": "ERROR", "error": error}, **extra)
+
+
+def _section_worker(conn, fn: Callable[..., Dict[str, Any]], args: tuple) -> None:
+    """Worker process body: run fn, send back (section, captured stdout)."""
+    if hasattr(os, "setsid"):
+        os.setsid()  # lead a process group holding everything this section starts
+    captured = io.StringIO()
+    try:
+        with redirect_stdout(captured):
+            section = fn(*args)
+    except BaseException as e:
+        section = _error_section(str(e), traceback=traceback.format_exc())
+    try:
+        conn.send((section, captured.getvalue()))
+    finally:
+        conn.close()
+
+
+def _stop_section(process: Any) -> None:
+    """Terminate a section process and every process in its group, then reap it."""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        # No process groups here, or the worker has not called setsid() yet
+        process.terminate()
+    process.join()
+
+
+def run_sections(tasks: List[SectionTask],
+                 max_workers: Optional[int] = None,
+                 mp_context: Optional[Any] = None) -> Iterator[SectionOutcome]:
+    """
+    Run tasks on worker processes and yield one SectionOutcome per task,
+    in task order. Never raises for a failing, crashing or hung section.
+    """
+    # Imported here so a sequential run never loads multiprocessing
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    ctx = mp_context or multiprocessing.get_context()
+    max_workers = max_workers or len(tasks) or 1
+
+    queued = list(range(len(tasks)))
+    running: Dict[Any, Tuple[int, Any, float]] = {}  # conn -> (index, process, started)
+    finished: Dict[int, SectionOutcome] = {}
+    next_to_yield = 0
+
+    def finish(index: int, section: Dict[str, Any], output: str, started: float) -> None:
+        finished[index] = SectionOutcome(tasks[index].name, section, output,
+                                         round(time.perf_counter() - started, 6))
+
+    try:
+        while next_to_yield < len(tasks):
+            while queued and len(running) < max_workers:
+                index = queued.pop(0)
+                task = tasks[index]
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                process = ctx.Process(target=_section_worker, args=(child_conn, task.fn, task.args),
+                                      name=f"section-{task.name}")
+                process.start()
+                child_conn.close()
+                running[parent_conn] = (index, process, time.perf_counter())
+
+            # Sleep until a result arrives or the nearest deadline passes
+            now = time.perf_counter()
+            deadlines = [started + tasks[index].timeout - now
+                         for index, _, started in running.values()
+                         if tasks[index].timeout is not None]
+            ready = wait(list(running), timeout=max(0.0, min(deadlines)) if deadlines else None)
+
+            for conn in ready:
+                index, process, started = running.pop(conn)
+                try:
+                    section, output = conn.recv()
+                except EOFError:
+                    _stop_section(process)  # it crashed: stop anything it left running
+                    section, output = _error_section(
+                        f"Section process exited with code {process.exitcode} before returning a result"
+                    ), ""
+                conn.close()
+                process.join()
+                finish(index, section, output, started)
+
+            now = time.perf_counter()
+            for conn, (index, process, started) in list(running.items()):
+                timeout = tasks[index].timeout
+                if timeout is not None and now - started >= timeout:
+                    del running[conn]
+                    _stop_section(process)
+                    conn.close()
+                    finish(index, _error_section(f"Timed out after {timeout:g}s", timed_out=True,
+                                                 timeout_s=timeout), "", started)
+
+            while next_to_yield in finished:
+                yield finished.pop(next_to_yield)
+                next_to_yield += 1
+
+    finally:
+        # Generator closed early or the parent was interrupted: cancel the rest
+        for conn, (_, process, _) in running.items():
+            _stop_section(process)
+            conn.close()
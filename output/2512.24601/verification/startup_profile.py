@@ -0,0 +1,194 @@
+"""
+Startup Profile for RLM Verification
+Per-module import times and a cold-start regression check
+
+Thousands of short verification processes each pay the interpreter and
+import cost of main.py before doing any work, so that cost is tracked:
+- import_profile() runs a fresh `python -X importtime -c "import <module>"`
+  and returns self and cumulative import time per module
+- cold_start() times fresh `import <module>` processes end to end and
+  lists any heavy library that was loaded eagerly
+- check_cold_start() fails when the median cold start exceeds a target or
+  a heavy library is imported at module load
+- check_end_to_end() times whole fresh `python main.py --sections
+  mathematical_verification` runs (no section cache, no bootstrap
+  intervals), the short run the import budget exists for, and fails past
+  its own target
+
+Heavy libraries (NumPy, matplotlib, asyncio, SQLite, multiprocessing) must
+be imported inside the functions that need them. Importing main takes
+about 0.1s and a math-only run about 0.25s end to end. The run skips the
+section's 1e6-resample bootstrap intervals (--bootstrap-resamples 0),
+which take another 2.5s and measure NumPy throughput, not startup.
+
+Usage:
+    python startup_profile.py [--module main] [--top 15] [--target 0.15] [--repeats 5]
+                              [--run-target 0.5] [--run-repeats 3]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+VERIFICATION_DIR = Path(__file__).resolve().parent
+
+# Libraries that only specific code paths need
+HEAVY_MODULES = ("numpy", "matplotlib", "asyncio", "sqlite3", "multiprocessing", "concurrent.futures")
+
+# Median seconds for a fresh `python -c "import main"`, interpreter included
+DEFAULT_TARGET_S = 0.15
+
+# A math-only verification run, always recomputed, without bootstrap
+# intervals, and its median target in seconds
+END_TO_END_ARGS = ("--sections", "mathematical_verification", "--no-section-cache", "--bootstrap-resamples", "0")
+DEFAULT_RUN_TARGET_S = 0.5
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=str(VERIFICATION_DIR),
+                          capture_output=True, text=True, check=True)
+
+
+def import_profile(module: str = "main") -> Dict[str, Any]:
+    """
+    Import times for module in a fresh interpreter, from -X importtime.
+    Rows are sorted by cumulative time; times are in milliseconds.
+    """
+    completed = _run_python(f"import {module}", "-X", "importtime")
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header line
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+
+    total = next((row["cumulative_ms"] for row in rows if row["module"] == module and row["depth"] == 0), None)
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return {"module": module, "total_ms": total, "modules": rows}
+
+
+def cold_start(module: str = "main", repeats: int = 5) -> Dict[str, Any]:
+    """Wall time of fresh `import module` processes, and heavy libraries they loaded."""
+    probe = (f"import sys, json; import {module}; "
+             f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))")
+
+    times = []
+    heavy: List[str] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = _run_python(probe)
+        times.append(time.perf_counter() - start)
+        heavy = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    return {
+        "module": module,
+        "repeats": repeats,
+        "median_s": round(statistics.median(times), 4),
+        "min_s": round(min(times), 4),
+        "max_s": round(max(times), 4),
+        "heavy_modules_loaded": heavy,
+    }
+
+
+def check_cold_start(module: str = "main", target_s: float = DEFAULT_TARGET_S,
+                     repeats: int = 5, allowed: Optional[List[str]] = None) -> Dict[str, Any]:
+    """cold_start() plus a pass/fail verdict against target_s and HEAVY_MODULES."""
+    report = cold_start(module, repeats)
+    eager = [m for m in report["heavy_modules_loaded"] if m not in (allowed or [])]
+
+    problems = []
+    if report["median_s"] > target_s:
+        problems.append(f"median cold start {report['median_s']:.3f}s exceeds target {target_s:.3f}s")
+    if eager:
+        problems.append(f"heavy modules imported at load time: {', '.join(eager)}")
+
+    report.update(target_s=target_s, passed=not problems, problems=problems)
+    return report
+
+
+def end_to_end(args: Sequence[str] = END_TO_END_ARGS, repeats: int = 3) -> Dict[str, Any]:
+    """Wall time of fresh `python main.py <args>` processes, writing their results to a temp dir."""
+    times = []
+    with tempfile.TemporaryDirectory(prefix="rlm-startup-") as output_dir:
+        command = [sys.executable, "main.py", *args, "--output-dir", output_dir]
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run(command, cwd=str(VERIFICATION_DIR), capture_output=True, text=True, check=True)
+            times.append(time.perf_counter() - start)
+
+    return {
+        "command": " ".join(["main.py", *args]),
+        "repeats": repeats,
+        "median_s": round(statistics.median(times), 4),
+        "min_s": round(min(times), 4),
+        "max_s": round(max(times), 4),
+    }
+
+
+def check_end_to_end(args: Sequence[str] = END_TO_END_ARGS, target_s: float = DEFAULT_RUN_TARGET_S,
+                     repeats: int = 3) -> Dict[str, Any]:
+    """end_to_end() plus a pass/fail verdict against target_s."""
+    report = end_to_end(args, repeats)
+    problems = []
+    if report["median_s"] > target_s:
+        problems.append(f"median run {report['median_s']:.3f}s exceeds target {target_s:.3f}s")
+    report.update(target_s=target_s, passed=not problems, problems=problems)
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time profile and cold-start check")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--target", type=float, default=DEFAULT_TARGET_S, help="Cold-start target in seconds")
+    parser.add_argument("--repeats", type=int, default=5, help="Cold starts to time")
+    parser.add_argument("--run-target", type=float, default=DEFAULT_RUN_TARGET_S,
+                        help="Math-only main.py run target in seconds")
+    parser.add_argument("--run-repeats", type=int, default=3, help="Math-only runs to time (0 skips them)")
+    args = parser.parse_args(argv)
+
+    profile = import_profile(args.module)
+    print(f"Import profile for {args.module}: {profile['total_ms']:.1f} ms")
+    print(f"  {'cumulative':>10}  {'self':>8}  module")
+    for row in profile["modules"][:args.top]:
+        print(f"  {row['cumulative_ms']:>8.1f}ms  {row['self_ms']:>6.1f}ms  {'  ' * row['depth']}{row['module']}")
+    print()
+
+    report = check_cold_start(args.module, args.target, args.repeats)
+    print(f"Cold start: median {report['median_s']:.3f}s "
+          f"(min {report['min_s']:.3f}s, max {report['max_s']:.3f}s, target {report['target_s']:.3f}s)")
+    for problem in report["problems"]:
+        print(f"  ✗ {problem}")
+    if report["passed"]:
+        print("  ✓ Within target, no heavy modules loaded eagerly")
+    passed = report["passed"]
+
+    if args.run_repeats > 0:
+        run = check_end_to_end(target_s=args.run_target, repeats=args.run_repeats)
+        print(f"End to end ({run['command']}): median {run['median_s']:.3f}s "
+              f"(min {run['min_s']:.3f}s, max {run['max_s']:.3f}s, target {run['target_s']:.3f}s)")
+        for problem in run["problems"]:
+            print(f"  ✗ {problem}")
+        if run["passed"]:
+            print("  ✓ Within target")
+        passed = passed and run["passed"]
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Sub-Call Cache for RLM Verification
+Persistent memoization of llm_query() responses
+
+Responses are keyed by a SHA-256 hash of the prompt content and recursion
+depth. Lookups go through two tiers:
+1. An in-memory LRU bounded by the UTF-8 size of its keys and responses
+2. An on-disk SQLite store that survives across runs
+
+Disk hits are promoted into memory. Writes to SQLite are batched and
+committed every `commit_every` puts and on flush()/close().
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+class SubCallCache:
+    """Two-tier (memory LRU + SQLite) cache for sub-call responses."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None,
+                 max_memory_bytes: int = 64 * 1024 * 1024,
+                 commit_every: int = 256):
+        self.path = Path(path) if path is not None else None
+        self.max_memory_bytes = max_memory_bytes
+        self.commit_every = commit_every
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_bytes = 0
+        self._pending: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = None
+        if self.path is not None:
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key_for(prompt: Any, recursion_depth: int = 0, model: str = "toy") -> str:
+        """
+        Content hash for a prompt. Bytes-like prompts (including memoryview
+        chunks of a mapped input) are hashed without copying.
+        """
+        digest = hashlib.sha256(f"{model}:{recursion_depth}:".encode())
+        digest.update(prompt.encode('utf-8') if isinstance(prompt, str) else prompt)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _entry_size(key: str, response: str) -> int:
+        """UTF-8 bytes of an entry; keys are hex digests, one byte per character."""
+        if response.isascii():
+            return len(key) + len(response)
+        return len(key) + len(response.encode('utf-8'))
+
+    def _remember(self, key: str, response: str) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        if key in self._memory:
+            self._memory_bytes -= self._entry_size(key, self._memory.pop(key))
+        self._memory[key] = response
+        self._memory_bytes += self._entry_size(key, response)
+
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            old_key, old_response = self._memory.popitem(last=False)
+            self._memory_bytes -= self._entry_size(old_key, old_response)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return response
+
+            if self._db is not None:
+                row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    # Not committed yet but still written in this session
+                    row = next(((r,) for k, r in self._pending if k == key), None)
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response in memory and queue it for the disk tier."""
+        with self._lock:
+            self._remember(key, response)
+            if self._db is not None:
+                self._pending.append((key, response))
+                if len(self._pending) >= self.commit_every:
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._db is None or not self._pending:
+            return
+        self._db.executemany("INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", self._pending)
+        self._db.commit()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Commit queued writes to SQLite."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes
+        }
+
+    def __enter__(self) -> "SubCallCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,56 @@
+"""
+Round-trip test for the results store: run -> ingest -> query.
+
+Runs the mathematical verification section for this paper, writes the
+results (with their generate_summary block) into a one-paper corpus,
+ingests it and queries it, so a change to the summary's shape that the
+store no longer understands fails here.
+
+Usage:
+    python -m pytest test_results_store.py
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+from main import DECONSTRUCTION_PATH, generate_summary, run_all_verifications
+from claim_loader import load_deconstruction
+from results_store import ResultsStore, main as results_store_main
+
+
+def _write_audit(corpus_root: Path) -> None:
+    deconstruction = load_deconstruction(DECONSTRUCTION_PATH)
+    results = run_all_verifications(deconstruction, parallel=False, sections=["mathematical_verification"])
+    results["summary"] = generate_summary(results, deconstruction)
+
+    paper_dir = corpus_root / deconstruction["paper_id"]
+    (paper_dir / "verification").mkdir(parents=True)
+    shutil.copy(DECONSTRUCTION_PATH, paper_dir / "deconstruction.json")
+    with open(paper_dir / "verification" / "results.json", 'w', encoding='utf-8') as f:
+        json.dump(results, f)
+
+
+def test_run_ingest_query_round_trip(tmp_path, capsys):
+    _write_audit(tmp_path / "corpus")
+    db = tmp_path / "store.sqlite"
+
+    with ResultsStore(db) as store:
+        report = store.ingest_corpus(tmp_path / "corpus")
+        assert report == dict(report, papers=1, errors={})
+
+        claims = {row["claim_id"]: row for row in store.unverified_claims(kind="E", min_discrepancy=100)}
+        # E2 and E3 quote the multiplier, not the relative improvement
+        assert set(claims) == {"E2", "E3"}
+        assert claims["E2"]["result_key"] == "E2_C2"
+        assert abs(claims["E2"]["discrepancy_pct"] - 143550.0) < 1.0
+
+        # C2 restates E2: it fails with it and carries the same discrepancy
+        history = store.claim_history("C2")
+        assert history[0]["status"] == "unverified"
+        assert history[0]["discrepancy_pct"] == claims["E2"]["discrepancy_pct"]
+
+    capsys.readouterr()
+    assert results_store_main(["--db", str(db), "query", "--kind", "E", "--min-discrepancy", "100"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["claim_id"] for row in rows] == ["E2", "E3"]
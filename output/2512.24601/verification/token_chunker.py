@@ -0,0 +1,241 @@
+"""
+Token-Aware Chunking for RLM Verification
+Splits long inputs by token count instead of character count
+
+One pass over the input builds a TokenOffsetIndex. Every
+CHECKPOINT_STRIDE tokens it stores a checkpoint: the character offset
+after that many tokens, and the last line break before it (its token
+count and character offset). The index takes O(tokens /
+CHECKPOINT_STRIDE) memory, not O(tokens). The pass reads the input in
+windows of INDEX_WINDOW characters. For a MappedInput it releases each
+window's pages behind it, so indexing a mapped file leaves little of it
+resident.
+
+chunk_bounds() ends a chunk at the last line break that fits its token
+budget, and splits a line longer than the budget at a token boundary.
+Each boundary is found from the checkpoint before it, which gives the
+last earlier line break. Then at most one checkpoint window (under
+CHECKPOINT_STRIDE tokens) is re-tokenized to find the exact offset and
+any later break. Splitting costs O(chunks * CHECKPOINT_STRIDE) after the
+indexing pass; the input is not tokenized again. char_offset() and
+token_at() are resolved the same way.
+
+The default tokenizer approximates BPE by taking words in pieces of at
+most four characters (about four characters per token) and each
+punctuation mark as one token. Any compiled regex with the same
+"token or newline" shape can be passed instead; tokenizing must restart
+cleanly at any token end (no lookbehind).
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Any, List, Optional, Pattern, Tuple
+
+# Word pieces of up to 4 chars, single punctuation marks, or a newline (a break, not a token)
+DEFAULT_TOKEN_PATTERN = r"\w{1,4}|[^\w\s]|\n"
+
+# Tokens between checkpoints; resolving an offset re-tokenizes at most this many
+CHECKPOINT_STRIDE = 16
+
+# Characters tokenized per window of the indexing pass
+INDEX_WINDOW = 1 << 20
+
+
+def _is_buffer(text: Any) -> bool:
+    return isinstance(text, (str, bytes, bytearray, memoryview))
+
+
+def _offset_array(size: int) -> array:
+    """Smallest unsigned array type that can hold offsets up to size."""
+    return array('I') if size < 2 ** 32 else array('Q')
+
+
+class TokenOffsetIndex:
+    """
+    Token count and sparse token offsets for one input, built in a single
+    windowed pass. Keeps a reference to the input to resolve exact offsets;
+    a MappedInput is read through a fresh view per pass, released when the
+    pass ends, so the index never holds its mapping open.
+    """
+
+    def __init__(self, source: Any, pattern: Pattern):
+        self.source = source
+        self.pattern = pattern
+        self._release = None if _is_buffer(source) else getattr(source, "release", None)
+        self.text_length = len(source)
+        self._newline = b"\n" if isinstance(pattern.pattern, bytes) else "\n"
+        # checkpoints[j]: character offset after j * CHECKPOINT_STRIDE tokens;
+        # break_tokens[j], break_ends[j]: tokens before the last line break
+        # before that point and the offset where the token before it ends (0: none)
+        self.checkpoints = _offset_array(self.text_length)
+        self.break_tokens = _offset_array(self.text_length)
+        self.break_ends = _offset_array(self.text_length)
+        for column in (self.checkpoints, self.break_tokens, self.break_ends):
+            column.append(0)
+
+        newline = self._newline
+        checkpoints, break_tokens, break_ends = self.checkpoints, self.break_tokens, self.break_ends
+        n_tokens = 0
+        prev_end = last_break_tokens = last_break_end = 0
+        pos = 0
+        text = self._open()
+        try:
+            while pos < self.text_length:
+                window_end = min(pos + INDEX_WINDOW, self.text_length)
+                restart = window_end
+                for match in pattern.finditer(text, pos, window_end):
+                    if match.end() == window_end and window_end < self.text_length:
+                        # May be cut short by the window: tokenize it again in the next one
+                        restart = match.start()
+                        break
+                    if match.group() == newline:
+                        last_break_tokens, last_break_end = n_tokens, prev_end
+                        continue
+                    n_tokens += 1
+                    prev_end = match.end()
+                    if n_tokens % CHECKPOINT_STRIDE == 0:
+                        checkpoints.append(prev_end)
+                        break_tokens.append(last_break_tokens)
+                        break_ends.append(last_break_end)
+                if self._release is not None:
+                    self._release(pos, restart)
+                pos = restart
+        finally:
+            self._close(text)
+        self.n_tokens = n_tokens
+
+    def _open(self) -> Any:
+        """The input as str or a buffer the tokenizer can scan."""
+        return self.source if _is_buffer(self.source) else self.source[:]
+
+    def _close(self, text: Any) -> None:
+        if text is not self.source:
+            text.release()
+
+    def _scan(self, text: Any, start: int) -> Any:
+        """Token matches (newlines skipped) from character offset start, a token end."""
+        newline = self._newline
+        return (match for match in self.pattern.finditer(text, start) if match.group() != newline)
+
+    def _offset_after(self, tokens: int) -> int:
+        """Character offset where the first `tokens` tokens end (0 <= tokens <= n_tokens)."""
+        checkpoint, remaining = divmod(tokens, CHECKPOINT_STRIDE)
+        offset = self.checkpoints[checkpoint]
+        text = self._open()
+        try:
+            for _, match in zip(range(remaining), self._scan(text, offset)):
+                offset = match.end()
+        finally:
+            self._close(text)
+        return offset
+
+    def char_offset(self, token_index: int) -> int:
+        """Character offset where token_index starts its chunk (end of the previous token)."""
+        if token_index <= 0:
+            return 0
+        if token_index >= self.n_tokens:
+            return self.text_length
+        return self._offset_after(token_index)
+
+    def token_at(self, char_offset: int) -> int:
+        """Number of tokens that end at or before char_offset."""
+        checkpoint = bisect_right(self.checkpoints, char_offset) - 1
+        count = checkpoint * CHECKPOINT_STRIDE
+        text = self._open()
+        try:
+            for match in self._scan(text, self.checkpoints[checkpoint]):
+                if match.end() > char_offset:
+                    break
+                count += 1
+        finally:
+            self._close(text)
+        return count
+
+    def _boundary(self, text: Any, start_token: int, target: int) -> Tuple[int, int]:
+        """
+        (end_token, end_char) of a chunk that starts after start_token and
+        may run to target (< n_tokens): the last line break in between, else
+        target itself. Re-tokenizes only from the checkpoint before target.
+        """
+        checkpoint = target // CHECKPOINT_STRIDE
+        count = checkpoint * CHECKPOINT_STRIDE
+        prev_end = self.checkpoints[checkpoint]
+        last_break = None
+        if self.break_tokens[checkpoint] > start_token:
+            last_break = (self.break_tokens[checkpoint], self.break_ends[checkpoint])
+
+        newline = self._newline
+        for match in self.pattern.finditer(text, prev_end):
+            if match.group() == newline:
+                if count > start_token:
+                    last_break = (count, prev_end)
+                continue
+            if count == target:
+                break
+            count += 1
+            prev_end = match.end()
+
+        return last_break if last_break is not None else (target, prev_end)
+
+    def chunk_bounds(self, budget: int) -> List[Tuple[int, int, int]]:
+        """
+        Split the input into chunks of at most budget tokens.
+        Returns (start_char, end_char, n_tokens) per chunk.
+        """
+        if budget < 1:
+            raise ValueError("Token budget per chunk must be at least 1")
+
+        bounds = []
+        start_token = start_char = released = 0
+        text = self._open()
+        try:
+            while start_token < self.n_tokens:
+                target = start_token + budget
+                if target >= self.n_tokens:
+                    bounds.append((start_char, self.text_length, self.n_tokens - start_token))
+                    break
+                end_token, end_char = self._boundary(text, start_token, target)
+                bounds.append((start_char, end_char, end_token - start_token))
+                start_token, start_char = end_token, end_char
+                if self._release is not None and start_char - released >= INDEX_WINDOW:
+                    self._release(released, start_char)
+                    released = start_char
+        finally:
+            self._close(text)
+        return bounds
+
+
+class TokenChunker:
+    """
+    Token-aware chunking with a per-call reserve for prompt overhead.
+
+    Each sub-call gets context_limit - prompt_overhead_tokens tokens of
+    input, leaving room for the instructions wrapped around the chunk.
+    """
+
+    def __init__(self, prompt_overhead_tokens: int = 0, pattern: Optional[str] = None):
+        if prompt_overhead_tokens < 0:
+            raise ValueError("prompt_overhead_tokens cannot be negative")
+        self.prompt_overhead_tokens = prompt_overhead_tokens
+        source = pattern or DEFAULT_TOKEN_PATTERN
+        self._str_pattern = re.compile(source)
+        self._bytes_pattern = re.compile(source.encode())
+
+    def build_index(self, text: Any) -> TokenOffsetIndex:
+        """Tokenize text (str, bytes-like or MappedInput) once and return its offset index."""
+        pattern = self._str_pattern if isinstance(text, str) else self._bytes_pattern
+        return TokenOffsetIndex(text, pattern)
+
+    def budget(self, context_limit: int) -> int:
+        """Input tokens available per sub-call after the prompt reserve."""
+        budget = context_limit - self.prompt_overhead_tokens
+        if budget < 1:
+            raise ValueError(
+                f"Prompt overhead ({self.prompt_overhead_tokens} tokens) leaves no room in a "
+                f"{context_limit}-token context window"
+            )
+        return budget
+
+    def count_tokens(self, text: Any) -> int:
+        return self.build_index(text).n_tokens
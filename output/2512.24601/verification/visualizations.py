@@ -1,39 +1,130 @@
 """
 Visualization Script for RLM Verification
 Generates plots showing improvements, comparisons, and trade-offs
+
+Plots render in parallel on a process pool. Each plot is keyed by a hash
+of its data, its render parameters and its plotting code; a plot whose
+key matches plots/.render_manifest.json and whose PNG still exists is
+skipped. Per-plot render times are printed and kept in the manifest.
 """
 
 import sys
 import io
+import hashlib
+import os
+import time
+import traceback
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, Optional
+
+from instrumentation import Instrumentation
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-import numpy as np
 from pathlib import Path
 import json
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+DEFAULT_DPI = 300
+
+# Per-plot content hashes and render times, next to the PNGs
+MANIFEST_NAME = '.render_manifest.json'
+
+_PLOTTING_MODULES = None
 
-def create_improvement_magnitude_plot(output_dir: Path):
+
+def _plotting_modules():
+    """
+    Import matplotlib and NumPy on first use and apply the plot style.
+    Importing this module stays cheap for callers that never draw.
+    """
+    global _PLOTTING_MODULES
+    if _PLOTTING_MODULES is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        import numpy as np
+
+        # Set style
+        plt.style.use('seaborn-v0_8-darkgrid')
+        plt.rcParams['figure.figsize'] = (12, 8)
+        plt.rcParams['font.size'] = 10
+        _PLOTTING_MODULES = (plt, np)
+    return _PLOTTING_MODULES
+
+# ============================================================================
+# PLOT DATA
+# ============================================================================
+
+IMPROVEMENT_DATA = {
+    # OOLONG-Pairs (quadratic complexity)
+    "benchmarks_quad": ['OOLONG-Pairs\n(GPT-5)', 'OOLONG-Pairs\n(Qwen3-Coder)'],
+    "baseline_quad": [0.04, 0.06],
+    "rlm_quad": [58.00, 23.11],
+    "improvement_quad": [1350, 385],  # percentage improvements
+    # OOLONG (linear complexity)
+    "benchmarks_linear": ['OOLONG\n(GPT-5)', 'OOLONG\n(Qwen3-Coder)'],
+    "baseline_linear": [44.00, 36.00],
+    "rlm_linear": [56.50, 48.00],
+    "improvement_linear": [28.4, 33.3],
+}
+
+COMPLEXITY_DATA = {
+    "tasks": [
+        'BrowseComp-Plus\n(Multi-hop)\n6-11M tokens',
+        'OOLONG-Pairs\n(Quadratic)\n32K tokens',
+        'OOLONG\n(Linear)\n131K tokens'
+    ],
+    "gpt5_baseline": [0, 0.04, 44.00],  # 0% on BrowseComp due to context limit
+    "gpt5_rlm": [91.33, 58.00, 56.50],
+    "qwen_baseline": [None, 0.06, 36.00],  # No data for BrowseComp
+    "qwen_rlm": [None, 23.11, 48.00],
+}
+
+ABLATION_DATA = {
+    "benchmarks": ['OOLONG\n(Linear Complexity)', 'OOLONG-Pairs\n(Quadratic Complexity)'],
+    "full_rlm": [56.50, 58.00],
+    "no_subcalls": [36.00, 17.34],
+    "drops": [20.5, 40.66],
+}
+
+def _load_context_scaling_data() -> Dict[str, Any]:
+    """The measured sweep saved by context_sweep.py, or no runs if it has not been run."""
+    from context_sweep import DEFAULT_CONTEXT_WINDOW, load_dataset
+    return load_dataset() or {"context_window": DEFAULT_CONTEXT_WINDOW, "runs": [], "scaling_limit": None}
+
+
+COST_ACCURACY_DATA = {
+    # Data points: (label, cost, accuracy, kind)
+    # Note: E4 provides BrowseComp-Plus cost: $0.99 at 91.33% accuracy
+    "methods": [
+        ('Base GPT-5\nOOLONG', 1.5, 44.00, 'baseline'),  # Estimated cost
+        ('RLM GPT-5\nOOLONG', 1.5, 56.50, 'rlm'),  # Comparable cost (E12)
+        ('Base GPT-5\nOOLONG-Pairs', 0.5, 0.04, 'baseline'),  # Estimated cost
+        ('RLM GPT-5\nOOLONG-Pairs', 0.5, 58.00, 'rlm'),  # Comparable cost
+        ('RLM GPT-5\nBrowseComp-Plus', 0.99, 91.33, 'rlm'),  # From E4
+        ('Summary Agent\n(3× more expensive)', 3.0, 50, 'summary'),  # From E13
+    ],
+}
+
+# ============================================================================
+# PLOTS
+# ============================================================================
+
+def create_improvement_magnitude_plot(output_dir: Path, data: Dict[str, Any] = IMPROVEMENT_DATA,
+                                      dpi: int = DEFAULT_DPI):
     """
     Plot showing improvement magnitudes across benchmarks.
     """
+    plt, np = _plotting_modules()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
-    # Data for OOLONG-Pairs (quadratic complexity)
-    benchmarks_quad = ['OOLONG-Pairs\n(GPT-5)', 'OOLONG-Pairs\n(Qwen3-Coder)']
-    baseline_quad = [0.04, 0.06]
-    rlm_quad = [58.00, 23.11]
-    improvement_quad = [1350, 385]  # percentage improvements
+    benchmarks_quad = data["benchmarks_quad"]
+    baseline_quad = data["baseline_quad"]
+    rlm_quad = data["rlm_quad"]
+    improvement_quad = data["improvement_quad"]
 
     # Plot 1: OOLONG-Pairs (Quadratic Complexity)
     x_pos = np.arange(len(benchmarks_quad))
@@ -61,11 +152,10 @@ def create_improvement_magnitude_plot(output_dir: Path):
             ax1.text(bar.get_x() + bar.get_width()/2., height,
                     f'{height:.2f}', ha='center', va='bottom', fontsize=9)
 
-    # Data for OOLONG (linear complexity)
-    benchmarks_linear = ['OOLONG\n(GPT-5)', 'OOLONG\n(Qwen3-Coder)']
-    baseline_linear = [44.00, 36.00]
-    rlm_linear = [56.50, 48.00]
-    improvement_linear = [28.4, 33.3]
+    benchmarks_linear = data["benchmarks_linear"]
+    baseline_linear = data["baseline_linear"]
+    rlm_linear = data["rlm_linear"]
+    improvement_linear = data["improvement_linear"]
 
     # Plot 2: OOLONG (Linear Complexity)
     x_pos2 = np.arange(len(benchmarks_linear))
@@ -94,33 +184,31 @@ def create_improvement_magnitude_plot(output_dir: Path):
 
     plt.tight_layout()
     output_path = output_dir / 'improvement_magnitudes.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
     plt.close()
 
     print(f"  ✓ Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_complexity_comparison_plot(output_dir: Path):
+def create_complexity_comparison_plot(output_dir: Path, data: Dict[str, Any] = COMPLEXITY_DATA,
+                                      dpi: int = DEFAULT_DPI):
     """
     Plot comparing RLM performance across different task complexities.
     """
+    plt, np = _plotting_modules()
     fig, ax = plt.subplots(figsize=(14, 8))
 
     # Task complexities and their improvements
-    tasks = [
-        'BrowseComp-Plus\n(Multi-hop)\n6-11M tokens',
-        'OOLONG-Pairs\n(Quadratic)\n32K tokens',
-        'OOLONG\n(Linear)\n131K tokens'
-    ]
+    tasks = data["tasks"]
 
     # GPT-5 data
-    gpt5_baseline = [0, 0.04, 44.00]  # 0% on BrowseComp due to context limit
-    gpt5_rlm = [91.33, 58.00, 56.50]
+    gpt5_baseline = data["gpt5_baseline"]
+    gpt5_rlm = data["gpt5_rlm"]
 
     # Qwen3-Coder data
-    qwen_baseline = [None, 0.06, 36.00]  # No data for BrowseComp
-    qwen_rlm = [None, 23.11, 48.00]
+    qwen_baseline = data["qwen_baseline"]
+    qwen_rlm = data["qwen_rlm"]
 
     x = np.arange(len(tasks))
     width = 0.2
@@ -161,23 +249,25 @@ def create_complexity_comparison_plot(output_dir: Path):
 
     plt.tight_layout()
     output_path = output_dir / 'complexity_comparison.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
     plt.close()
 
     print(f"  ✓ Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_ablation_study_plot(output_dir: Path):
+def create_ablation_study_plot(output_dir: Path, data: Dict[str, Any] = ABLATION_DATA,
+                               dpi: int = DEFAULT_DPI):
     """
     Plot showing ablation study results - impact of removing sub-calls.
     """
+    plt, np = _plotting_modules()
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    benchmarks = ['OOLONG\n(Linear Complexity)', 'OOLONG-Pairs\n(Quadratic Complexity)']
-    full_rlm = [56.50, 58.00]
-    no_subcalls = [36.00, 17.34]
-    drops = [20.5, 40.66]
+    benchmarks = data["benchmarks"]
+    full_rlm = data["full_rlm"]
+    no_subcalls = data["no_subcalls"]
+    drops = data["drops"]
 
     x = np.arange(len(benchmarks))
     width = 0.35
@@ -220,86 +310,93 @@ def create_ablation_study_plot(output_dir: Path):
 
     plt.tight_layout()
     output_path = output_dir / 'ablation_study.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
     plt.close()
 
     print(f"  ✓ Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_context_scaling_plot(output_dir: Path):
+def create_context_scaling_plot(output_dir: Path, data: Optional[Dict[str, Any]] = None,
+                                dpi: int = DEFAULT_DPI):
     """
-    Plot demonstrating how RLM handles context scaling.
+    Plot the measured context scaling sweep (context_sweep.py): wall time
+    and sub-calls, then throughput and peak RSS, per multiplier. data is
+    read from context_scaling.json when not given.
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    # Simulated data showing how input size scales
-    context_window = 128  # 128K tokens (GPT-4 context)
-    multipliers = [1, 2, 5, 10, 25, 50, 100]
-    input_sizes = [context_window * m for m in multipliers]
-
-    # Baseline: can only handle 1x
-    baseline_capability = [100, 0, 0, 0, 0, 0, 0]
-
-    # RLM: can handle all with degradation
-    rlm_capability = [100, 95, 90, 85, 75, 65, 55]
-
-    ax.plot(multipliers, baseline_capability, 'o-', linewidth=3, markersize=10,
-           label='Baseline LLM', color='#ff6b6b', alpha=0.8)
-    ax.plot(multipliers, rlm_capability, 's-', linewidth=3, markersize=10,
-           label='RLM', color='#4ecdc4', alpha=0.8)
-
-    # Shade the region where baseline fails
-    ax.fill_between(multipliers, 0, 100, where=[m > 1 for m in multipliers],
-                    alpha=0.1, color='red', label='Baseline Failure Zone')
-
-    # Highlight 100x point
-    ax.axvline(x=100, color='green', linestyle='--', linewidth=2, alpha=0.5)
-    ax.text(100, 60, '100× capability\n(Paper claim E1)', ha='center', va='bottom',
-           fontsize=11, fontweight='bold', color='green',
-           bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.5))
-
-    ax.set_xlabel('Input Size (× Context Window)', fontsize=12)
-    ax.set_ylabel('Capability (%)', fontsize=12)
-    ax.set_title('Context Scaling: RLM vs Baseline', fontsize=14, fontweight='bold')
-    ax.set_xscale('log')
-    ax.set_xticks(multipliers)
-    ax.set_xticklabels([f'{m}×' for m in multipliers])
-    ax.legend(fontsize=11, loc='upper right')
-    ax.grid(True, alpha=0.3, which='both')
-    ax.set_ylim(0, 105)
-
-    # Add annotations
-    ax.annotate('Context limit\nexceeded',
-               xy=(2, 0), xytext=(3, 20),
-               arrowprops=dict(arrowstyle='->', color='red', lw=2),
-               fontsize=10, color='red', fontweight='bold')
+    if data is None:
+        data = _load_context_scaling_data()
+    plt, np = _plotting_modules()
+    fig, (ax_time, ax_rate) = plt.subplots(1, 2, figsize=(16, 7))
+
+    runs = [run for run in data["runs"] if run["status"] == "SUCCESS"]
+    if not runs:
+        for ax in (ax_time, ax_rate):
+            ax.text(0.5, 0.5, 'No measurements yet\n(run context_sweep.py)', ha='center', va='center',
+                    fontsize=14, transform=ax.transAxes)
+    else:
+        multipliers = [run["multiplier"] for run in runs]
+
+        ax_time.plot(multipliers, [run["wall_time_s"] for run in runs], 'o-', linewidth=3, markersize=8,
+                     label='Wall time', color='#4ecdc4')
+        ax_time.set_yscale('log')
+        ax_time.set_ylabel('Wall time (s)', fontsize=12)
+        ax_calls = ax_time.twinx()
+        ax_calls.plot(multipliers, [max(run["sub_calls"], 1) for run in runs], 's--', linewidth=2,
+                      markersize=7, label='Sub-calls', color='#95a5a6')
+        ax_calls.set_yscale('log')
+        ax_calls.set_ylabel('Sub-calls', fontsize=12)
+        ax_calls.grid(False)
+
+        ax_rate.plot(multipliers, [run["tokens_per_s"] / 1e6 for run in runs], 'o-', linewidth=3,
+                     markersize=8, label='Throughput', color='#45b7d1')
+        ax_rate.set_ylabel('Throughput (M tokens/s)', fontsize=12)
+        ax_rate.set_ylim(bottom=0)
+        ax_rss = ax_rate.twinx()
+        ax_rss.plot(multipliers, [run["peak_rss_kb"] / 1024 for run in runs], 's--', linewidth=2,
+                    markersize=7, label='Peak RSS', color='#f39c12')
+        ax_rss.set_ylabel('Peak RSS (MB)', fontsize=12)
+        ax_rss.set_ylim(bottom=0)
+        ax_rss.grid(False)
+
+        for ax, twin in ((ax_time, ax_calls), (ax_rate, ax_rss)):
+            # Beyond 1x the input no longer fits one base LLM call
+            ax.axvspan(1, multipliers[-1], alpha=0.06, color='red', label='Exceeds base LLM context')
+            ax.axvline(x=100, color='green', linestyle='--', linewidth=2, alpha=0.5, label='100× (claim E1)')
+            limit = data.get("scaling_limit") or {}
+            if limit.get("multiplier") is not None:
+                ax.axvline(x=limit["multiplier"], color='red', linewidth=2, alpha=0.7,
+                           label=f'Stops scaling ({limit["reason"]})')
+            ax.set_xscale('log')
+            ax.set_xlabel('Input Size (× Context Window)', fontsize=12)
+            ax.grid(True, alpha=0.3, which='both')
+            handles, labels = ax.get_legend_handles_labels()
+            twin_handles, twin_labels = twin.get_legend_handles_labels()
+            ax.legend(handles + twin_handles, labels + twin_labels, fontsize=10, loc='upper left')
+
+    ax_time.set_title('Cost of Decomposition', fontsize=13, fontweight='bold')
+    ax_rate.set_title('Throughput and Memory', fontsize=13, fontweight='bold')
+    fig.suptitle(f'Context Scaling: Measured ToyRLM Sweep ({data["context_window"]:,}-token window, '
+                 f'{data.get("machine", "unknown machine")})', fontsize=14, fontweight='bold')
 
     plt.tight_layout()
     output_path = output_dir / 'context_scaling.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
     plt.close()
 
     print(f"  ✓ Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_cost_vs_accuracy_plot(output_dir: Path):
+def create_cost_vs_accuracy_plot(output_dir: Path, data: Dict[str, Any] = COST_ACCURACY_DATA,
+                                 dpi: int = DEFAULT_DPI):
     """
     Plot showing cost vs accuracy trade-off.
     """
+    plt, np = _plotting_modules()
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    # Data points: (cost, accuracy, label)
-    # Note: E4 provides BrowseComp-Plus cost: $0.99 at 91.33% accuracy
-    methods = [
-        ('Base GPT-5\nOOLONG', 1.5, 44.00, 'baseline'),  # Estimated cost
-        ('RLM GPT-5\nOOLONG', 1.5, 56.50, 'rlm'),  # Comparable cost (E12)
-        ('Base GPT-5\nOOLONG-Pairs', 0.5, 0.04, 'baseline'),  # Estimated cost
-        ('RLM GPT-5\nOOLONG-Pairs', 0.5, 58.00, 'rlm'),  # Comparable cost
-        ('RLM GPT-5\nBrowseComp-Plus', 0.99, 91.33, 'rlm'),  # From E4
-        ('Summary Agent\n(3× more expensive)', 3.0, 50, 'summary'),  # From E13
-    ]
+    methods = data["methods"]
 
     # Separate by method type
     baseline_points = [(c, a, l) for l, c, a, t in methods if t == 'baseline']
@@ -343,44 +440,159 @@ def create_cost_vs_accuracy_plot(output_dir: Path):
 
     plt.tight_layout()
     output_path = output_dir / 'cost_vs_accuracy.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
     plt.close()
 
     print(f"  ✓ Saved: {output_path.name}")
     return str(output_path)
 
 
-def generate_all_visualizations(output_dir: Path) -> list:
-    """Generate all visualization plots."""
+# ============================================================================
+# CACHE-AWARE PARALLEL RENDERING
+# ============================================================================
 
-    print("Generating visualizations...")
+# name, output file, plotting function, data (or a function that loads it at render time)
+PLOTS = [
+    ("improvement", 'improvement_magnitudes.png', create_improvement_magnitude_plot, IMPROVEMENT_DATA),
+    ("complexity", 'complexity_comparison.png', create_complexity_comparison_plot, COMPLEXITY_DATA),
+    ("ablation", 'ablation_study.png', create_ablation_study_plot, ABLATION_DATA),
+    ("scaling", 'context_scaling.png', create_context_scaling_plot, _load_context_scaling_data),
+    ("cost", 'cost_vs_accuracy.png', create_cost_vs_accuracy_plot, COST_ACCURACY_DATA),
+]
 
-    plots = []
 
-    try:
-        plots.append(create_improvement_magnitude_plot(output_dir))
-    except Exception as e:
-        print(f"  ✗ Error creating improvement plot: {e}")
+def plot_key(fn: Callable, data: Dict[str, Any], dpi: int) -> str:
+    """Hash of a plot's data, render parameters and plotting code."""
+    import inspect
 
-    try:
-        plots.append(create_complexity_comparison_plot(output_dir))
-    except Exception as e:
-        print(f"  ✗ Error creating complexity plot: {e}")
+    digest = hashlib.sha256()
+    digest.update(json.dumps(data, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(f"dpi={dpi}".encode('utf-8'))
+    digest.update(inspect.getsource(fn).encode('utf-8'))
+    return digest.hexdigest()
 
-    try:
-        plots.append(create_ablation_study_plot(output_dir))
-    except Exception as e:
-        print(f"  ✗ Error creating ablation plot: {e}")
 
+def _load_manifest(output_dir: Path) -> Dict[str, Any]:
     try:
-        plots.append(create_context_scaling_plot(output_dir))
-    except Exception as e:
-        print(f"  ✗ Error creating scaling plot: {e}")
+        with open(output_dir / MANIFEST_NAME, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(output_dir: Path, manifest: Dict[str, Any]) -> None:
+    tmp_path = output_dir / (MANIFEST_NAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, output_dir / MANIFEST_NAME)
+
+
+def _render_plot(name: str, fn: Callable, output_dir: Path, data: Dict[str, Any], dpi: int,
+                 trace_memory: bool = False) -> Dict[str, Any]:
+    """Worker: render one plot, capturing its console output, timing and memory."""
+    instruments = Instrumentation(memory=trace_memory)
+    captured = io.StringIO()
+    with instruments.span(f"plot/{name}", "plot", rss=True):
+        try:
+            with redirect_stdout(captured):
+                path = fn(output_dir, data=data, dpi=dpi)
+            error = None
+        except Exception as e:
+            path = None
+            error = f"{e}\n{traceback.format_exc()}"
+    stats = instruments.spans[f"plot/{name}"]
+    return {
+        "path": path,
+        "error": error,
+        "render_s": round(stats["wall_s"], 3),
+        "cpu_s": round(stats["cpu_s"], 3),
+        "output": captured.getvalue(),
+        "timings": instruments.export(),
+    }
+
+
+def render_plots(output_dir: Path, dpi: int = DEFAULT_DPI, force: bool = False,
+                 max_workers: Optional[int] = None,
+                 instruments: Optional[Instrumentation] = None) -> List[Dict[str, Any]]:
+    """
+    Render every plot whose key changed (or whose PNG is missing) on a
+    process pool. Returns one report per plot, in PLOTS order, with
+    status "rendered", "skipped" or "error" and render_s. Rendered plots'
+    spans are merged into instruments when given (tracemalloc peaks too
+    if instruments.memory is set).
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(output_dir)
+
+    reports = []
+    stale = []
+    for name, filename, fn, data in PLOTS:
+        if callable(data):
+            data = data()
+        key = plot_key(fn, data, dpi)
+        entry = manifest.get(filename, {})
+        report = {"name": name, "path": str(output_dir / filename), "key": key}
+        if not force and entry.get("key") == key and (output_dir / filename).exists():
+            report.update(status="skipped", render_s=0.0, last_render_s=entry.get("render_s"))
+        else:
+            stale.append((report, fn, data))
+        reports.append(report)
+
+    if stale:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(stale), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            trace_memory = instruments is not None and instruments.memory
+            futures = [(report, pool.submit(_render_plot, report["name"], fn, output_dir, data, dpi, trace_memory))
+                       for report, fn, data in stale]
+            for report, future in futures:
+                outcome = future.result()
+                report["render_s"] = outcome["render_s"]
+                report["cpu_s"] = outcome["cpu_s"]
+                report["output"] = outcome["output"]
+                if instruments is not None:
+                    instruments.merge(outcome["timings"])
+                if outcome["error"] is None:
+                    report["status"] = "rendered"
+                    manifest[Path(report["path"]).name] = {"key": report["key"], "render_s": outcome["render_s"]}
+                else:
+                    report["status"] = "error"
+                    report["error"] = outcome["error"]
+
+        _save_manifest(output_dir, manifest)
+
+    return reports
+
+
+def generate_all_visualizations(output_dir: Path, dpi: int = DEFAULT_DPI, force: bool = False,
+                                max_workers: Optional[int] = None,
+                                instruments: Optional[Instrumentation] = None) -> list:
+    """Generate all visualization plots, skipping unchanged ones."""
 
-    try:
-        plots.append(create_cost_vs_accuracy_plot(output_dir))
-    except Exception as e:
-        print(f"  ✗ Error creating cost plot: {e}")
+    print("Generating visualizations...")
+
+    start = time.perf_counter()
+    reports = render_plots(output_dir, dpi=dpi, force=force, max_workers=max_workers, instruments=instruments)
+
+    plots = []
+    for report in reports:
+        filename = Path(report["path"]).name
+        if report["status"] == "skipped":
+            print(f"  ↺ Unchanged: {filename}")
+            plots.append(report["path"])
+        elif report["status"] == "rendered":
+            print(report["output"], end="")
+            print(f"    rendered in {report['render_s']:.2f}s ({report['cpu_s']:.2f}s CPU)")
+            plots.append(report["path"])
+        else:
+            print(f"  ✗ Error creating {report['name']} plot: {report['error'].splitlines()[0]}")
+
+    counts = {status: sum(1 for report in reports if report["status"] == status)
+              for status in ("rendered", "skipped", "error")}
+    print(f"  {counts['rendered']} rendered, {counts['skipped']} unchanged, {counts['error']} failed "
+          f"in {time.perf_counter() - start:.2f}s")
 
     return plots
 
@@ -394,7 +606,7 @@ if __name__ == "__main__":
     print("=" * 80)
     print()
 
-    plots = generate_all_visualizations(output_dir)
+    plots = generate_all_visualizations(output_dir, force='--force' in sys.argv[1:])
 
     print()
     print(f"Generated {len(plots)} visualizations in: {output_dir}")